@@ -0,0 +1,506 @@
+"""
+Asyncio LCU client with the same surface as Rengar.
+
+Automations written as coroutines can share one event loop instead of one
+OS thread each. BlockingRengar wraps it for synchronous callers.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, perf_counter
+
+import aiohttp
+
+from Rengar import (
+    CONNECT_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    HTTP_METHODS,
+    BatchResult,
+    CircuitBreaker,
+    DeadlineExceeded,
+    LCUUnavailableError,
+    RetryPolicy,
+    default_timeout,
+    discover_credentials,
+    return_lcu_headers,
+    return_lcu_url,
+    return_riot_headers,
+    return_riot_url,
+)
+from RengarEvents import JSON_API_EVENT, WAMP_EVENT, WAMP_SUBSCRIBE, EventIterator, Subscription
+from RengarMetrics import RequestMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResponse:
+    """Buffered response exposing the parts of requests.Response callers use."""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncSubscription:
+    def __init__(self, client, prefix, callback):
+        self.client = client
+        self.prefix = prefix
+        self.callback = callback
+
+    def matches(self, uri):
+        return uri.startswith(self.prefix)
+
+    def unsubscribe(self):
+        self.client.unsubscribe(self)
+
+
+class AsyncEventIterator(AsyncSubscription):
+    """Async iterator over matching events; use with `async for`."""
+
+    def __init__(self, client, prefix, maxsize=0):
+        self._queue = asyncio.Queue(maxsize)
+        self._closed = False
+        super().__init__(client, prefix, self._put)
+
+    def _put(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning(f"Dropping event for {event.get('uri')}: consumer too slow")
+
+    def close(self):
+        self._closed = True
+        self.unsubscribe()
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # Nothing is awaiting a full queue; __anext__ checks _closed first
+            pass
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._closed:
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+class AsyncRengar:
+    """
+    Asyncio counterpart of Rengar.
+
+    Use `await AsyncRengar.create()` (or construct and `await
+    update_credentials()`) from inside a running event loop.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, retry_policy=None,
+                 failure_threshold=2, reset_timeout=3.0, metrics=True):
+        self.pool_size = pool_size
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.league_breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.riot_breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.metrics = RequestMetrics() if metrics else None
+        self.leaguePort = self.leagueToken = None
+        self.riotPort = self.riotToken = None
+        self.leagueUrl = self.riotUrl = None
+        self.leagueHeaders = self.riotHeaders = None
+        self._sessions = {}
+        self._subscriptions = []
+        self._event_task = None
+        self._connected = asyncio.Event()
+
+    @classmethod
+    async def create(cls, **kwargs):
+        client = cls(**kwargs)
+        await client.update_credentials()
+        return client
+
+    # Credentials
+    async def update_credentials(self, refresh=False):
+        """Refresh LCU and Riot credentials from a single discovery pass."""
+        # Lockfile reads and process scans are blocking; keep them off the loop
+        creds = await asyncio.to_thread(discover_credentials, refresh)
+        if creds is None:
+            await self.set_league_credentials(None, None)
+            await self.set_riot_credentials(None, None)
+        else:
+            await self.set_league_credentials(creds.league_port, creds.league_token)
+            await self.set_riot_credentials(creds.riot_port, creds.riot_token)
+
+    async def update_league_credentials(self):
+        await self.update_credentials()
+
+    async def update_riot_credentials(self):
+        await self.update_credentials()
+
+    async def set_league_credentials(self, port, token):
+        if 'league' in self._sessions and (port, token) == (self.leaguePort, self.leagueToken):
+            return
+        self.leaguePort, self.leagueToken = port, token
+        self.leagueUrl = return_lcu_url(port)
+        self.leagueHeaders = return_lcu_headers(token)
+        await self._replace_session('league', self.leagueHeaders)
+
+    async def set_riot_credentials(self, port, token):
+        if 'riot' in self._sessions and (port, token) == (self.riotPort, self.riotToken):
+            return
+        self.riotPort, self.riotToken = port, token
+        self.riotUrl = return_riot_url(port)
+        self.riotHeaders = return_riot_headers(token)
+        await self._replace_session('riot', self.riotHeaders)
+
+    async def _replace_session(self, target, headers):
+        old = self._sessions.pop(target, None)
+        if old is not None:
+            await old.close()
+        connector = aiohttp.TCPConnector(limit=self.pool_size, ssl=False)
+        self._sessions[target] = aiohttp.ClientSession(connector=connector, headers=headers)
+
+    def return_lcu_creds(self):
+        return self.leaguePort, self.leagueToken, self.leagueUrl
+
+    def return_riot_creds(self):
+        return self.riotPort, self.riotToken, self.riotUrl
+
+    def status(self):
+        return {
+            'league': dict(self.league_breaker.status(), port=self.leaguePort),
+            'riot': dict(self.riot_breaker.status(), port=self.riotPort),
+            'retry_policy': self.retry_policy.as_dict(),
+            'events_connected': self._connected.is_set(),
+            'metrics_enabled': self.metrics is not None,
+        }
+
+    # Requests
+    async def _request(self, target, method, endpoint, body, timeout=None, deadline=None):
+        metrics = self.metrics
+        if metrics is None:
+            return await self._request_with_retries(target, method, endpoint, body, timeout, deadline)
+        started = perf_counter()
+        try:
+            response = await self._request_with_retries(target, method, endpoint, body, timeout, deadline)
+        except Exception as e:
+            metrics.record(target, method, endpoint, perf_counter() - started, error=e)
+            raise
+        metrics.record(target, method, endpoint, perf_counter() - started, status=response.status_code)
+        return response
+
+    async def _request_with_retries(self, target, method, endpoint, body, timeout=None, deadline=None):
+        method = method.upper()
+        if method not in HTTP_METHODS:
+            raise ValueError('Invalid method')
+        if body == "":
+            body = None
+        elif body is not None:
+            body = json.dumps(body)
+
+        breaker = self.league_breaker if target == 'league' else self.riot_breaker
+        if not breaker.allow():
+            raise LCUUnavailableError(f'{target} client unavailable, retrying in {breaker.retry_in():.1f}s')
+
+        if timeout is None:
+            timeout = default_timeout(method, endpoint)
+
+        last_error = None
+        attempts = self.retry_policy.max_attempts
+        for attempt in range(attempts):
+            attempt_timeout = timeout
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceeded(f'Deadline exceeded for {method} {endpoint}') from last_error
+                attempt_timeout = min(timeout, remaining)
+            if attempt and self.metrics is not None:
+                self.metrics.record_retry(target, method, endpoint)
+
+            port = self.leaguePort if target == 'league' else self.riotPort
+            base_url = self.leagueUrl if target == 'league' else self.riotUrl
+            session = self._sessions.get(target)
+            try:
+                if port is None or session is None:
+                    raise ConnectionError(f'{target} client credentials not found')
+                client_timeout = aiohttp.ClientTimeout(
+                    total=attempt_timeout, sock_connect=min(CONNECT_TIMEOUT, attempt_timeout)
+                )
+                async with session.request(method, f'{base_url}{endpoint}', data=body, timeout=client_timeout) as resp:
+                    content = await resp.read()
+                    response = AsyncResponse(resp.status, resp.headers, content)
+                breaker.record_success()
+                return response
+            except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as e:
+                last_error = e
+
+            if attempt + 1 < attempts:
+                backoff = self.retry_policy.delay(attempt)
+                if deadline is not None and monotonic() + backoff >= deadline:
+                    raise DeadlineExceeded(f'Deadline exceeded for {method} {endpoint}') from last_error
+                await asyncio.sleep(backoff)
+                await self.update_credentials(refresh=True)
+
+        if deadline is not None and monotonic() >= deadline and isinstance(last_error, asyncio.TimeoutError):
+            raise DeadlineExceeded(f'Deadline exceeded for {method} {endpoint}') from last_error
+
+        breaker.record_failure()
+        raise LCUUnavailableError(f'{target} client unreachable after {attempts} attempt(s): {last_error}') from last_error
+
+    async def lcu_request(self, method, endpoint, body: dict, timeout=None, deadline=None):
+        return await self._request('league', method, endpoint, body, timeout, deadline)
+
+    async def riot_request(self, method, endpoint, body: dict, timeout=None, deadline=None):
+        return await self._request('riot', method, endpoint, body, timeout, deadline)
+
+    async def lcu_batch(self, requests_list, max_parallel=None, timeout=None, deadline=None):
+        """Concurrent LCU requests; same contract as Rengar.lcu_batch."""
+        limit = asyncio.Semaphore(min(max_parallel or self.pool_size, self.pool_size))
+
+        async def run(item):
+            method, endpoint, body = tuple(item) + ("",) * (3 - len(item))
+            async with limit:
+                try:
+                    return BatchResult(await self.lcu_request(method, endpoint, body, timeout, deadline))
+                except Exception as e:
+                    return BatchResult(error=e)
+
+        return list(await asyncio.gather(*(run(item) for item in requests_list)))
+
+    # Events
+    def subscribe(self, uri_prefix, callback):
+        """Call callback(event) (plain function or coroutine function) for matching events."""
+        subscription = AsyncSubscription(self, uri_prefix, callback)
+        self._add_subscription(subscription)
+        return subscription
+
+    def events(self, uri_prefix, maxsize=0):
+        """Async iterator over events whose uri starts with uri_prefix."""
+        iterator = AsyncEventIterator(self, uri_prefix, maxsize)
+        self._add_subscription(iterator)
+        return iterator
+
+    def unsubscribe(self, subscription):
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def _add_subscription(self, subscription):
+        self._subscriptions.append(subscription)
+        if self._event_task is None or self._event_task.done():
+            self._event_task = asyncio.get_running_loop().create_task(self._run_events())
+
+    async def wait_connected(self, timeout=None):
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _run_events(self, reconnect_delay=0.5, max_reconnect_delay=5.0):
+        delay = reconnect_delay
+        while True:
+            try:
+                session = self._sessions.get('league')
+                if self.leaguePort is None or session is None:
+                    raise ConnectionError('League client credentials not available')
+                async with session.ws_connect(f'wss://127.0.0.1:{self.leaguePort}/', protocols=('wamp',)) as ws:
+                    await ws.send_str(json.dumps([WAMP_SUBSCRIBE, JSON_API_EVENT]))
+                    self._connected.set()
+                    delay = reconnect_delay
+                    logger.info("🔌 LCU event stream connected")
+                    async for message in ws:
+                        if message.type != aiohttp.WSMsgType.TEXT:
+                            continue
+                        try:
+                            payload = json.loads(message.data)
+                        except ValueError:
+                            continue
+                        if (isinstance(payload, list) and len(payload) >= 3 and
+                                payload[0] == WAMP_EVENT and isinstance(payload[2], dict)):
+                            await self._dispatch(payload[2])
+            except asyncio.CancelledError:
+                self._connected.clear()
+                raise
+            except Exception as e:
+                logger.debug(f"LCU event stream error: {e}")
+            self._connected.clear()
+
+            await asyncio.sleep(delay * (0.5 + random.random() / 2))
+            delay = min(delay * 2, max_reconnect_delay)
+            try:
+                await self.update_credentials()
+            except Exception as e:
+                logger.debug(f"Credential refresh failed: {e}")
+
+    async def _dispatch(self, event):
+        uri = event.get('uri', '')
+        for subscription in [s for s in self._subscriptions if s.matches(uri)]:
+            try:
+                result = subscription.callback(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"❌ Event callback for {subscription.prefix} failed: {e}")
+
+    async def close(self):
+        if self._event_task is not None:
+            self._event_task.cancel()
+            try:
+                await self._event_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._event_task = None
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+
+
+class BlockingEventStream:
+    """
+    EventStream-like view of an AsyncRengar's subscriptions for BlockingRengar.
+
+    Plain callbacks run in order on one worker thread rather than on the
+    loop, so they can make blocking requests through the shim.
+    """
+
+    def __init__(self, shim):
+        self.shim = shim
+        self._registered = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AsyncRengarEvents")
+
+    @property
+    def connected(self):
+        return self.shim.client._connected.is_set()
+
+    def wait_connected(self, timeout=None):
+        return self.shim._call(self.shim.client.wait_connected(timeout))
+
+    def subscribe(self, prefix, callback):
+        subscription = Subscription(self, prefix, callback)
+        self._add(subscription)
+        return subscription
+
+    def events(self, prefix, maxsize=0):
+        iterator = EventIterator(self, prefix, maxsize)
+        self._add(iterator)
+        return iterator
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            registered = self._registered.pop(subscription, None)
+        if registered is not None:
+            self.shim._loop.call_soon_threadsafe(self.shim.client.unsubscribe, registered)
+
+    def _add(self, subscription):
+        callback = subscription.callback
+        if not inspect.iscoroutinefunction(callback):
+            callback = self._offload(subscription)
+
+        async def add():
+            return self.shim.client.subscribe(subscription.prefix, callback)
+        registered = self.shim._call(add())
+        with self._lock:
+            self._registered[subscription] = registered
+
+    def _offload(self, subscription):
+        def run(event):
+            try:
+                subscription.callback(event)
+            except Exception as e:
+                logger.error(f"❌ Event callback for {subscription.prefix} failed: {e}")
+
+        def submit(event):
+            self._executor.submit(run, event)
+        return submit
+
+    def stop(self):
+        self._executor.shutdown(wait=False)
+
+
+class BlockingRengar:
+    """
+    Synchronous shim over AsyncRengar for existing callers.
+
+    Runs the async client on a private event loop thread; request methods
+    block and return responses with status_code / json() / text, like
+    Rengar. Plain subscription callbacks run on a worker thread (see
+    BlockingEventStream); coroutine callbacks run on the loop. priority is
+    accepted for compatibility and ignored.
+
+    Covers requests, batches, events, status and metrics. Response caching
+    (enable_cache), rate limits and traffic recording (start_recording)
+    are Rengar-only and not provided; check for them with hasattr.
+    """
+
+    def __init__(self, **kwargs):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True, name="AsyncRengarLoop")
+        self._thread.start()
+        self.client = self._call(AsyncRengar.create(**kwargs))
+        self.event_stream = BlockingEventStream(self)
+
+    def _call(self, coro):
+        if threading.current_thread() is self._thread:
+            coro.close()
+            # Blocking on our own loop would hang it for good
+            raise RuntimeError('BlockingRengar called from its event loop thread; await the AsyncRengar client instead')
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def update_credentials(self, refresh=False):
+        return self._call(self.client.update_credentials(refresh))
+
+    def update_league_credentials(self):
+        return self._call(self.client.update_league_credentials())
+
+    def update_riot_credentials(self):
+        return self._call(self.client.update_riot_credentials())
+
+    def return_lcu_creds(self):
+        return self.client.return_lcu_creds()
+
+    def return_riot_creds(self):
+        return self.client.return_riot_creds()
+
+    def status(self):
+        return self.client.status()
+
+    @property
+    def metrics(self):
+        return self.client.metrics
+
+    def lcu_request(self, method, endpoint, body: dict, timeout=None, deadline=None, priority=None):
+        return self._call(self.client.lcu_request(method, endpoint, body, timeout, deadline))
+
+    def riot_request(self, method, endpoint, body: dict, timeout=None, deadline=None, priority=None):
+        return self._call(self.client.riot_request(method, endpoint, body, timeout, deadline))
+
+    def lcu_batch(self, requests_list, max_parallel=None, timeout=None, deadline=None, priority=None):
+        return self._call(self.client.lcu_batch(requests_list, max_parallel, timeout, deadline))
+
+    def subscribe(self, uri_prefix, callback):
+        """Call callback(event) for matching events; see BlockingEventStream."""
+        return self.event_stream.subscribe(uri_prefix, callback)
+
+    def events(self, uri_prefix, maxsize=0):
+        """Blocking iterator over events whose uri starts with uri_prefix."""
+        return self.event_stream.events(uri_prefix, maxsize)
+
+    def close(self):
+        self.event_stream.stop()
+        self._call(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2)
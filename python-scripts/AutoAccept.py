@@ -1,11 +1,14 @@
 import threading
 import time
-from Rengar import Rengar
+import requests
+from Rengar import DeadlineExceeded, LCUUnavailableError, get_client
 
 class autoaccept:
-    def __init__(self):
+    def __init__(self, rengar=None):
         self.auto_accept_enabled = False
-        self.rengar = Rengar()
+        self.rengar = rengar if rengar is not None else get_client()
+        self.monitor_thread = None
+        self.is_running = False
 
     def toggle_auto_accept(self):
         self.auto_accept_enabled = not self.auto_accept_enabled
@@ -15,19 +18,34 @@ class autoaccept:
     def accept_match(self):
         response = self.rengar.lcu_request("POST", f"/lol-matchmaking/v1/ready-check/accept", "")
 
+    def start_monitor(self):
+        if self.monitor_thread is None or not self.monitor_thread.is_alive():
+            self.is_running = True
+            self.monitor_thread = threading.Thread(target=self.monitor_queue, daemon=True, name="AutoAcceptMonitor")
+            self.monitor_thread.start()
+
+    def stop(self):
+        self.is_running = False
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            self.monitor_thread.join(timeout=2)
+
     def monitor_queue(self):
-        while True:
+        while self.is_running:
             if self.auto_accept_enabled:
                 # Faz a requisição para verificar o estado da busca por partida
-                response = self.rengar.lcu_request("GET", "/lol-lobby/v2/lobby/matchmaking/search-state", "")
-                
-                if response.status_code == 200:
-                    match_data = response.json()
-                    #print(match_data)
-                    # Exibe o conteúdo da resposta para verificar o estado do matchmaking
-                    #print("Matchmaking Data:", match_data)
-
-                    if match_data.get("searchState") == "Found":
-                        self.accept_match()  # Não há um ID de partida, basta aceitar
+                try:
+                    response = self.rengar.lcu_request("GET", "/lol-lobby/v2/lobby/matchmaking/search-state", "")
+
+                    if response.status_code == 200:
+                        match_data = response.json()
+                        #print(match_data)
+                        # Exibe o conteúdo da resposta para verificar o estado do matchmaking
+                        #print("Matchmaking Data:", match_data)
+
+                        if match_data.get("searchState") == "Found":
+                            self.accept_match()  # Não há um ID de partida, basta aceitar
+                except (LCUUnavailableError, DeadlineExceeded, requests.exceptions.RequestException, ValueError):
+                    # Cliente fechado ou resposta inválida: o circuito do Rengar falha rápido, basta tentar de novo
+                    pass
             
-            time.sleep(0.5)
\ No newline at end of file
+            time.sleep(0.5)
@@ -1,9 +1,7 @@
 import requests
-from Rengar import Rengar
+from Rengar import get_client
 from termcolor import colored
 
-rengar = Rengar()
-
 
 class Champ:
     def __init__(self, name="", key=0):
@@ -91,8 +89,9 @@ def search_skins_by_name(champions, search_query):
     return found_skins
 
 
-def change_profile_background(skin_id):
+def change_profile_background(skin_id, rengar=None):
     """Change profile background to specified skin ID"""
+    rengar = rengar or get_client()
     body = {
         "key": "backgroundSkinId",
         "value": int(skin_id)
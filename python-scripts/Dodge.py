@@ -1,10 +1,9 @@
-from Rengar import Rengar
+from Rengar import get_client
 
-rengar = Rengar()
 
-
-def dodge():
+def dodge(rengar=None):
     """Dodge the current champion select game"""
+    rengar = rengar or get_client()
     try:
         response = rengar.lcu_request(
             "POST",
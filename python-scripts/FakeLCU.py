@@ -0,0 +1,863 @@
+"""
+Local stand-in for the League client: the LCU REST API over HTTPS and its
+WAMP event stream, driven by a scripted scenario.
+
+    python FakeLCU.py [--speed 10] [--seed 1] [--local-cell 2] [--dir DIR]
+
+writes League and Riot Client lockfiles and serves until interrupted.
+Point the scripts at it with LTK_LEAGUE_LOCKFILE / LTK_RIOT_LOCKFILE, or
+in-process with FakeLCU.install(), instead of the process scan.
+"""
+
+import argparse
+import base64
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import random
+import re
+import secrets
+import ssl
+import struct
+import subprocess
+import tempfile
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic, time
+
+logger = logging.getLogger(__name__)
+
+SESSION_URI = '/lol-champ-select/v1/session'
+GAMEFLOW_URI = '/lol-gameflow/v1/gameflow-phase'
+SEARCH_STATE_URI = '/lol-lobby/v2/lobby/matchmaking/search-state'
+READY_CHECK_URI = '/lol-matchmaking/v1/ready-check'
+CURRENT_SUMMONER_URI = '/lol-summoner/v1/current-summoner'
+GAME_VERSION = '14.20.625.1234'
+SUMMONER_BASE_ID = 100000
+
+WAMP_EVENT = 8
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+WS_TEXT, WS_CLOSE, WS_PING, WS_PONG = 0x1, 0x8, 0x9, 0xA
+
+# (id, name) for the champion grid, inventory and skin game-data
+CHAMPIONS = [
+    (1, 'Annie'), (2, 'Olaf'), (3, 'Galio'), (4, 'Twisted Fate'), (5, 'Xin Zhao'),
+    (6, 'Urgot'), (7, 'LeBlanc'), (8, 'Vladimir'), (9, 'Fiddlesticks'), (10, 'Kayle'),
+    (11, 'Master Yi'), (12, 'Alistar'), (13, 'Ryze'), (14, 'Sion'), (15, 'Sivir'),
+    (16, 'Soraka'), (17, 'Teemo'), (18, 'Tristana'), (19, 'Warwick'), (20, 'Nunu & Willump'),
+    (21, 'Miss Fortune'), (22, 'Ashe'), (23, 'Tryndamere'), (24, 'Jax'), (25, 'Morgana'),
+    (26, 'Zilean'), (27, 'Singed'), (28, 'Evelynn'), (29, 'Twitch'), (30, 'Karthus'),
+    (31, "Cho'Gath"), (32, 'Amumu'), (33, 'Rammus'), (34, 'Anivia'), (35, 'Shaco'),
+    (36, 'Dr. Mundo'), (37, 'Sona'), (38, 'Kassadin'), (39, 'Irelia'), (40, 'Janna'),
+    (41, 'Gangplank'), (42, 'Corki'), (43, 'Karma'), (44, 'Taric'), (45, 'Veigar'),
+    (48, 'Trundle'), (50, 'Swain'), (51, 'Caitlyn'), (53, 'Blitzcrank'), (54, 'Malphite'),
+    (55, 'Katarina'), (56, 'Nocturne'), (57, 'Maokai'), (58, 'Renekton'), (59, 'Jarvan IV'),
+    (60, 'Elise'), (61, 'Orianna'), (62, 'Wukong'), (63, 'Brand'), (64, 'Lee Sin'),
+    (67, 'Vayne'), (68, 'Rumble'), (69, 'Cassiopeia'), (72, 'Skarner'), (74, 'Heimerdinger'),
+    (75, 'Nasus'), (76, 'Nidalee'), (77, 'Udyr'), (78, 'Poppy'), (79, 'Gragas'),
+    (80, 'Pantheon'), (81, 'Ezreal'), (82, 'Mordekaiser'), (83, 'Yorick'), (84, 'Akali'),
+    (85, 'Kennen'), (86, 'Garen'), (89, 'Leona'), (90, 'Malzahar'), (91, 'Talon'),
+    (92, 'Riven'), (96, "Kog'Maw"), (98, 'Shen'), (99, 'Lux'), (101, 'Xerath'),
+    (102, 'Shyvana'), (103, 'Ahri'), (104, 'Graves'), (105, 'Fizz'), (106, 'Volibear'),
+    (107, 'Rengar'), (110, 'Varus'), (111, 'Nautilus'), (112, 'Viktor'), (113, 'Sejuani'),
+    (114, 'Fiora'), (115, 'Ziggs'), (117, 'Lulu'), (119, 'Draven'), (120, 'Hecarim'),
+    (121, "Kha'Zix"), (122, 'Darius'), (126, 'Jayce'), (127, 'Lissandra'), (131, 'Diana'),
+    (133, 'Quinn'), (134, 'Syndra'), (136, 'Aurelion Sol'), (141, 'Kayn'), (142, 'Zoe'),
+    (143, 'Zyra'), (145, "Kai'Sa"), (147, 'Seraphine'), (150, 'Gnar'), (154, 'Zac'),
+    (157, 'Yasuo'), (161, "Vel'Koz"), (163, 'Taliyah'), (164, 'Camille'), (166, 'Akshan'),
+    (200, "Bel'Veth"), (201, 'Braum'), (202, 'Jhin'), (203, 'Kindred'), (221, 'Zeri'),
+    (222, 'Jinx'), (223, 'Tahm Kench'), (233, 'Briar'), (234, 'Viego'), (235, 'Senna'),
+    (236, 'Lucian'), (238, 'Zed'), (240, 'Kled'), (245, 'Ekko'), (246, 'Qiyana'),
+    (254, 'Vi'), (266, 'Aatrox'), (267, 'Nami'), (268, 'Azir'), (350, 'Yuumi'),
+    (360, 'Samira'), (412, 'Thresh'), (420, 'Illaoi'), (421, "Rek'Sai"), (427, 'Ivern'),
+    (429, 'Kalista'), (432, 'Bard'), (497, 'Rakan'), (498, 'Xayah'), (516, 'Ornn'),
+    (517, 'Sylas'), (518, 'Neeko'), (523, 'Aphelios'), (526, 'Rell'), (555, 'Pyke'),
+    (711, 'Vex'), (777, 'Yone'), (799, 'Ambessa'), (800, 'Mel'), (875, 'Sett'),
+    (876, 'Lillia'), (887, 'Gwen'), (888, 'Renata Glasc'), (893, 'Aurora'), (895, 'Nilah'),
+    (897, "K'Sante"), (901, 'Smolder'), (902, 'Milio'), (910, 'Hwei'), (950, 'Naafiri'),
+]
+ALIAS_OVERRIDES = {20: 'Nunu', 62: 'MonkeyKing', 888: 'Renata'}
+
+
+def champion_alias(champ_id, name):
+    return ALIAS_OVERRIDES.get(champ_id) or re.sub(r'[^A-Za-z0-9]', '', name)
+
+
+def make_self_signed_cert(directory):
+    """Generate a throwaway self-signed certificate for 127.0.0.1."""
+    cert = os.path.join(directory, 'cert.pem')
+    key = os.path.join(directory, 'key.pem')
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-subj', '/CN=127.0.0.1', '-keyout', key, '-out', cert],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return cert, key
+
+
+def rpc_error(status, message):
+    return status, {'errorCode': 'RPC_ERROR', 'httpStatus': status, 'implementationDetails': {}, 'message': message}
+
+
+# WebSocket framing (RFC 6455), just enough for the LCU's WAMP stream
+def _encode_frame(opcode, payload):
+    header = bytes([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header += bytes([length])
+    elif length < 1 << 16:
+        header += bytes([126]) + struct.pack('!H', length)
+    else:
+        header += bytes([127]) + struct.pack('!Q', length)
+    return header + payload
+
+
+def _read_exact(rfile, size):
+    data = rfile.read(size)
+    if len(data) < size:
+        raise ConnectionError('WebSocket closed')
+    return data
+
+
+def _read_frame(rfile):
+    first, second = _read_exact(rfile, 2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack('!H', _read_exact(rfile, 2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', _read_exact(rfile, 8))[0]
+    mask = _read_exact(rfile, 4) if second & 0x80 else None
+    payload = _read_exact(rfile, length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+class _WebSocketClient:
+    def __init__(self, handler):
+        self.handler = handler
+        self.subscribed = False
+        self._lock = threading.Lock()
+
+    def send(self, opcode, payload):
+        with self._lock:
+            self.handler.wfile.write(_encode_frame(opcode, payload))
+
+    def close(self):
+        try:
+            self.send(WS_CLOSE, b'')
+            self.handler.connection.close()
+        except OSError:
+            pass
+
+
+class FakeLCUHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+        fake = self.server.fake
+        if not fake.authorized(self.headers.get('Authorization')):
+            return self._send_json(*rpc_error(401, 'Unauthorized'))
+        if self.command == 'GET' and self.headers.get('Upgrade', '').lower() == 'websocket':
+            return fake.serve_websocket(self)
+
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            return self._send_json(*rpc_error(400, 'Invalid JSON body'))
+        self._send_json(*fake.handle(self.command, self.path, body))
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+    def _send_json(self, status, payload=None):
+        data = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FakeLCU:
+    """
+    HTTPS + WAMP server on an ephemeral 127.0.0.1 port.
+
+    GETs are served from a resource table that scenarios update with
+    set_resource(), which also pushes OnJsonApiEvent messages to
+    subscribed WebSocket clients; writes go through route() handlers.
+    Timers from schedule() run on one engine thread holding the state lock,
+    so scenarios never race with request handlers.
+    """
+
+    def __init__(self, scenario=None, port=0, token=None, friends=25):
+        self.token = token or secrets.token_urlsafe(16)
+        self.resources = {}
+        self.routes = []
+        self.request_counts = Counter()
+        self.started = None
+        self._lock = threading.RLock()
+        self._ws_clients = []
+        self._timers = []
+        self._timer_seq = itertools.count()
+        self._timer_cond = threading.Condition()
+        self._stopping = False
+        self._installed = False
+
+        self._tmp = tempfile.TemporaryDirectory()
+        cert, key = make_self_signed_cert(self._tmp.name)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        self.httpd = _Server(('127.0.0.1', port), FakeLCUHandler)
+        self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+        self.httpd.fake = self
+        self.port = self.httpd.server_address[1]
+        self._threads = [
+            threading.Thread(target=self.httpd.serve_forever, daemon=True, name='FakeLCUServer'),
+            threading.Thread(target=self._run_timers, daemon=True, name='FakeLCUEngine'),
+        ]
+
+        self._install_defaults(friends)
+        self.scenario = scenario if scenario is not None else DraftScenario()
+        self.scenario.attach(self)
+
+    # Lifecycle
+    def start(self):
+        self.started = monotonic()
+        for thread in self._threads:
+            thread.start()
+        with self._lock:
+            self.scenario.start()
+        return self
+
+    def stop(self):
+        with self._timer_cond:
+            self._stopping = True
+            self._timer_cond.notify_all()
+        with self._lock:
+            clients, self._ws_clients = self._ws_clients, []
+        for client in clients:
+            client.close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._installed:
+            from Rengar import set_lockfile_path, set_riot_lockfile_path
+            set_lockfile_path(None)
+            set_riot_lockfile_path(None)
+        self._tmp.cleanup()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def now(self):
+        """Seconds since start()."""
+        return monotonic() - self.started
+
+    # Pointing clients at the fake
+    def write_lockfiles(self, directory=None):
+        """Write League and Riot Client lockfiles; returns their paths."""
+        directory = directory or self._tmp.name
+        league = os.path.join(directory, 'lockfile')
+        riot = os.path.join(directory, 'riot-lockfile')
+        pid = os.getpid()
+        with open(league, 'w', encoding='utf-8') as f:
+            f.write(f'LeagueClient:{pid}:{self.port}:{self.token}:https')
+        with open(riot, 'w', encoding='utf-8') as f:
+            f.write(f'Riot Client:{pid}:{self.port}:{self.token}:https')
+        return league, riot
+
+    def install(self):
+        """Make Rengar discovery in this process resolve to the fake."""
+        from Rengar import set_lockfile_path, set_riot_lockfile_path
+        league, riot = self.write_lockfiles()
+        set_lockfile_path(league)
+        set_riot_lockfile_path(riot)
+        self._installed = True
+        return league, riot
+
+    def client(self, **kwargs):
+        """A new Rengar connected to the fake."""
+        from Rengar import Rengar
+        self.install()
+        return Rengar(**kwargs)
+
+    def authorized(self, header):
+        expected = base64.b64encode(f'riot:{self.token}'.encode()).decode()
+        return header == f'Basic {expected}'
+
+    # Timers
+    def schedule(self, delay, fn, *args):
+        """Run fn(*args) on the engine thread after delay seconds; returns a cancellable entry."""
+        entry = [monotonic() + max(delay, 0), next(self._timer_seq), fn, args, False]
+        with self._timer_cond:
+            heapq.heappush(self._timers, entry)
+            self._timer_cond.notify()
+        return entry
+
+    @staticmethod
+    def cancel(entry):
+        if entry is not None:
+            entry[4] = True
+
+    def _run_timers(self):
+        while True:
+            with self._timer_cond:
+                while not self._stopping:
+                    if self._timers and self._timers[0][0] <= monotonic():
+                        break
+                    timeout = self._timers[0][0] - monotonic() if self._timers else None
+                    self._timer_cond.wait(timeout)
+                if self._stopping:
+                    return
+                entry = heapq.heappop(self._timers)
+            if entry[4]:
+                continue
+            with self._lock:
+                try:
+                    entry[2](*entry[3])
+                except Exception:
+                    logger.exception('FakeLCU timer failed')
+
+    # Resources and events
+    def set_resource(self, uri, data, publish=True):
+        with self._lock:
+            event_type = 'Update' if uri in self.resources else 'Create'
+            self.resources[uri] = data
+            if publish:
+                self.publish(uri, event_type, data)
+
+    def delete_resource(self, uri, publish=True):
+        with self._lock:
+            if self.resources.pop(uri, None) is not None and publish:
+                self.publish(uri, 'Delete', None)
+
+    def publish(self, uri, event_type, data):
+        """Push an OnJsonApiEvent to every subscribed WebSocket client."""
+        message = json.dumps([WAMP_EVENT, 'OnJsonApiEvent', {'data': data, 'eventType': event_type, 'uri': uri}])
+        payload = message.encode('utf-8')
+        with self._lock:
+            clients = [client for client in self._ws_clients if client.subscribed]
+        for client in clients:
+            try:
+                client.send(WS_TEXT, payload)
+            except OSError:
+                with self._lock:
+                    if client in self._ws_clients:
+                        self._ws_clients.remove(client)
+
+    def route(self, method, pattern, handler):
+        """Serve method requests whose path fully matches pattern with handler(body, *groups)."""
+        self.routes.append((method, re.compile(pattern), handler))
+
+    def handle(self, method, path, body):
+        endpoint = path.split('?', 1)[0]
+        with self._lock:
+            self.request_counts[(method, endpoint)] += 1
+            for route_method, pattern, handler in self.routes:
+                match = pattern.fullmatch(endpoint) if route_method == method else None
+                if match:
+                    return handler(body, *match.groups())
+            if method == 'GET' and endpoint in self.resources:
+                resource = self.resources[endpoint]
+                return 200, resource() if callable(resource) else resource
+        return rpc_error(404, f'No resource for {method} {endpoint}')
+
+    def serve_websocket(self, handler):
+        key = handler.headers.get('Sec-WebSocket-Key', '')
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+        handler.send_response(101)
+        handler.send_header('Upgrade', 'websocket')
+        handler.send_header('Connection', 'Upgrade')
+        handler.send_header('Sec-WebSocket-Accept', accept)
+        if 'wamp' in handler.headers.get('Sec-WebSocket-Protocol', ''):
+            handler.send_header('Sec-WebSocket-Protocol', 'wamp')
+        handler.end_headers()
+        handler.close_connection = True
+
+        client = _WebSocketClient(handler)
+        with self._lock:
+            self._ws_clients.append(client)
+        try:
+            while not self._stopping:
+                opcode, payload = _read_frame(handler.rfile)
+                if opcode == WS_CLOSE:
+                    break
+                if opcode == WS_PING:
+                    client.send(WS_PONG, payload)
+                elif opcode == WS_TEXT:
+                    self._on_wamp_message(client, payload)
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            with self._lock:
+                if client in self._ws_clients:
+                    self._ws_clients.remove(client)
+
+    def _on_wamp_message(self, client, payload):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        if isinstance(message, list) and len(message) >= 2 and message[1] == 'OnJsonApiEvent':
+            client.subscribed = message[0] == 5
+
+    # Default client state
+    def _install_defaults(self, friends):
+        local = self.summoner(SUMMONER_BASE_ID)
+        self.resources.update({
+            CURRENT_SUMMONER_URI: local,
+            GAMEFLOW_URI: 'None',
+            SEARCH_STATE_URI: {'errors': [], 'lowPriorityData': {}, 'searchState': 'Invalid'},
+            '/riotclient/region-locale': {'locale': 'en_US', 'region': 'NA', 'webLanguage': 'en', 'webRegion': 'na'},
+            '/lol-patch/v1/game-version': GAME_VERSION,
+            '/lol-ranked/v1/current-ranked-stats': {'queues': [], 'highestRankedEntry': None},
+            '/lol-chat/v1/me': {'availability': 'chat', 'statusMessage': '', 'gameName': local['gameName'],
+                                'gameTag': local['tagLine'], 'puuid': local['puuid']},
+            '/chat/v1/session': {'state': 'connected'},
+            '/lol-challenges/v1/summary-player-data/local-player': {
+                'title': {'itemId': -1}, 'bannerId': '',
+                'topChallenges': [{'id': 101101}, {'id': 101102}, {'id': 101103}],
+            },
+            '/lol-champ-select/v1/all-grid-champions': [
+                {'id': cid, 'name': name, 'alias': champion_alias(cid, name), 'owned': True,
+                 'freeToPlay': False, 'disabled': False}
+                for cid, name in CHAMPIONS
+            ],
+            '/lol-champions/v1/inventories/local-player/champions': [{'id': -1, 'name': 'None'}] + [
+                {'id': cid, 'name': name, 'alias': champion_alias(cid, name), 'active': True}
+                for cid, name in CHAMPIONS
+            ],
+            '/lol-game-data/assets/v1/skins.json': {
+                str(cid * 1000): {
+                    'id': cid * 1000, 'isBase': True, 'name': name,
+                    'loadScreenPath': f'/lol-game-data/assets/ASSETS/Characters/'
+                                      f'{champion_alias(cid, name)}/Skins/Base/{champion_alias(cid, name)}LoadScreen.jpg',
+                }
+                for cid, name in CHAMPIONS
+            },
+        })
+        self.friends = {
+            f'{index:08x}-fake-friend@na1.pvp.net': {
+                'pid': f'{index:08x}-fake-friend@na1.pvp.net', 'gameName': f'Friend{index}',
+                'gameTag': 'FAKE', 'summonerId': SUMMONER_BASE_ID + 1000 + index,
+            }
+            for index in range(friends)
+        }
+
+        self.route('GET', r'/lol-summoner/v1/summoners/(\d+)', self._get_summoner)
+        self.route('PUT', r'/lol-summoner/v1/current-summoner/icon', self._put_icon)
+        self.route('POST', r'/lol-summoner/v1/save-alias', self._save_alias)
+        self.route('POST', r'/lol-summoner/v1/current-summoner/summoner-profile', lambda body: (204, None))
+        self.route('GET', r'/lol-chat/v1/friends', lambda body: (200, list(self.friends.values())))
+        self.route('DELETE', r'/lol-chat/v1/friends/([^/]+)', self._delete_friend)
+        self.route('PUT', r'/lol-chat/v1/me', self._put_chat_me)
+        self.route('POST', r'/chat/v1/suspend', lambda body: self._set_chat_state('disconnected'))
+        self.route('POST', r'/chat/v1/resume', lambda body: self._set_chat_state('connected'))
+        self.route('POST', r'/lol-challenges/v1/update-player-preferences/', lambda body: (204, None))
+        self.route('POST', r'/riotclient/kill-and-restart-ux', lambda body: (204, None))
+
+    def summoner(self, summoner_id):
+        index = summoner_id - SUMMONER_BASE_ID
+        return {
+            'summonerId': summoner_id, 'accountId': summoner_id, 'profileIconId': 29,
+            'puuid': f'00000000-0000-0000-0000-{summoner_id:012d}',
+            'gameName': 'LocalPlayer' if index == 0 else f'Player{index}',
+            'tagLine': 'FAKE', 'summonerLevel': 30 + index,
+        }
+
+    def _get_summoner(self, body, summoner_id):
+        if int(summoner_id) == SUMMONER_BASE_ID:
+            return 200, self.resources[CURRENT_SUMMONER_URI]
+        if SUMMONER_BASE_ID < int(summoner_id) < SUMMONER_BASE_ID + 2000:
+            return 200, self.summoner(int(summoner_id))
+        return rpc_error(404, f'Summoner {summoner_id} not found')
+
+    def _put_icon(self, body):
+        summoner = dict(self.resources[CURRENT_SUMMONER_URI], profileIconId=int((body or {}).get('profileIconId', 0)))
+        self.set_resource(CURRENT_SUMMONER_URI, summoner)
+        return 201, summoner
+
+    def _save_alias(self, body):
+        body = body or {}
+        summoner = dict(self.resources[CURRENT_SUMMONER_URI],
+                        gameName=body.get('gameName', ''), tagLine=body.get('tagLine', ''))
+        self.set_resource(CURRENT_SUMMONER_URI, summoner)
+        return 200, {'isSuccess': True, 'errorCode': None}
+
+    def _delete_friend(self, body, pid):
+        if self.friends.pop(pid, None) is None:
+            return rpc_error(404, f'Friend {pid} not found')
+        return 204, None
+
+    def _put_chat_me(self, body):
+        me = dict(self.resources['/lol-chat/v1/me'], **(body or {}))
+        self.set_resource('/lol-chat/v1/me', me)
+        return 201, me
+
+    def _set_chat_state(self, state):
+        self.set_resource('/chat/v1/session', {'state': state})
+        return 204, None
+
+
+class DraftScenario:
+    """
+    Queue, ready check, a 10-player draft and game start.
+
+    Durations are LCU seconds divided by speed (start_delay is wall
+    seconds, to leave time to start the scripts). Bots hover during planning
+    and act at seeded random points in their turn, so a given seed replays
+    the same draft. The local player (local_cell) has to act through the
+    API: a missed ban is skipped and a missed pick dodges. Timings of the
+    local player's accept, hovers and actions are collected in results.
+    """
+
+    # Draft order: one group of ten simultaneous bans, then picks 1-2-2-2-2-1
+    PICK_ORDER = [[0], [5, 6], [1, 2], [7, 8], [3, 4], [9]]
+    POSITIONS = ['top', 'jungle', 'middle', 'bottom', 'utility']
+
+    def __init__(self, local_cell=2, seed=0, speed=1.0, queue_time=2.0, ready_check_time=10.0,
+                 planning_time=10.0, ban_time=30.0, pick_time=30.0, finalization_time=10.0,
+                 bot_delay=(1.0, 8.0), game_id=4000000001, start_delay=0.0):
+        self.local_cell = local_cell
+        self.rng = random.Random(seed)
+        self.speed = speed
+        self.queue_time = queue_time
+        self.ready_check_time = ready_check_time
+        self.planning_time = planning_time
+        self.ban_time = ban_time
+        self.pick_time = pick_time
+        self.finalization_time = finalization_time
+        self.bot_delay = bot_delay
+        self.game_id = game_id
+        self.start_delay = start_delay
+        self.fake = None
+        self.done = threading.Event()
+        self.results = {
+            'ready_check_accept': None,
+            'champ_select_started': None,
+            'first_hover': None,
+            'actions': {},
+            'dodged': False,
+            'finished': False,
+            'ended': None,
+        }
+        self.actions = []
+        self.phase = None
+        self._phase_started = self._phase_ends = 0.0
+        self._timer = {}
+        self._group = -1
+        self._group_timer = None
+        self._ready_timer = None
+        self._ready_started = None
+        self._counter = 0
+
+    def _seconds(self, lcu_seconds):
+        return lcu_seconds / self.speed
+
+    def attach(self, fake):
+        self.fake = fake
+        fake.route('POST', r'/lol-matchmaking/v1/ready-check/accept', self._accept)
+        fake.route('PATCH', r'/lol-champ-select/v1/session/actions/(\d+)', self._patch_action)
+        fake.route('POST', r'/lol-login/v1/session/invoke', self._invoke)
+        fake.route('GET', r'/chat/v5/participants', self._participants)
+
+    def start(self):
+        self.fake.set_resource(GAMEFLOW_URI, 'Lobby')
+        self.fake.schedule(self.start_delay, self._queue)
+
+    # Queue and ready check
+    def _queue(self):
+        self.fake.set_resource(GAMEFLOW_URI, 'Matchmaking')
+        self.fake.set_resource(SEARCH_STATE_URI, {'errors': [], 'lowPriorityData': {}, 'searchState': 'Searching'})
+        self.fake.schedule(self._seconds(self.queue_time), self._ready_check)
+
+    def _ready_check(self):
+        self._ready_started = self.fake.now()
+        self.fake.set_resource(GAMEFLOW_URI, 'ReadyCheck')
+        self.fake.set_resource(SEARCH_STATE_URI, {'errors': [], 'lowPriorityData': {}, 'searchState': 'Found'})
+        self.fake.set_resource(READY_CHECK_URI, {'state': 'InProgress', 'playerResponse': 'None', 'timer': 0.0})
+        self._ready_timer = self.fake.schedule(self._seconds(self.ready_check_time), self._ready_check_missed)
+
+    def _accept(self, body):
+        ready_check = self.fake.resources.get(READY_CHECK_URI)
+        if not ready_check or ready_check['state'] != 'InProgress':
+            return rpc_error(500, 'Not in a ready check')
+        if ready_check['playerResponse'] != 'Accepted':
+            self.results['ready_check_accept'] = self.fake.now() - self._ready_started
+            self.fake.set_resource(READY_CHECK_URI, dict(ready_check, playerResponse='Accepted'))
+            self.fake.cancel(self._ready_timer)
+            self.fake.schedule(self._seconds(1.0), self._champ_select)
+        return 204, None
+
+    def _ready_check_missed(self):
+        self.fake.set_resource(READY_CHECK_URI, {'state': 'Invalid', 'playerResponse': 'None', 'timer': 0.0})
+        self.fake.set_resource(GAMEFLOW_URI, 'Lobby')
+        self.done.set()
+
+    # Champion select
+    def _champ_select(self):
+        self.fake.delete_resource(READY_CHECK_URI)
+        self.fake.set_resource(SEARCH_STATE_URI, {'errors': [], 'lowPriorityData': {}, 'searchState': 'Invalid'})
+        self.fake.set_resource(GAMEFLOW_URI, 'ChampSelect')
+
+        action_ids = itertools.count(1)
+        self.actions = [[self._action(next(action_ids), cell, 'ban') for cell in range(10)]]
+        for group in self.PICK_ORDER:
+            self.actions.append([self._action(next(action_ids), cell, 'pick') for cell in group])
+        self.results['champ_select_started'] = self.fake.now()
+
+        self._enter_phase('PLANNING', self.planning_time)
+        self.fake.resources[SESSION_URI] = self.session
+        self._changed('Create')
+        for action in self._actions():
+            if action['type'] == 'pick' and action['actorCellId'] != self.local_cell:
+                delay = self.rng.uniform(0, self.planning_time * 0.8)
+                self.fake.schedule(self._seconds(delay), self._bot_hover, action)
+        self.fake.schedule(self._seconds(self.planning_time), self._start_group, 0)
+
+    def _action(self, action_id, cell, action_type):
+        return {
+            'id': action_id, 'actorCellId': cell, 'championId': 0, 'completed': False,
+            'isAllyAction': (cell < 5) == (self.local_cell < 5), 'isInProgress': False,
+            'pickTurn': 0, 'type': action_type,
+        }
+
+    def _actions(self):
+        return [action for group in self.actions for action in group]
+
+    def _enter_phase(self, phase, lcu_seconds):
+        self.phase = phase
+        self._phase_started = monotonic()
+        self._phase_ends = self._phase_started + self._seconds(lcu_seconds)
+
+    def _changed(self, event_type='Update'):
+        self._counter += 1
+        self._timer = self._snapshot_timer()
+        if SESSION_URI in self.fake.resources:
+            self.fake.publish(SESSION_URI, event_type, self.session())
+
+    def unavailable(self):
+        """Champion ids that are banned or locked in."""
+        return {a['championId'] for a in self._actions() if a['completed'] and a['championId'] > 0}
+
+    def _available(self):
+        taken = self.unavailable()
+        return [cid for cid, _ in CHAMPIONS if cid not in taken]
+
+    def _bot_hover(self, action):
+        if self.phase == 'PLANNING' and not action['completed']:
+            action['championId'] = self.rng.choice(self._available())
+            self._changed()
+
+    def _start_group(self, index):
+        self._group = index
+        if index >= len(self.actions):
+            return self._finalize()
+        group = self.actions[index]
+        duration = self.ban_time if group[0]['type'] == 'ban' else self.pick_time
+        self._enter_phase('BAN_PICK', duration)
+        now = self.fake.now()
+        for action in group:
+            action['isInProgress'] = True
+            if action['actorCellId'] == self.local_cell:
+                self.results['actions'][action['id']] = {'type': action['type'], 'started': now, 'completed': None}
+            else:
+                delay = self.rng.uniform(*self.bot_delay)
+                self.fake.schedule(self._seconds(min(delay, duration * 0.9)), self._bot_act, action)
+        self._group_timer = self.fake.schedule(self._seconds(duration), self._expire_group, index)
+        self._changed()
+
+    def _bot_act(self, action):
+        if not action['isInProgress'] or action['completed']:
+            return
+        available = self._available()
+        if action['type'] == 'ban':
+            # Bots do not ban what their own team is hovering
+            own_team = action['actorCellId'] < 5
+            hovered = {a['championId'] for a in self._actions()
+                       if a['type'] == 'pick' and (a['actorCellId'] < 5) == own_team}
+            choice = self.rng.choice([cid for cid in available if cid not in hovered] or available)
+        else:
+            choice = action['championId'] if action['championId'] in available else self.rng.choice(available)
+        self._complete(action, choice)
+
+    def _complete(self, action, champion_id):
+        action.update(championId=champion_id, completed=True, isInProgress=False)
+        group = self.actions[self._group]
+        if all(a['completed'] for a in group):
+            self.fake.cancel(self._group_timer)
+            self.fake.schedule(0, self._start_group, self._group + 1)
+        self._changed()
+
+    def _expire_group(self, index):
+        for action in self.actions[index]:
+            if action['completed']:
+                continue
+            if action['type'] == 'pick' and action['actorCellId'] == self.local_cell:
+                return self._end(dodged=True)
+            if action['type'] == 'ban':
+                action.update(championId=0, completed=True, isInProgress=False)
+            else:
+                action.update(championId=self.rng.choice(self._available()), completed=True, isInProgress=False)
+        self.fake.schedule(0, self._start_group, index + 1)
+        self._changed()
+
+    def _finalize(self):
+        self._enter_phase('FINALIZATION', self.finalization_time)
+        self._changed()
+        self.fake.schedule(self._seconds(self.finalization_time), self._end)
+
+    def _end(self, dodged=False):
+        self.phase = None
+        self.results['dodged'] = dodged
+        self.results['finished'] = not dodged
+        self.results['ended'] = self.fake.now()
+        self.fake.delete_resource(SESSION_URI)
+        self.fake.set_resource(GAMEFLOW_URI, 'Lobby' if dodged else 'GameStart')
+        self.done.set()
+
+    def _patch_action(self, body, action_id):
+        if SESSION_URI not in self.fake.resources:
+            return rpc_error(404, 'No active champion select session')
+        action = next((a for a in self._actions() if a['id'] == int(action_id)), None)
+        if action is None:
+            return rpc_error(404, f'Action {action_id} not found')
+        if action['actorCellId'] != self.local_cell:
+            return rpc_error(403, 'Action is not owned by the local player')
+        body = body or {}
+        champion_id = int(body.get('championId', action['championId']))
+        if champion_id in self.unavailable():
+            return rpc_error(500, f'Champion {champion_id} is not available')
+
+        now = self.fake.now()
+        if body.get('completed'):
+            if not action['isInProgress'] or action['completed']:
+                return rpc_error(500, f'Action {action_id} is not in progress')
+            timing = self.results['actions'][action['id']]
+            timing.update(completed=now, latency=now - timing['started'], championId=champion_id)
+            self._complete(action, champion_id)
+        else:
+            if action['type'] == 'pick' and self.results['first_hover'] is None:
+                self.results['first_hover'] = now - self.results['champ_select_started']
+            action['championId'] = champion_id
+            self._changed()
+        return 204, None
+
+    def _invoke(self, body):
+        # The only invocation the scripts use is the dodge (teambuilder-draft quitV2)
+        if SESSION_URI not in self.fake.resources:
+            return rpc_error(500, 'Not in champion select')
+        self.fake.cancel(self._group_timer)
+        self._end(dodged=True)
+        return 200, {}
+
+    def _participants(self, body):
+        if SESSION_URI not in self.fake.resources:
+            return 200, {'participants': []}
+        return 200, {'participants': [
+            {'cid': f'{self.game_id}@champ-select.na1.pvp.net', 'game_name': f'Player{cell}', 'game_tag': 'FAKE'}
+            for cell in self._team_cells()
+        ]}
+
+    def _team_cells(self, mine=True):
+        local_blue = self.local_cell < 5
+        return [cell for cell in range(10) if (cell < 5) == (local_blue if mine else not local_blue)]
+
+    def _member(self, cell):
+        pick = next(a for a in self._actions() if a['type'] == 'pick' and a['actorCellId'] == cell)
+        summoner_id = SUMMONER_BASE_ID + (0 if cell == self.local_cell else cell + 1)
+        summoner = self.fake.summoner(summoner_id)
+        return {
+            'cellId': cell, 'team': 1 if cell < 5 else 2,
+            'assignedPosition': self.POSITIONS[cell % 5],
+            'championId': pick['championId'] if pick['completed'] else 0,
+            'championPickIntent': 0 if pick['completed'] else pick['championId'],
+            'summonerId': summoner_id, 'puuid': summoner['puuid'],
+            'gameName': summoner['gameName'], 'tagLine': summoner['tagLine'],
+            'nameVisibilityType': 'VISIBLE',
+        }
+
+    def _snapshot_timer(self):
+        """
+        Like the client, the timer is only recomputed when the session changes:
+        the time left is as of internalNowInEpochMs, and GETs in between
+        return the same snapshot.
+        """
+        remaining = max(self._phase_ends - monotonic(), 0.0)
+        return {
+            'phase': self.phase,
+            'adjustedTimeLeftInPhase': int(remaining * 1000),
+            'totalTimeInPhase': int((self._phase_ends - self._phase_started) * 1000),
+            'isInfinite': False,
+            'internalNowInEpochMs': int(time() * 1000),
+        }
+
+    def session(self):
+        """The /lol-champ-select/v1/session payload as the local player sees it."""
+        bans = [a for a in self._actions() if a['type'] == 'ban' and a['completed'] and a['championId'] > 0]
+        mine = set(self._team_cells())
+        return {
+            'gameId': self.game_id,
+            'counter': self._counter,
+            'localPlayerCellId': self.local_cell,
+            'isSpectating': False,
+            'allowRerolling': False,
+            'actions': [[dict(a) for a in group] for group in self.actions],
+            'bans': {
+                'myTeamBans': [a['championId'] for a in bans if a['actorCellId'] in mine],
+                'theirTeamBans': [a['championId'] for a in bans if a['actorCellId'] not in mine],
+                'numBans': 10,
+            },
+            'myTeam': [self._member(cell) for cell in self._team_cells()],
+            'theirTeam': [self._member(cell) for cell in self._team_cells(mine=False)],
+            'timer': dict(self._timer),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fake League client for offline testing.')
+    parser.add_argument('--speed', type=float, default=1.0, help='scenario time compression')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--local-cell', type=int, default=2)
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--start-delay', type=float, default=5.0, help='wall seconds before queueing')
+    parser.add_argument('--dir', default=None, help='directory for the lockfiles')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    scenario = DraftScenario(local_cell=args.local_cell, seed=args.seed, speed=args.speed,
+                             start_delay=args.start_delay)
+    with FakeLCU(scenario, port=args.port) as fake:
+        league, riot = fake.write_lockfiles(args.dir)
+        print(f'Fake LCU on https://127.0.0.1:{fake.port}')
+        print(f'  LTK_LEAGUE_LOCKFILE={league}')
+        print(f'  LTK_RIOT_LOCKFILE={riot}')
+        try:
+            while not scenario.done.wait(0.5):
+                pass
+            print(json.dumps(scenario.results, indent=2))
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,10 @@
 from termcolor import colored
-from Rengar import Rengar
+from Rengar import get_client
 
 
-def change_profile_icon(icon_id=None):
+def change_profile_icon(icon_id=None, rengar=None):
     """Change profile icon by ID"""
-    rengar = Rengar()
+    rengar = rengar or get_client()
 
     if icon_id is None:
         icon_id = input(colored("Type the icon ID (1 - 5000): \n", "magenta"))
@@ -2,16 +2,94 @@
 Refactored champion select automation - cleaner separation of concerns.
 """
 
+import heapq
+import json
+import os
 import threading
 import time
 import random
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Set
-from difflib import get_close_matches
+from typing import Optional, List, Dict, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+SESSION_URI = "/lol-champ-select/v1/session"
+GAME_VERSION_URI = "/lol-patch/v1/game-version"
+INVENTORY_URI = "/lol-champions/v1/inventories"
+
+# Champion registry cache file (see default_champion_cache_path)
+CHAMPION_CACHE_ENV = "LTK_CHAMPION_CACHE"
+# Minimum seconds between champion loads while the client is unreachable
+LOAD_RETRY_INTERVAL = 5.0
+
+# Seconds kept in reserve before the phase timer expires, so a pick or ban
+# request is abandoned while there is still time to act on the failure.
+PHASE_DEADLINE_MARGIN = 0.25
+
+# Seconds between re-checks of an own action that is open but not done yet
+# (a failed request, no valid champion, or the feature switched on mid-turn)
+ACTION_RECHECK_INTERVAL = 0.2
+
+# Monitor modes: react to LCU push events, or poll the session endpoint.
+MODE_EVENTS = "events"
+MODE_POLLING = "polling"
+
+# Common shorthands, as normalized alias -> normalized champion name.
+# The client's own aliases (e.g. "MonkeyKing") are indexed when loading.
+CHAMPION_ALIASES = {
+    "mf": "missfortune",
+    "tf": "twistedfate",
+    "ww": "warwick",
+    "j4": "jarvaniv",
+    "gp": "gangplank",
+    "tk": "tahmkench",
+    "lb": "leblanc",
+    "yi": "masteryi",
+    "asol": "aurelionsol",
+    "mundo": "drmundo",
+    "nunu": "nunuwillump",
+    "kog": "kogmaw",
+    "cho": "chogath",
+    "xin": "xinzhao",
+    "heimer": "heimerdinger",
+    "blitz": "blitzcrank",
+    "cass": "cassiopeia",
+    "morg": "morgana",
+    "naut": "nautilus",
+    "kass": "kassadin",
+    "kat": "katarina",
+    "voli": "volibear",
+}
+
+
+# Minimum trigram similarity (Dice coefficient) for a fuzzy suggestion
+FUZZY_CUTOFF = 0.35
+
+
+def normalize_champion_name(name: str) -> str:
+    """Case, whitespace and punctuation insensitive key: "Kai'Sa" -> "kaisa"."""
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+
+def default_champion_cache_path() -> str:
+    """LTK_CHAMPION_CACHE, else champions.json in the user's cache directory."""
+    override = os.environ.get(CHAMPION_CACHE_ENV)
+    if override:
+        return override
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "League-Tool-Kit", "champions.json")
+
+
+def _trigrams(key: str) -> Set[str]:
+    """Padded trigrams, so short input and word starts still share some: "zed" -> {"  z", " ze", "zed", "ed "}."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
 
 @dataclass
 class ChampionSelection:
@@ -40,101 +118,356 @@ class SelectionOptions:
     avoid_ally_hovers: bool = True
 
 
+@dataclass(frozen=True)
+class ChampionIndex:
+    """
+    Lookup tables for one champion list. Built once by ChampionRegistry and
+    swapped in whole, so a reader holding a reference never sees a mix of
+    two lists.
+    """
+    champ_dict: Dict[str, int] = field(default_factory=dict)
+    names: Dict[int, str] = field(default_factory=dict)
+    records: List[dict] = field(default_factory=list)
+    lookup: Dict[str, int] = field(default_factory=dict)
+    prefix_keys: List[str] = field(default_factory=list)
+    prefix_ids: List[int] = field(default_factory=list)
+    trigram_index: Dict[str, List[int]] = field(default_factory=dict)
+    trigram_counts: Dict[int, int] = field(default_factory=dict)
+    
+    @classmethod
+    def build(cls, data: List[dict], filter_invalid: bool = False) -> "ChampionIndex":
+        champ_dict: Dict[str, int] = {}
+        names: Dict[int, str] = {}
+        keys: Dict[str, int] = {}
+        records: List[dict] = []
+        for champ in data:
+            champ_id = champ.get("id")
+            champ_name = champ.get("name")
+            
+            if champ_id and champ_name:
+                if filter_invalid and champ_id == -1:
+                    continue
+                key = normalize_champion_name(champ_name)
+                champ_dict[key] = champ_id
+                names[champ_id] = champ_name
+                keys[key] = champ_id
+                records.append({"id": champ_id, "name": champ_name, "alias": champ.get("alias")})
+                alias = normalize_champion_name(champ.get("alias") or "")
+                if alias and alias not in keys:
+                    keys[alias] = champ_id
+        
+        for alias, key in CHAMPION_ALIASES.items():
+            if key in champ_dict and alias not in keys:
+                keys[alias] = champ_dict[key]
+        
+        trigram_index: Dict[str, List[int]] = {}
+        trigram_counts: Dict[int, int] = {}
+        for key, champ_id in champ_dict.items():
+            grams = _trigrams(key)
+            trigram_counts[champ_id] = len(grams)
+            for gram in grams:
+                trigram_index.setdefault(gram, []).append(champ_id)
+        
+        prefix_keys = sorted(keys)
+        return cls(champ_dict, names, records, keys, prefix_keys,
+                   [keys[key] for key in prefix_keys], trigram_index, trigram_counts)
+    
+    def find_prefix(self, prefix: str, limit: int) -> List[int]:
+        """IDs whose normalized name or alias starts with prefix, shortest completion first."""
+        if not prefix:
+            return []
+        keys, ids = self.prefix_keys, self.prefix_ids
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + "\uffff", start)
+        ranked = sorted(range(start, end), key=lambda i: (len(keys[i]), keys[i]))
+        
+        matches: List[int] = []
+        for i in ranked:
+            if ids[i] not in matches:
+                matches.append(ids[i])
+                if len(matches) == limit:
+                    break
+        return matches
+    
+    def find_fuzzy(self, key: str, limit: int, cutoff: float) -> List[int]:
+        """IDs ranked by trigram similarity (Dice coefficient) to a normalized key."""
+        query = _trigrams(key)
+        common: Dict[int, int] = {}
+        for gram in query:
+            for champ_id in self.trigram_index.get(gram, ()):
+                common[champ_id] = common.get(champ_id, 0) + 1
+        
+        scored = []
+        for champ_id, shared in common.items():
+            score = 2 * shared / (len(query) + self.trigram_counts[champ_id])
+            if score >= cutoff:
+                scored.append((-score, self.names[champ_id], champ_id))
+        return [champ_id for _, _, champ_id in heapq.nsmallest(limit, scored)]
+
+
 class ChampionRegistry:
-    """Manages champion data and name/ID conversion."""
+    """
+    Manages champion data and name/ID conversion.
     
-    def __init__(self, rengar):
+    Names are looked up by their normalized form (see normalize_champion_name)
+    or an alias; partial input goes through a sorted prefix index.
+    
+    The parsed list is saved to cache_path keyed by game version, so it is
+    available at startup before the client is, and is only fetched again
+    when the patch changes or the champion inventory does.
+    """
+    
+    def __init__(self, rengar, cache_path: Optional[str] = None):
         self.rengar = rengar
-        self._champ_dict: Dict[str, int] = {}
+        self.cache_path = cache_path or default_champion_cache_path()
+        self.version: Optional[str] = None
+        self._verified = False
+        self._index = ChampionIndex()
+        self._last_load = 0.0
+        self._last_refresh = 0.0
+        self._refresh_thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
     
-    def load(self) -> bool:
-        """Load champion list from client."""
+    def load(self, version: Optional[str] = None) -> bool:
+        """Load champion list from client and save it to the cache."""
+        self._last_load = time.monotonic()
         try:
+            if version is None:
+                version = self._fetch_version()
+            
             # Try primary endpoint
             response = self.rengar.lcu_request("GET", "/lol-champ-select/v1/all-grid-champions", "")
             
             if response.status_code == 200:
                 self._parse_data(response.json())
-                logger.info(f"✅ Loaded {len(self._champ_dict)} champions")
-                return True
-            
-            # Fallback endpoint
-            response = self.rengar.lcu_request("GET", "/lol-champions/v1/inventories/local-player/champions", "")
-            
-            if response.status_code == 200:
+            else:
+                # Fallback endpoint
+                response = self.rengar.lcu_request("GET", "/lol-champions/v1/inventories/local-player/champions", "")
+                if response.status_code != 200:
+                    return False
                 self._parse_data(response.json(), filter_invalid=True)
-                logger.info(f"✅ Loaded {len(self._champ_dict)} champions")
-                return True
             
-            return False
+            logger.info(f"✅ Loaded {len(self._index.names)} champions")
+            if version is not None:
+                self.version = version
+                self._verified = True
+                self._save_cache()
+            return True
             
         except Exception as e:
             logger.error(f"❌ Error loading champions: {e}")
             return False
     
+    def ensure_loaded(self) -> bool:
+        """
+        Load from the client if nothing is loaded yet, at most once per
+        LOAD_RETRY_INTERVAL; otherwise check the cached list's patch once.
+        """
+        if not self._index.names:
+            if time.monotonic() - self._last_load < LOAD_RETRY_INTERVAL:
+                return False
+            return self.load()
+        if not self._verified:
+            self.refresh_async()
+        return True
+    
+    def refresh(self, force: bool = False) -> bool:
+        """Reload from the client if its patch differs from the loaded list (or if forced)."""
+        version = self._fetch_version()
+        if version is None:
+            return False
+        if not force and version == self.version and self._index.names:
+            self._verified = True
+            return True
+        if version != self.version:
+            logger.info(f"🔄 Champion list patch {self.version or 'none'} -> {version}")
+        return self.load(version)
+    
+    def refresh_async(self, force: bool = False) -> None:
+        """
+        Run refresh() on a background thread unless one is already running.
+        Unforced refreshes start at most once per LOAD_RETRY_INTERVAL, so a
+        client without a readable game version is not asked on every tick.
+        """
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            now = time.monotonic()
+            if not force and now - self._last_refresh < LOAD_RETRY_INTERVAL:
+                return
+            self._last_refresh = now
+            self._refresh_thread = threading.Thread(
+                target=self.refresh,
+                args=(force,),
+                daemon=True,
+                name="ChampionRegistryRefresh"
+            )
+            self._refresh_thread.start()
+    
+    def on_inventory_event(self, event: dict) -> None:
+        """Owned champions changed (purchase, rotation, new release): reload in the background."""
+        self.refresh_async(force=True)
+    
+    def _fetch_version(self) -> Optional[str]:
+        try:
+            response = self.rengar.lcu_request("GET", GAME_VERSION_URI, "")
+            if response.status_code == 200:
+                version = response.json()
+                return version if isinstance(version, str) and version else None
+        except Exception:
+            pass
+        return None
+    
+    def load_cache(self) -> bool:
+        """Load the list saved for the last seen patch; no client needed."""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            self._parse_data(cached["champions"])
+            self.version = cached["version"]
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable champion cache {self.cache_path}: {e}")
+            return False
+        logger.info(f"📦 Loaded {len(self._index.names)} cached champions (patch {self.version})")
+        return bool(self._index.names)
+    
+    def _save_cache(self) -> None:
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": self.version, "champions": self._index.records}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write champion cache {self.cache_path}: {e}")
+    
     def _parse_data(self, data: List[dict], filter_invalid: bool = False) -> None:
         """Parse champion data from API response."""
-        with self._lock:
-            self._champ_dict.clear()
-            for champ in data:
-                champ_id = champ.get("id")
-                champ_name = champ.get("name")
-                
-                if champ_id and champ_name:
-                    if filter_invalid and champ_id == -1:
-                        continue
-                    self._champ_dict[champ_name.lower()] = champ_id
+        # One assignment publishes the whole index to concurrent readers
+        self._index = ChampionIndex.build(data, filter_invalid)
+    
+    def find_prefix(self, partial: str, limit: int = 5) -> List[int]:
+        """
+        Champion IDs whose name or alias starts with partial, best first.
+        
+        Shorter completions rank first, so "kay" lists Kayn before Kayle.
+        """
+        return self._index.find_prefix(normalize_champion_name(partial), limit)
     
     def get_id(self, name: str) -> int:
-        """Convert champion name to ID. Returns -1 if not found."""
-        if not self._champ_dict:
-            self.load()
+        """
+        Convert champion name, alias or unambiguous prefix to ID.
+        Returns -1 if not found or if the prefix matches several champions.
+        """
+        if not self._index.names:
+            self.ensure_loaded()
+        index = self._index
         
-        name = name.lower().strip()
+        key = normalize_champion_name(name)
         
-        # Exact match
-        if name in self._champ_dict:
-            return self._champ_dict[name]
+        # Exact name or alias
+        champ_id = index.lookup.get(key)
+        if champ_id is not None:
+            return champ_id
         
-        # Partial match
-        for champ_name, champ_id in self._champ_dict.items():
-            if name in champ_name or champ_name in name:
-                return champ_id
+        # Prefix match, only when it identifies a single champion
+        matches = index.find_prefix(key, limit=2)
+        if len(matches) == 1:
+            return matches[0]
         
         return -1
     
+    def find_fuzzy(self, partial: str, limit: int = 5, cutoff: float = FUZZY_CUTOFF) -> List[int]:
+        """
+        Champion IDs whose name shares the most trigrams with partial, best first.
+        
+        Only champions sharing at least one trigram are scored; ties are
+        broken by name so the order is stable.
+        """
+        return self._index.find_fuzzy(normalize_champion_name(partial), limit, cutoff)
+    
     def get_suggestions(self, partial: str, limit: int = 5) -> List[str]:
         """Get champion name suggestions for partial input."""
-        if not self._champ_dict:
+        index = self._index
+        if not index.names:
             return []
         
-        partial = partial.lower().strip()
-        all_names = list(self._champ_dict.keys())
-        
-        # Fuzzy matching
-        matches = get_close_matches(partial, all_names, n=limit, cutoff=0.6)
+        # Prefix matches first, then fuzzy matches
+        key = normalize_champion_name(partial)
+        suggestions = index.find_prefix(key, limit)
+        if len(suggestions) < limit:
+            for champ_id in index.find_fuzzy(key, limit, FUZZY_CUTOFF):
+                if champ_id not in suggestions:
+                    suggestions.append(champ_id)
         
-        # Partial matches
-        partial_matches = [n for n in all_names if partial in n and n not in matches]
-        
-        suggestions = matches + partial_matches
-        return [name.title() for name in suggestions[:limit]]
+        return [index.names[champ_id] for champ_id in suggestions[:limit]]
     
     def get_all_ids(self) -> List[int]:
         """Get all champion IDs."""
-        return list(self._champ_dict.values())
+        return list(self._index.names)
     
     def get_name(self, champ_id: int) -> str:
         """Get champion name from ID."""
-        for name, cid in self._champ_dict.items():
-            if cid == champ_id:
-                return name.title()
-        return "Unknown"
+        return self._index.names.get(champ_id, "Unknown")
     
     def is_loaded(self) -> bool:
         """Check if champion data is loaded."""
-        return bool(self._champ_dict)
+        return bool(self._index.names)
+
+
+@dataclass
+class ChampSelectSnapshot:
+    """A champion select session parsed once per update, so selector queries are set lookups."""
+    data: dict
+    cell_id: Optional[int] = None
+    banned: Set[int] = field(default_factory=set)
+    picked: Set[int] = field(default_factory=set)
+    ally_hovers: Set[int] = field(default_factory=set)
+    actions: Dict[Tuple[int, str], List[dict]] = field(default_factory=dict)
+    
+    @classmethod
+    def from_session(cls, session: dict) -> "ChampSelectSnapshot":
+        """Index a /lol-champ-select/v1/session payload in a single pass."""
+        snapshot = cls(session, session.get("localPlayerCellId"))
+        for group in session.get("actions", []):
+            if not isinstance(group, list):
+                continue
+            
+            for action in group:
+                cell_id = action.get("actorCellId")
+                action_type = action.get("type")
+                snapshot.actions.setdefault((cell_id, action_type), []).append(action)
+                
+                champ_id = action.get("championId", 0)
+                if not champ_id or champ_id <= 0:
+                    continue
+                if action.get("completed"):
+                    if action_type == "ban":
+                        snapshot.banned.add(champ_id)
+                    elif action_type == "pick":
+                        snapshot.picked.add(champ_id)
+                elif action_type == "pick" and cell_id != snapshot.cell_id:
+                    snapshot.ally_hovers.add(champ_id)
+        
+        bans = session.get("bans", {})
+        if isinstance(bans, dict):
+            for team_bans in bans.values():
+                if isinstance(team_bans, list):
+                    snapshot.banned.update(team_bans)
+        return snapshot
+    
+    def my_actions(self, action_type: str) -> List[dict]:
+        """Local player's actions of one type, in draft order."""
+        return self.actions.get((self.cell_id, action_type), [])
+    
+    def my_pending_action(self, action_type: str) -> Optional[dict]:
+        """Local player's first uncompleted action of one type."""
+        for action in self.my_actions(action_type):
+            if not action.get("completed", False):
+                return action
+        return None
 
 
 class ChampSelectSession:
@@ -157,47 +490,13 @@ class ChampSelectSession:
         """Get local player's cell ID from session."""
         return session.get("localPlayerCellId")
     
-    def is_champion_banned(self, champion_id: int, session: dict) -> bool:
+    def is_champion_banned(self, champion_id: int, snapshot: ChampSelectSnapshot) -> bool:
         """Check if champion is already banned."""
-        # Check completed ban actions
-        for actions in session.get("actions", []):
-            if not isinstance(actions, list):
-                continue
-            
-            for action in actions:
-                if (action.get("type") == "ban" and
-                    action.get("completed") and
-                    action.get("championId") == champion_id):
-                    return True
-        
-        # Check bans object
-        bans = session.get("bans", {})
-        if isinstance(bans, dict):
-            for team_bans in bans.values():
-                if isinstance(team_bans, list) and champion_id in team_bans:
-                    return True
-        
-        return False
+        return champion_id in snapshot.banned
     
-    def get_ally_hovers(self, session: dict, cell_id: int) -> List[int]:
-        """Get list of champions that allies have hovered."""
-        ally_hovers = []
-        
-        for actions in session.get("actions", []):
-            if not isinstance(actions, list):
-                continue
-            
-            for action in actions:
-                if action.get("actorCellId") == cell_id:
-                    continue
-                
-                if action.get("type") == "pick":
-                    champ_id = action.get("championId", 0)
-                    if champ_id > 0 and not action.get("completed", False):
-                        if champ_id not in ally_hovers:
-                            ally_hovers.append(champ_id)
-        
-        return ally_hovers
+    def get_ally_hovers(self, snapshot: ChampSelectSnapshot) -> Set[int]:
+        """Get the champions that other players are hovering."""
+        return snapshot.ally_hovers
 
 
 class ChampionSelector:
@@ -207,14 +506,12 @@ class ChampionSelector:
         self.registry = registry
         self.session = session_handler
     
-    def select_pick(self, config: ChampionSelection, session_data: dict) -> int:
+    def select_pick(self, config: ChampionSelection, snapshot: ChampSelectSnapshot) -> int:
         """Select a champion to pick based on configuration."""
         # Random selection
         if config.primary == "Random":
-            available = [
-                cid for cid in self.registry.get_all_ids()
-                if not self.session.is_champion_banned(cid, session_data)
-            ]
+            taken = snapshot.banned | snapshot.picked
+            available = [cid for cid in self.registry.get_all_ids() if cid not in taken]
             return random.choice(available) if available else -1
         
         # Try champions in priority order
@@ -224,23 +521,27 @@ class ChampionSelector:
             if champ_id == -1:
                 continue
             
-            if self.session.is_champion_banned(champ_id, session_data):
+            if self.session.is_champion_banned(champ_id, snapshot):
                 logger.warning(f"⚠️ {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} choice {champ_name.title()} is BANNED")
                 continue
             
+            if champ_id in snapshot.picked:
+                logger.warning(f"⚠️ {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} choice {champ_name.title()} is already PICKED")
+                continue
+            
             logger.info(f"✅ Picking {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} choice: {champ_name.title()}")
             return champ_id
         
         logger.error("🚫 All pick options unavailable!")
         return -1
     
-    def select_ban(self, config: ChampionSelection, session_data: dict, 
-                   cell_id: int, avoid_ally_hovers: bool) -> int:
+    def select_ban(self, config: ChampionSelection, snapshot: ChampSelectSnapshot,
+                   avoid_ally_hovers: bool) -> int:
         """Select a champion to ban based on configuration."""
         # Get ally hovers if needed
-        ally_hovers = []
+        ally_hovers: Set[int] = set()
         if avoid_ally_hovers:
-            ally_hovers = self.session.get_ally_hovers(session_data, cell_id)
+            ally_hovers = self.session.get_ally_hovers(snapshot)
             if ally_hovers:
                 logger.info(f"🛡️ Protecting {len(ally_hovers)} ally champion(s)")
         
@@ -251,7 +552,7 @@ class ChampionSelector:
             if champ_id == -1:
                 continue
             
-            if self.session.is_champion_banned(champ_id, session_data):
+            if self.session.is_champion_banned(champ_id, snapshot):
                 logger.warning(f"⚠️ {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} ban {champ_name.title()} already BANNED")
                 continue
             
@@ -269,9 +570,11 @@ class ChampionSelector:
 class InstalockAutoban:
     """Main class for champion select automation."""
     
-    def __init__(self):
-        import Rengar
-        self.rengar = Rengar()
+    def __init__(self, mode: str = MODE_EVENTS, rengar=None):
+        if rengar is None:
+            from Rengar import get_client
+            rengar = get_client()
+        self.rengar = rengar
         
         # Components
         self.registry = ChampionRegistry(self.rengar)
@@ -287,14 +590,29 @@ class InstalockAutoban:
         self.monitor_thread: Optional[threading.Thread] = None
         self.is_running = False
         self._lock = threading.Lock()
+        self._session_lock = threading.RLock()
+        self._wake = threading.Event()
+        self._event_lock = threading.Lock()
+        self._pending_event: Optional[dict] = None
+        self._subscription = None
+        self._inventory_subscription = None
+        self.mode = mode if mode in (MODE_EVENTS, MODE_POLLING) else MODE_EVENTS
         
         # State tracking
         self._last_session_id = None
+        self._last_counter: Optional[int] = None
         self._processed_actions: Set[int] = set()
+        self._action_states: Dict[int, tuple] = {}
+        self._last_session: Optional[dict] = None
+        self._open_action = False
         self._pre_hover_done = False
+        self._phase_deadline: Optional[float] = None
         
         logger.info("📄 Loading champion data...")
-        if not self.registry.load():
+        if self.registry.load_cache():
+            # Usable right away; check the client's patch in the background
+            self.registry.refresh_async()
+        elif not self.registry.load():
             logger.warning("⚠️ Champion list will be loaded when client is available")
     
     # Compatibility properties for main.py
@@ -386,8 +704,8 @@ class InstalockAutoban:
             logger.error(f"❌ Champion '{name}' not found")
             return False
         
-        # Set champion
-        correct_name = name.lower()
+        # Set champion (by its full name, so aliases and prefixes display properly)
+        correct_name = self.registry.get_name(champ_id).lower()
         with self._lock:
             setattr(config, slot, correct_name)
             if slot == "primary":
@@ -441,6 +759,18 @@ class InstalockAutoban:
         logger.info(f"Avoid ally bans: {'✅ ON' if self.options.avoid_ally_hovers else '❌ OFF'}")
         return self.options.avoid_ally_hovers
     
+    def set_mode(self, mode: str) -> bool:
+        """Switch between event-driven and polling monitoring at runtime."""
+        if mode not in (MODE_EVENTS, MODE_POLLING):
+            logger.error(f"❌ Unknown monitor mode '{mode}'")
+            return False
+        self.mode = mode
+        if mode == MODE_POLLING:
+            self._unsubscribe()
+        self._wake.set()
+        logger.info(f"Monitor mode: {mode}")
+        return True
+    
     # Monitoring
     def start_monitor(self) -> None:
         """Start champion select monitoring."""
@@ -461,54 +791,45 @@ class InstalockAutoban:
     def stop(self) -> None:
         """Stop monitoring."""
         self.is_running = False
+        self._wake.set()
+        self._unsubscribe()
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=2)
         logger.info("🛑 Monitor stopped")
     
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
-        logger.info("👀 Champion select monitor active")
+        logger.info(f"👀 Champion select monitor active ({self.mode})")
         logger.info(f"📋 Instalock: {'✅ ENABLED' if self.instalock.enabled else '❌ DISABLED'} - {self.get_instalock_status()}")
         logger.info(f"📋 Auto-ban: {'✅ ENABLED' if self.auto_ban.enabled else '❌ DISABLED'} - {self.get_auto_ban_status()}")
         consecutive_errors = 0
         max_errors = 10
+        stream_was_connected = False
         
         while self.is_running:
             try:
-                # Load champions if not loaded
-                if not self.registry.is_loaded():
-                    self.registry.load()
-                
-                session_data = self.session_handler.get_session()
-                
-                if not session_data:
-                    self._reset_state()
-                    consecutive_errors = 0
-                    time.sleep(0.5)
-                    continue
-                
-                cell_id = self.session_handler.get_cell_id(session_data)
-                if cell_id is None:
-                    time.sleep(0.3)
-                    continue
-                
-                # Reset on new session
-                current_session_id = id(session_data)
-                if current_session_id != self._last_session_id:
-                    self._reset_state()
-                    self._last_session_id = current_session_id
-                    logger.info("🔄 New champion select session detected")
-                    logger.info(f"📋 Instalock: {'✅ ENABLED' if self.instalock.enabled else '❌ DISABLED'}")
-                    logger.info(f"📋 Auto-ban: {'✅ ENABLED' if self.auto_ban.enabled else '❌ DISABLED'}")
-                
-                # Handle pre-hover
-                self._handle_pre_hover(session_data)
-                
-                # Process actions
-                self._process_actions(session_data, cell_id)
+                if self.mode == MODE_EVENTS:
+                    self._subscribe()
+                    connected = self.rengar.event_stream.wait_connected(0.5)
+                    if connected:
+                        # Events only carry changes, so resync once per connection
+                        if not stream_was_connected:
+                            self.registry.refresh_async()
+                            self._poll_once()
+                        stream_was_connected = True
+                        consecutive_errors = 0
+                        self._wake.wait(ACTION_RECHECK_INTERVAL if self._open_action else 1.0)
+                        self._wake.clear()
+                        if not self._handle_pending_event() and self._open_action:
+                            # No update arrived: retry open actions on the last one
+                            self._recheck_session()
+                        continue
+                    # Stream is down: fall back to polling until it reconnects
+                    stream_was_connected = False
                 
+                delay = self._poll_once()
                 consecutive_errors = 0
-                time.sleep(0.2)
+                time.sleep(delay)
                 
             except Exception as e:
                 consecutive_errors += 1
@@ -523,13 +844,140 @@ class InstalockAutoban:
         
         logger.info("🛑 Champion select monitor stopped")
     
+    def _poll_once(self) -> float:
+        """Fetch the session once and handle it. Returns the delay before the next poll."""
+        # Load champions if not loaded
+        self.registry.ensure_loaded()
+        
+        session_data = self.session_handler.get_session()
+        
+        if not session_data:
+            with self._session_lock:
+                self._reset_state()
+            return 0.5
+        
+        if not self._handle_session(session_data):
+            return 0.3
+        return 0.2
+    
+    def _subscribe(self) -> None:
+        """Subscribe to champion select session events if not already subscribed."""
+        if self._subscription is None:
+            self._subscription = self.rengar.subscribe(SESSION_URI, self._on_session_event)
+        if self._inventory_subscription is None:
+            self._inventory_subscription = self.rengar.subscribe(INVENTORY_URI, self.registry.on_inventory_event)
+    
+    def _unsubscribe(self) -> None:
+        with self._event_lock:
+            self._pending_event = None
+        if self._subscription is not None:
+            self._subscription.unsubscribe()
+            self._subscription = None
+        if self._inventory_subscription is not None:
+            self._inventory_subscription.unsubscribe()
+            self._inventory_subscription = None
+    
+    def _on_session_event(self, event: dict) -> None:
+        """
+        Hand a pushed session update to the monitor thread.
+        
+        Runs on the event stream's reader, so it only keeps the latest
+        update; the requests it leads to are made by the monitor.
+        """
+        if not self.is_running or self.mode != MODE_EVENTS or event.get("uri") != SESSION_URI:
+            return
+        with self._event_lock:
+            self._pending_event = event
+        self._wake.set()
+    
+    def _handle_pending_event(self) -> bool:
+        """Handle the latest pushed session update. Returns False if none arrived since the last call."""
+        with self._event_lock:
+            event, self._pending_event = self._pending_event, None
+        if event is None:
+            return False
+        
+        if event.get("eventType") == "Delete":
+            with self._session_lock:
+                self._reset_state()
+            return True
+        
+        session_data = event.get("data")
+        if isinstance(session_data, dict):
+            self.registry.ensure_loaded()
+            self._handle_session(session_data)
+        return True
+    
+    def _recheck_session(self) -> None:
+        """Run the last handled session again, for actions that are still open."""
+        with self._session_lock:
+            session_data = self._last_session
+            if session_data is not None:
+                self._handle_session(session_data)
+    
+    def _handle_session(self, session_data: dict) -> bool:
+        """Run pre-hover and action processing for a session snapshot."""
+        with self._session_lock:
+            snapshot = ChampSelectSnapshot.from_session(session_data)
+            if snapshot.cell_id is None:
+                return False
+            
+            # Reset on new session (gameId, or a restarted counter when there is none)
+            current_session_id = session_data.get("gameId") or 0
+            counter = session_data.get("counter")
+            if not isinstance(counter, int):
+                counter = None
+            restarted = (not current_session_id and counter is not None and
+                         self._last_counter is not None and counter < self._last_counter)
+            if current_session_id != self._last_session_id or restarted:
+                self._reset_state()
+                self._last_session_id = current_session_id
+                logger.info("🔄 New champion select session detected")
+                logger.info(f"📋 Instalock: {'✅ ENABLED' if self.instalock.enabled else '❌ DISABLED'}")
+                logger.info(f"📋 Auto-ban: {'✅ ENABLED' if self.auto_ban.enabled else '❌ DISABLED'}")
+            elif counter is not None and self._last_counter is not None and counter < self._last_counter:
+                # Older than what we already handled (a poll that raced an event)
+                return True
+            
+            self._last_counter = counter
+            self._last_session = session_data
+            self._phase_deadline = self._get_phase_deadline(session_data)
+            
+            # Handle pre-hover
+            self._handle_pre_hover(snapshot)
+            
+            self._process_actions(self._actions_to_process(snapshot), snapshot)
+            self._open_action = any(self._is_open(action) for action in self._own_actions(snapshot))
+            return True
+    
     def _reset_state(self) -> None:
         """Reset session state."""
         self._last_session_id = None
+        self._last_counter = None
         self._processed_actions.clear()
+        self._action_states.clear()
+        self._last_session = None
+        self._open_action = False
         self._pre_hover_done = False
     
-    def _handle_pre_hover(self, session_data: dict) -> None:
+    def _get_phase_deadline(self, session_data: dict) -> Optional[float]:
+        """
+        Absolute monotonic deadline for requests made for this snapshot's phase.
+        
+        The timer is as of internalNowInEpochMs, not now: a re-polled or
+        re-sent unchanged session carries the same timer, so its age is
+        taken off the time left.
+        """
+        timer = session_data.get("timer", {})
+        time_left = timer.get("adjustedTimeLeftInPhase")
+        if not isinstance(time_left, (int, float)) or time_left <= 0:
+            return None
+        taken_at = timer.get("internalNowInEpochMs")
+        if isinstance(taken_at, (int, float)) and taken_at > 0:
+            time_left -= max(time.time() * 1000 - taken_at, 0)
+        return time.monotonic() + max(time_left / 1000 - PHASE_DEADLINE_MARGIN, 0.05)
+    
+    def _handle_pre_hover(self, snapshot: ChampSelectSnapshot) -> None:
         """Handle pre-ban hovering if enabled."""
         if not (self.options.pre_hover_enabled and 
                 self.instalock.enabled and 
@@ -537,40 +985,16 @@ class InstalockAutoban:
                 self.instalock.primary != "None"):
             return
         
-        # Get timer and phase info
-        timer = session_data.get("timer", {})
-        phase = timer.get("phase", "")
-        
-        # Check if we should hover based on phase
-        # We want to hover as soon as champion select starts, before bans
-        cell_id = self.session_handler.get_cell_id(session_data)
-        if cell_id is None:
-            return
-        
-        # Check if there's a pick action available for us (even if not in progress yet)
-        has_pick_action = False
-        for actions in session_data.get("actions", []):
-            if not isinstance(actions, list):
-                continue
-            
-            for action in actions:
-                if (action.get("actorCellId") == cell_id and
-                    action.get("type") == "pick" and
-                    not action.get("completed", False)):
-                    has_pick_action = True
-                    break
-            
-            if has_pick_action:
-                break
-        
-        # Only hover if we have a pick action available
-        if not has_pick_action:
+        # We want to hover as soon as champion select starts, before bans,
+        # but only if there's a pick action for us (even if not in progress yet)
+        pick_action = snapshot.my_pending_action("pick")
+        if pick_action is None:
             return
         
         # Get champion to hover
-        champ_id = self.selector.select_pick(self.instalock, session_data)
+        champ_id = self.selector.select_pick(self.instalock, snapshot)
         if champ_id != -1:
-            if self._hover_champion(champ_id):
+            if self._hover_champion(pick_action.get("id"), champ_id):
                 champ_name = self.instalock.primary
                 if champ_name == "Random":
                     champ_name = self.registry.get_name(champ_id)
@@ -579,114 +1003,109 @@ class InstalockAutoban:
             else:
                 logger.warning(f"⚠️ Failed to pre-hover champion")
     
-    def _hover_champion(self, champion_id: int) -> bool:
+    def _hover_champion(self, action_id: int, champion_id: int) -> bool:
         """
         Hover over a champion (show intent without locking).
         
         Args:
+            action_id: Local player's pick action, from the current snapshot
             champion_id: Champion ID to hover
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            response = self.session_handler.get_session()
-            
-            if not response:
-                return False
-            
-            cell_id = self.session_handler.get_cell_id(response)
-            
-            if cell_id is None:
-                return False
-            
-            # Find player's pick action
-            for actions in response.get("actions", []):
-                if not isinstance(actions, list):
-                    continue
-                
-                for action in actions:
-                    if (action.get("actorCellId") == cell_id and
-                        action.get("type") == "pick" and
-                        not action.get("completed", False)):
-                        
-                        action_id = action.get("id")
-                        
-                        # Hover (completed=False shows intent without locking)
-                        hover_response = self.rengar.lcu_request(
-                            "PATCH",
-                            f"/lol-champ-select/v1/session/actions/{action_id}",
-                            {"championId": champion_id, "completed": False}
-                        )
-                        
-                        if hover_response.status_code in [204, 200]:
-                            return True
-            
-            return False
+            # Hover (completed=False shows intent without locking)
+            hover_response = self.rengar.lcu_request(
+                "PATCH",
+                f"/lol-champ-select/v1/session/actions/{action_id}",
+                {"championId": champion_id, "completed": False},
+                deadline=self._phase_deadline
+            )
+            return hover_response.status_code in [204, 200]
             
         except Exception as e:
             logger.error(f"❌ Error hovering champion: {e}")
             return False
     
-    def _process_actions(self, session_data: dict, cell_id: int) -> None:
-        """Process champion select actions."""
-        for actions in session_data.get("actions", []):
-            if not isinstance(actions, list):
+    def _own_actions(self, snapshot: ChampSelectSnapshot) -> List[dict]:
+        return [action for (cell_id, _), actions in snapshot.actions.items()
+                if cell_id == snapshot.cell_id for action in actions]
+    
+    def _is_open(self, action: dict) -> bool:
+        """Our turn, and not completed by anyone yet."""
+        return (action.get("isInProgress", False) and not action.get("completed", False) and
+                action.get("id") not in self._processed_actions)
+    
+    def _actions_to_process(self, snapshot: ChampSelectSnapshot) -> List[dict]:
+        """
+        Own actions whose state differs from the previous snapshot, plus
+        every open one.
+        
+        Open actions are handed back on every snapshot, unchanged or not:
+        a failed request, a champion that was unavailable, or a feature
+        switched on mid-turn must not leave the turn to time out.
+        """
+        selected = []
+        for action in self._own_actions(snapshot):
+            action_id = action.get("id")
+            state = (action.get("isInProgress", False), action.get("completed", False), action.get("championId"))
+            changed = self._action_states.get(action_id) != state
+            self._action_states[action_id] = state
+            if changed or self._is_open(action):
+                selected.append(action)
+        return selected
+    
+    def _process_actions(self, actions: List[dict], snapshot: ChampSelectSnapshot) -> None:
+        """Process the selected champion select actions; each one is completed at most once."""
+        for action in actions:
+            action_id = action.get("id")
+            action_type = action.get("type")
+            is_in_progress = action.get("isInProgress", False)
+            is_completed = action.get("completed", False)
+            
+            # Debug logging
+            logger.debug(f"🔍 Action {action_id}: type={action_type}, inProgress={is_in_progress}, completed={is_completed}")
+            
+            # Skip if already processed or completed
+            if action_id in self._processed_actions:
                 continue
             
-            for action in actions:
-                # Only process our own actions
-                if action.get("actorCellId") != cell_id:
-                    continue
-                
-                action_id = action.get("id")
-                action_type = action.get("type")
-                is_in_progress = action.get("isInProgress", False)
-                is_completed = action.get("completed", False)
-                
-                # Debug logging
-                logger.debug(f"🔍 Action {action_id}: type={action_type}, inProgress={is_in_progress}, completed={is_completed}")
-                
-                # Skip if already processed or completed
-                if action_id in self._processed_actions:
-                    continue
-                
-                if is_completed:
-                    self._processed_actions.add(action_id)
-                    continue
-                
-                # Check if action is available (isInProgress=True means it's our turn)
-                if not is_in_progress:
-                    continue
-                
-                # Process based on action type and enabled features
-                if action_type == "pick":
-                    if self.instalock.enabled:
-                        logger.info("🎯 Processing PICK action")
-                        self._execute_pick(action_id, session_data)
-                    else:
-                        logger.debug("⏭️ Skipping pick - instalock disabled")
-                        
-                elif action_type == "ban":
-                    if self.auto_ban.enabled:
-                        logger.info("🎯 Processing BAN action")
-                        self._execute_ban(action_id, session_data, cell_id)
-                    else:
-                        logger.debug("⏭️ Skipping ban - auto-ban disabled")
-    
-    def _execute_pick(self, action_id: int, session_data: dict) -> None:
+            if is_completed:
+                self._processed_actions.add(action_id)
+                continue
+            
+            # Check if action is available (isInProgress=True means it's our turn)
+            if not is_in_progress:
+                continue
+            
+            # Process based on action type and enabled features
+            if action_type == "pick":
+                if self.instalock.enabled:
+                    logger.info("🎯 Processing PICK action")
+                    self._execute_pick(action_id, snapshot)
+                else:
+                    logger.debug("⏭️ Skipping pick - instalock disabled")
+                    
+            elif action_type == "ban":
+                if self.auto_ban.enabled:
+                    logger.info("🎯 Processing BAN action")
+                    self._execute_ban(action_id, snapshot)
+                else:
+                    logger.debug("⏭️ Skipping ban - auto-ban disabled")
+    
+    def _execute_pick(self, action_id: int, snapshot: ChampSelectSnapshot) -> None:
         """Execute pick action."""
-        champ_id = self.selector.select_pick(self.instalock, session_data)
+        champ_id = self.selector.select_pick(self.instalock, snapshot)
         if champ_id != -1:
             self._complete_action(action_id, champ_id, "pick")
     
-    def _execute_ban(self, action_id: int, session_data: dict, cell_id: int) -> None:
+    def _execute_ban(self, action_id: int, snapshot: ChampSelectSnapshot) -> None:
         """Execute ban action."""
         logger.info(f"🎯 Attempting to ban champion (action_id: {action_id})")
         champ_id = self.selector.select_ban(
             self.auto_ban, 
-            session_data, 
-            cell_id, 
+            snapshot, 
             self.options.avoid_ally_hovers
         )
         if champ_id != -1:
@@ -700,7 +1119,8 @@ class InstalockAutoban:
             response = self.rengar.lcu_request(
                 "PATCH",
                 f"/lol-champ-select/v1/session/actions/{action_id}",
-                {"completed": True, "championId": champion_id}
+                {"completed": True, "championId": champion_id},
+                deadline=self._phase_deadline
             )
             
             if response.status_code in [204, 200]:
@@ -771,9 +1191,11 @@ class InstalockAutoban:
             },
             "monitor": {
                 "running": self.is_running,
+                "mode": self.mode,
                 "thread_alive": self.monitor_thread.is_alive() if self.monitor_thread else False
             },
-            "champions_loaded": len(self.registry._champ_dict)
+            "champions_loaded": len(self.registry.get_all_ids()),
+            "champions_patch": self.registry.version
         }
     
     def __del__(self):
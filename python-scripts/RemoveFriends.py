@@ -2,12 +2,11 @@ from time import sleep
 
 from termcolor import colored
 
-from Rengar import Rengar
+from Rengar import get_client
 
-rengar = Rengar()
 
-
-def remove_all_friends():
+def remove_all_friends(rengar=None):
+    rengar = rengar or get_client()
     try:
         response = rengar.lcu_request("GET", "/lol-chat/v1/friends", "")
 
@@ -19,24 +18,13 @@ def remove_all_friends():
                 input("\nPress Enter.")
                 return
 
-            removed_count = 0
-            failed_count = 0
-
-            for friend in friends:
-                friend_id = friend.get("pid")
-
-                try:
-                    delete_response = rengar.lcu_request(
-                        "DELETE", f"/lol-chat/v1/friends/{friend_id}", ""
-                    )
-
-                    if delete_response.status_code in [200, 204]:
-                        removed_count += 1
-                    else:
-                        failed_count += 1
-
-                except Exception as e:
-                    failed_count += 1
+            results = rengar.lcu_batch(
+                [("DELETE", f"/lol-chat/v1/friends/{friend.get('pid')}") for friend in friends]
+            )
+            removed_count = sum(
+                1 for result in results if result.ok and result.status_code in [200, 204]
+            )
+            failed_count = len(results) - removed_count
 
             print(colored(f"\nRemoved {removed_count} friend(s)", "green"))
             if failed_count > 0:
@@ -4,49 +4,201 @@ import psutil
 import requests
 import base64
 import json
+import os
+import random
+import threading
 import urllib3
-from time import sleep
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from time import monotonic, perf_counter, sleep
 
 urllib3.disable_warnings()
 
 
+LOCKFILE_ENV = 'LTK_LEAGUE_LOCKFILE'
+RIOT_LOCKFILE_ENV = 'LTK_RIOT_LOCKFILE'
+DEFAULT_INSTALL_DIRS = (
+    r'C:\Riot Games\League of Legends',
+    '/Applications/League of Legends.app/Contents/LoL',
+)
+
+ClientCredentials = namedtuple(
+    'ClientCredentials',
+    ['pid', 'league_port', 'league_token', 'riot_port', 'riot_token', 'install_dir']
+)
+
+_lockfile_path = None
+_riot_lockfile_path = None
+_credentials_cache = None
+_credentials_lock = threading.Lock()
+
+
+def set_lockfile_path(path):
+    """Point discovery at a known League lockfile (or install directory)."""
+    global _lockfile_path, _credentials_cache
+    if path and os.path.isdir(path):
+        path = os.path.join(path, 'lockfile')
+    with _credentials_lock:
+        _lockfile_path = path
+        _credentials_cache = None
+
+
+def set_riot_lockfile_path(path):
+    """Point discovery at a known Riot Client lockfile."""
+    global _riot_lockfile_path, _credentials_cache
+    with _credentials_lock:
+        _riot_lockfile_path = path
+        _credentials_cache = None
+
+
+def read_lockfile(path):
+    """Parse a Riot lockfile ('name:pid:port:password:protocol') into (pid, port, token)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            parts = f.read().strip().split(':')
+    except OSError:
+        return None
+    if len(parts) != 5:
+        return None
+    try:
+        pid = int(parts[1])
+    except ValueError:
+        return None
+    return pid, parts[2], parts[3]
+
+
+def riot_client_lockfile_path():
+    override = _riot_lockfile_path or os.environ.get(RIOT_LOCKFILE_ENV)
+    if override:
+        return override
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA', '')
+    else:
+        base = os.path.expanduser('~/Library/Application Support')
+    return os.path.join(base, 'Riot Games', 'Riot Client', 'Config', 'lockfile')
+
+
+def _league_lockfile_candidates():
+    candidates = [_lockfile_path, os.environ.get(LOCKFILE_ENV)]
+    cached = _credentials_cache
+    if cached and cached.install_dir:
+        candidates.append(os.path.join(cached.install_dir, 'lockfile'))
+    candidates.extend(os.path.join(d, 'lockfile') for d in DEFAULT_INSTALL_DIRS)
+    return [c for c in candidates if c]
+
+
+def credentials_from_lockfiles():
+    """Read LCU (and, if present, Riot Client) credentials from lockfiles."""
+    for path in _league_lockfile_candidates():
+        league = read_lockfile(path)
+        # A crashed client leaves its lockfile behind, so check the owner
+        if league is None or not psutil.pid_exists(league[0]):
+            continue
+        pid, port, token = league
+        riot_port = riot_token = None
+        riot = read_lockfile(riot_client_lockfile_path())
+        if riot is not None and psutil.pid_exists(riot[0]):
+            riot_port, riot_token = riot[1], riot[2]
+        return ClientCredentials(pid, port, token, riot_port, riot_token, os.path.dirname(path))
+    return None
+
+
+LEAGUE_UX_PROCESS_NAMES = ('LeagueClientUx.exe', 'LeagueClientUx')
+
+
+def parse_client_cmdline(pid, cmdline):
+    """Build ClientCredentials from a LeagueClientUx command line, or None."""
+    args = {}
+    for arg in cmdline or []:
+        if arg.startswith('--') and '=' in arg:
+            key, _, value = arg[2:].partition('=')
+            args[key] = value
+    if not (args.get('app-port') and args.get('remoting-auth-token')):
+        return None
+    return ClientCredentials(
+        pid,
+        args['app-port'],
+        args['remoting-auth-token'],
+        args.get('riotclient-app-port'),
+        args.get('riotclient-auth-token'),
+        args.get('install-directory'),
+    )
+
+
+def scan_client_processes(processes=None):
+    """
+    Find the LeagueClientUx process and read all credentials in one pass.
+
+    Only the process name is fetched for every process; the command line,
+    which is far more expensive to read, is fetched for exact name matches
+    only. LeagueClientUxRender helpers are skipped.
+    """
+    if processes is None:
+        processes = psutil.process_iter(['name'])
+    for proc in processes:
+        if proc.info.get('name') not in LEAGUE_UX_PROCESS_NAMES:
+            continue
+        try:
+            cmdline = proc.cmdline()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+        creds = parse_client_cmdline(proc.pid, cmdline)
+        if creds is not None:
+            return creds
+    return None
+
+
+def discover_credentials(refresh=False):
+    """
+    LCU and Riot credentials for the running client, or None.
+
+    Results are cached with the owning PID and reused until that process
+    exits. Lockfiles are tried first; the process scan is the fallback.
+    """
+    global _credentials_cache
+    with _credentials_lock:
+        cached = _credentials_cache
+        if cached is not None and not refresh and psutil.pid_exists(cached.pid):
+            return cached
+
+        creds = credentials_from_lockfiles()
+        if creds is None or not (creds.riot_port and creds.riot_token):
+            scanned = scan_client_processes()
+            if scanned is not None:
+                if creds is None:
+                    creds = scanned
+                else:
+                    creds = creds._replace(riot_port=scanned.riot_port, riot_token=scanned.riot_token)
+
+        _credentials_cache = creds
+        return creds
+
+
 def find_league_client_credentials():
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        if proc.info['name'] == 'LeagueClientUx.exe':
-            cmdline = proc.info['cmdline']
-            port = None
-            token = None
-            for arg in cmdline:
-                if arg.startswith('--app-port='):
-                    port = arg.split('=')[1]
-                elif arg.startswith('--remoting-auth-token='):
-                    token = arg.split('=')[1]
-            if port and token:
-                return port, token
-    return None, None
-
-def check_league_client():
+    creds = discover_credentials()
+    if creds is None:
+        return None, None
+    return creds.league_port, creds.league_token
+
+def check_league_client(timeout=None):
+    """Wait for the League client; returns (None, None) if timeout seconds pass first."""
+    deadline = None if timeout is None else monotonic() + timeout
     while True:
         port_check, token_check = find_league_client_credentials()
         if port_check == None and token_check == None:
+            if deadline is not None and monotonic() >= deadline:
+                return None, None
             sleep(0.5)
         else:
             return port_check, token_check
 
 
 def find_riot_client_credentials():
-    port = None
-    token = None
-    for process in psutil.process_iter(attrs=['pid', 'name', 'cmdline']):
-        if 'LeagueClientUx' in process.info['name']:
-            for arg in process.info['cmdline']:
-                if '--riotclient-auth-token=' in arg:
-                    token = arg.split('=')[1]
-                if '--riotclient-app-port=' in arg:
-                    port = arg.split('=')[1]
-            if token and port:
-                break
-    return port, token
+    creds = discover_credentials()
+    if creds is None:
+        return None, None
+    return creds.riot_port, creds.riot_token
 
 
 def return_lcu_url(leaguePort):
@@ -77,22 +229,448 @@ def return_lcu_headers(leagueToken):
     return headers
 
 
-class Rengar:
+DEFAULT_POOL_SIZE = 4
+HTTP_METHODS = ('GET', 'POST', 'PUT', 'DELETE', 'PATCH')
+
+# Seconds. The client is on localhost, so connecting is either instant or
+# not going to happen; the read timeout is what bounds a stalled endpoint.
+CONNECT_TIMEOUT = 1.0
+DEFAULT_TIMEOUT = 5.0
+# First matching (method, endpoint prefix) wins; method None matches any.
+ENDPOINT_TIMEOUTS = [
+    ('PATCH', '/lol-champ-select/v1/session/actions/', 1.5),
+    (None, '/lol-champ-select/', 2.0),
+    (None, '/lol-matchmaking/v1/ready-check', 2.0),
+    (None, '/lol-lobby/v2/lobby/matchmaking/search-state', 2.0),
+    (None, '/lol-gameflow/', 2.0),
+    (None, '/riotclient/kill-and-restart-ux', 10.0),
+]
+
+
+def default_timeout(method, endpoint):
+    for rule_method, prefix, timeout in ENDPOINT_TIMEOUTS:
+        if (rule_method is None or rule_method == method) and endpoint.startswith(prefix):
+            return timeout
+    return DEFAULT_TIMEOUT
+
+
+# Request priorities. Critical requests use a reserved connection and never
+# queue; normal requests are admitted ahead of bulk ones.
+PRIORITY_CRITICAL = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BULK = 2
+
+ENDPOINT_PRIORITIES = [
+    ('PATCH', '/lol-champ-select/v1/session/actions/', PRIORITY_CRITICAL),
+    ('GET', '/lol-lobby/v2/lobby/matchmaking/search-state', PRIORITY_BULK),
+    ('DELETE', '/lol-chat/v1/friends/', PRIORITY_BULK),
+]
+
+
+def default_priority(method, endpoint):
+    for rule_method, prefix, priority in ENDPOINT_PRIORITIES:
+        if (rule_method is None or rule_method == method) and endpoint.startswith(prefix):
+            return priority
+    return PRIORITY_NORMAL
+
+
+def build_session(headers, pool_size=DEFAULT_POOL_SIZE, keep_alive=True):
+    """Create a pooled HTTPS session bound to one client's credentials."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.headers.update(headers)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    # The LCU only listens on localhost, so proxy and CA-bundle environment
+    # settings must not leak into these sessions.
+    session.trust_env = False
+    session.verify = False
+    return session
+
+
+class LCUUnavailableError(requests.exceptions.ConnectionError):
+    """The client could not be reached within the retry policy, or its circuit is open."""
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """The caller's deadline passed before a response arrived."""
+
+
+class RetryPolicy:
+    """Bounded retries with exponential backoff and jitter."""
+
+    def __init__(self, max_attempts=3, base_delay=0.2, max_delay=2.0, jitter=0.5):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt):
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1 - self.jitter * random.random())
+
+    def as_dict(self):
+        return {
+            'max_attempts': self.max_attempts,
+            'base_delay': self.base_delay,
+            'max_delay': self.max_delay,
+            'jitter': self.jitter,
+        }
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a client is known to be down.
+
+    After failure_threshold consecutive failed calls the circuit opens and
+    requests are rejected immediately. Once reset_timeout has passed a
+    single probe request is let through (half-open); its outcome closes or
+    re-opens the circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=2, reset_timeout=3.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            # A probe that never reports back (e.g. the caller's deadline ran
+            # out) must not wedge the circuit, so half-open also times out.
+            if monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self.opened_at = monotonic()
+                return True
+            return False
+
+    def retry_in(self):
+        if self.state == self.CLOSED:
+            return 0.0
+        return max(0.0, self.reset_timeout - (monotonic() - self.opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = monotonic()
+
+    def status(self):
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'retry_in': round(self.retry_in(), 2),
+        }
+
+
+class BatchResult:
+    """Outcome of one lcu_batch item: a response, or the exception it raised."""
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def status_code(self):
+        return self.response.status_code if self.response is not None else None
+
+
+class RequestScheduler:
+    """
+    Admits normal and bulk LCU requests onto the shared pool.
+
+    slots bounds how many non-critical requests are in flight at once; bulk
+    requests may hold at most bulk_slots of them and only start when no
+    normal request is waiting. Critical requests bypass the scheduler.
+    """
+
+    def __init__(self, slots, bulk_slots=None):
+        self.slots = max(1, slots)
+        self.bulk_slots = max(1, bulk_slots if bulk_slots is not None else self.slots // 2)
+        self._cond = threading.Condition()
+        self._active = 0
+        self._active_bulk = 0
+        self._normal_waiting = 0
+
+    def acquire(self, priority, timeout=None):
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._cond:
+            bulk = priority == PRIORITY_BULK
+            if not bulk:
+                self._normal_waiting += 1
+            try:
+                while not self._can_start(bulk):
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                self._active += 1
+                if bulk:
+                    self._active_bulk += 1
+                return True
+            finally:
+                if not bulk:
+                    self._normal_waiting -= 1
+
+    def _can_start(self, bulk):
+        if self._active >= self.slots:
+            return False
+        if bulk:
+            return self._normal_waiting == 0 and self._active_bulk < self.bulk_slots
+        return True
+
+    def release(self, priority):
+        with self._cond:
+            self._active -= 1
+            if priority == PRIORITY_BULK:
+                self._active_bulk -= 1
+            self._cond.notify_all()
+
+    def status(self):
+        with self._cond:
+            return {
+                'active': self._active,
+                'active_bulk': self._active_bulk,
+                'normal_waiting': self._normal_waiting,
+            }
+
+
+class _Call:
     def __init__(self):
-        self.update_league_credentials()
-        self.update_riot_credentials()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
 
-    def update_league_credentials(self):
-        self.leaguePort, self.leagueToken = find_league_client_credentials()
-        self.leagueUrl = return_lcu_url(self.leaguePort)
-        self.leagueHeaders = return_lcu_headers(self.leagueToken)
 
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls.
+
+    The first caller for a key runs the function; callers that arrive while
+    it is in flight wait and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key, fn, wait_timeout=None):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.done.wait(wait_timeout):
+                raise DeadlineExceeded(f'Deadline exceeded waiting for in-flight {key}')
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class Rengar:
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, keep_alive=True, retry_policy=None,
+                 failure_threshold=2, reset_timeout=3.0, cache=False, coalesce=True,
+                 prioritize=True, rate_limit=True, metrics=True, transport=None):
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.league_breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.riot_breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._inflight = SingleFlight() if coalesce else None
+        self.scheduler = RequestScheduler(pool_size) if prioritize else None
+        self.leaguePort = self.leagueToken = None
+        self.riotPort = self.riotToken = None
+        self.leagueSession = None
+        self.leagueCriticalSession = None
+        self.riotSession = None
+        self._events = None
+        self.cache = None
+        self._cache_subscriptions = []
+        self.rate_limiter = None
+        self.metrics = None
+        # A transport (e.g. RengarRecord.ReplayTransport) replaces discovery,
+        # HTTP and the event stream; None talks to the real client.
+        self.transport = transport
+        self.recorder = None
+        if metrics:
+            self.enable_metrics()
+        self.update_credentials()
+        if cache:
+            self.enable_cache()
+        if rate_limit:
+            self.enable_rate_limits()
+
+    def update_credentials(self, refresh=False):
+        """Refresh LCU and Riot credentials from a single discovery pass."""
+        if self.transport is not None:
+            creds = self.transport.credentials(refresh)
+        else:
+            creds = discover_credentials(refresh)
+        if creds is None:
+            self.set_league_credentials(None, None)
+            self.set_riot_credentials(None, None)
+        else:
+            self.set_league_credentials(creds.league_port, creds.league_token)
+            self.set_riot_credentials(creds.riot_port, creds.riot_token)
 
+    def update_league_credentials(self):
+        self.set_league_credentials(*find_league_client_credentials())
 
     def update_riot_credentials(self):
-        self.riotPort, self.riotToken = find_riot_client_credentials()
+        self.set_riot_credentials(*find_riot_client_credentials())
+
+    def set_league_credentials(self, port, token):
+        # The pool is only rebuilt when the client actually restarted,
+        # so a refresh with unchanged credentials keeps warm connections.
+        if self.leagueSession is not None and (port, token) == (self.leaguePort, self.leagueToken):
+            return
+        self.leaguePort, self.leagueToken = port, token
+        self.leagueUrl = return_lcu_url(self.leaguePort)
+        self.leagueHeaders = return_lcu_headers(self.leagueToken)
+        if self.leagueSession is not None:
+            self.leagueSession.close()
+        self.leagueSession = build_session(self.leagueHeaders, self.pool_size, self.keep_alive)
+        if self.leagueCriticalSession is not None:
+            self.leagueCriticalSession.close()
+        # One reserved keep-alive connection for pick/ban writes
+        self.leagueCriticalSession = build_session(self.leagueHeaders, 1, self.keep_alive)
+        if self.cache is not None:
+            self.cache.clear()
+
+    def set_riot_credentials(self, port, token):
+        if self.riotSession is not None and (port, token) == (self.riotPort, self.riotToken):
+            return
+        self.riotPort, self.riotToken = port, token
         self.riotUrl = return_riot_url(self.riotPort)
         self.riotHeaders = return_riot_headers(self.riotToken)
+        if self.riotSession is not None:
+            self.riotSession.close()
+        self.riotSession = build_session(self.riotHeaders, self.pool_size, self.keep_alive)
+
+    @property
+    def event_stream(self):
+        if self._events is None:
+            if self.transport is not None:
+                self._events = self.transport.event_stream(self)
+            else:
+                from RengarEvents import EventStream
+                self._events = EventStream(self)
+        return self._events
+
+    def subscribe(self, uri_prefix, callback):
+        """Call callback(event) for every OnJsonApiEvent whose uri starts with uri_prefix."""
+        return self.event_stream.subscribe(uri_prefix, callback)
+
+    def events(self, uri_prefix, maxsize=0):
+        """Blocking iterator over OnJsonApiEvent payloads whose uri starts with uri_prefix."""
+        return self.event_stream.events(uri_prefix, maxsize)
+
+    def enable_cache(self, rules=None, max_entries=256, invalidate_on_events=True):
+        """
+        Cache idempotent LCU GETs (see RengarCache.DEFAULT_CACHE_RULES).
+
+        Entries expire by TTL, are dropped when credentials change or a write
+        hits a related endpoint, and, with invalidate_on_events, when the LCU
+        pushes an event for a related URI.
+        """
+        from RengarCache import ResponseCache
+        self.disable_cache()
+        self.cache = ResponseCache(rules, max_entries)
+        if invalidate_on_events:
+            prefixes = {prefix for rule in self.cache.rules for prefix in rule.invalidate_on}
+            self._cache_subscriptions = [self.subscribe(prefix, self.cache.on_event) for prefix in sorted(prefixes)]
+        return self.cache
+
+    def disable_cache(self):
+        for subscription in self._cache_subscriptions:
+            subscription.unsubscribe()
+        self._cache_subscriptions = []
+        self.cache = None
+
+    def enable_rate_limits(self, rules=None):
+        """
+        Pace LCU requests per endpoint (see RengarLimits.DEFAULT_RATE_LIMITS).
+
+        Limits adapt to 429 responses and Retry-After; critical requests
+        are never delayed.
+        """
+        from RengarLimits import RateLimiter
+        self.rate_limiter = RateLimiter(rules)
+        return self.rate_limiter
+
+    def disable_rate_limits(self):
+        self.rate_limiter = None
+
+    def enable_metrics(self):
+        """Record per-endpoint counts, statuses, retries and latency (see RengarMetrics)."""
+        from RengarMetrics import RequestMetrics
+        if self.metrics is None:
+            self.metrics = RequestMetrics()
+        return self.metrics
+
+    def disable_metrics(self):
+        self.metrics = None
+
+    def start_recording(self, path, events=True):
+        """
+        Append every HTTP exchange (and, with events, every LCU event) to
+        path; see RengarRecord for the format and ReplayTransport to play
+        it back.
+        """
+        from RengarRecord import Recorder
+        self.stop_recording()
+        self.recorder = Recorder(path)
+        if events:
+            self.event_stream.start()
+        return self.recorder
+
+    def stop_recording(self):
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.close()
+
+    def close(self):
+        self.stop_recording()
+        if self._events is not None:
+            self._events.stop()
+        for session in (self.leagueSession, self.leagueCriticalSession, self.riotSession):
+            if session is not None:
+                session.close()
 
     def return_lcu_creds(self):
         return self.leaguePort, self.leagueToken, self.leagueUrl
@@ -100,60 +678,235 @@ class Rengar:
     def return_riot_creds(self):
         return self.riotPort, self.riotToken, self.riotUrl
 
-    def lcu_request(self, method, endpoint, body: dict):
-        method = method.upper()
-        url = f'{self.leagueUrl}{endpoint}'
-        if body == "":
-            body = None
-        elif body is not None:
-            body = json.dumps(body)
+    def _send(self, target, session, method, base_url, endpoint, body, timeout=None, headers=None):
+        if self.transport is not None:
+            return self.transport.send(target, method, endpoint, body, timeout)
+        url = f'{base_url}{endpoint}'
+        recorder = self.recorder
+        if recorder is None:
+            return session.request(method, url, data=body, headers=headers, verify=False, timeout=timeout)
+        started = monotonic()
+        try:
+            response = session.request(method, url, data=body, headers=headers, verify=False, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            recorder.record_exchange(target, method, endpoint, body, started, error=e)
+            raise
+        recorder.record_exchange(target, method, endpoint, body, started, response=response)
+        return response
+
+    def status(self):
+        """Connection and circuit-breaker state, safe to poll from the UI."""
+        return {
+            'league': dict(self.league_breaker.status(), port=self.leaguePort),
+            'riot': dict(self.riot_breaker.status(), port=self.riotPort),
+            'retry_policy': self.retry_policy.as_dict(),
+            'cache': self.cache.stats() if self.cache is not None else None,
+            'coalesced_requests': self._inflight.coalesced if self._inflight is not None else 0,
+            'scheduler': self.scheduler.status() if self.scheduler is not None else None,
+            'rate_limits': self.rate_limiter.stats() if self.rate_limiter is not None else None,
+            'metrics_enabled': self.metrics is not None,
+            'recording': self.recorder.path if self.recorder is not None else None,
+            'replay': self.transport.path if self.transport is not None else None,
+        }
 
+    def _request(self, target, method, endpoint, body, timeout=None, deadline=None, priority=None):
+        metrics = self.metrics
+        cache = self.cache if target == 'league' else None
+        etag = None
+        if cache is not None and method.upper() == 'GET':
+            cached, etag = cache.lookup(endpoint)
+            if cached is not None:
+                # Counted apart, so latency percentiles only cover real requests
+                if metrics is not None:
+                    metrics.record_cached(target, method, endpoint)
+                return cached
+        if metrics is None:
+            return self._request_with_retries(target, method, endpoint, body, timeout, deadline, priority, etag)
+        started = perf_counter()
         try:
-            if method == "GET":
-                req = requests.get(url, headers=self.leagueHeaders, data=body, verify=False)
-            elif method == "POST":
-                req = requests.post(url, headers=self.leagueHeaders, data=body, verify=False)
-            elif method == "PUT":
-                req = requests.put(url, headers=self.leagueHeaders, data=body, verify=False)
-            elif method == "DELETE":
-                req = requests.delete(url, headers=self.leagueHeaders, data=body, verify=False)
-            elif method == "PATCH":
-                req = requests.patch(url, headers=self.leagueHeaders, data=body, verify=False)
-            else:
-                raise ValueError('Invalid method')
+            response = self._request_with_retries(target, method, endpoint, body, timeout, deadline, priority, etag)
+        except Exception as e:
+            metrics.record(target, method, endpoint, perf_counter() - started, error=e)
+            raise
+        metrics.record(target, method, endpoint, perf_counter() - started, status=response.status_code)
+        return response
 
-            return req
-        except requests.exceptions.RequestException as e:
-            check_league_client()
-            self.update_league_credentials()
-            req = self.lcu_request(method, endpoint, body)
-            return req
+    def _request_with_retries(self, target, method, endpoint, body, timeout=None, deadline=None, priority=None,
+                              etag=None):
+        """
+        Send a request with retries.
 
-    def riot_request(self, method, endpoint, body: dict):
+        timeout bounds each attempt (defaults per endpoint, see
+        ENDPOINT_TIMEOUTS). deadline is an absolute time.monotonic() value
+        that bounds the whole call, retries and backoff included.
+        priority is one of the PRIORITY_* constants (default per endpoint,
+        see ENDPOINT_PRIORITIES). A 429 is retried once the rate limiter
+        allows it; the last 429 is returned if attempts run out. etag is a
+        stale cache entry's validator, sent as If-None-Match.
+        """
         method = method.upper()
-        url = f'{self.riotUrl}{endpoint}'
+        if method not in HTTP_METHODS:
+            raise ValueError('Invalid method')
         if body == "":
             body = None
-        
-        if body is not None:
+        elif body is not None:
             body = json.dumps(body)
 
-        try:
-            if method == "GET":
-                req = requests.get(url, headers=self.riotHeaders, data=body, verify=False)
-            elif method == "POST":
-                req = requests.post(url, headers=self.riotHeaders, data=body, verify=False)
-            elif method == "PUT":
-                req = requests.put(url, headers=self.riotHeaders, data=body, verify=False)
-            elif method == "DELETE":
-                req = requests.delete(url, headers=self.riotHeaders, data=body, verify=False)
-            elif method == "PATCH":
-                req = requests.patch(url, headers=self.riotHeaders, data=body, verify=False)
+        cache = self.cache if target == 'league' else None
+        conditional = {'If-None-Match': etag} if cache is not None and etag else None
+
+        breaker = self.league_breaker if target == 'league' else self.riot_breaker
+        if not breaker.allow():
+            raise LCUUnavailableError(f'{target} client unavailable, retrying in {breaker.retry_in():.1f}s')
+
+        if timeout is None:
+            timeout = default_timeout(method, endpoint)
+        if priority is None:
+            priority = default_priority(method, endpoint)
+        scheduler = self.scheduler if target == 'league' and priority != PRIORITY_CRITICAL else None
+        limiter = self.rate_limiter if target == 'league' and priority != PRIORITY_CRITICAL else None
+
+        last_error = None
+        attempts = self.retry_policy.max_attempts
+        for attempt in range(attempts):
+            attempt_timeout = timeout
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceeded(f'Deadline exceeded for {method} {endpoint}') from last_error
+                attempt_timeout = min(timeout, remaining)
+            if attempt and self.metrics is not None:
+                self.metrics.record_retry(target, method, endpoint)
+
+            if target == 'league':
+                session, port, base_url = self.leagueSession, self.leaguePort, self.leagueUrl
+                if priority == PRIORITY_CRITICAL and self.scheduler is not None:
+                    session = self.leagueCriticalSession
             else:
-                raise ValueError('Invalid method')
+                session, port, base_url = self.riotSession, self.riotPort, self.riotUrl
 
-            return req
-        except requests.exceptions.RequestException as e:
-            check_league_client()
-            self.update_riot_credentials()
-            return self.riot_request(method, endpoint, body)
\ No newline at end of file
+            try:
+                if port is None:
+                    raise requests.exceptions.ConnectionError(f'{target} client credentials not found')
+                if limiter is not None:
+                    if not limiter.acquire(method, endpoint, None if deadline is None else deadline - monotonic()):
+                        raise DeadlineExceeded(f'Deadline exceeded waiting for rate limit on {method} {endpoint}')
+                if scheduler is not None:
+                    queued_at = monotonic()
+                    if not scheduler.acquire(priority, None if deadline is None else deadline - queued_at):
+                        raise DeadlineExceeded(f'Deadline exceeded queueing {method} {endpoint}')
+                    # Time spent queued comes out of this attempt's budget
+                    attempt_timeout = max(attempt_timeout - (monotonic() - queued_at), 0.05)
+                try:
+                    response = self._send(target, session, method, base_url, endpoint, body,
+                                          (min(CONNECT_TIMEOUT, attempt_timeout), attempt_timeout), conditional)
+                finally:
+                    if scheduler is not None:
+                        scheduler.release(priority)
+                breaker.record_success()
+                if limiter is not None:
+                    limiter.observe(method, endpoint, response)
+                    if response.status_code == 429 and attempt + 1 < attempts:
+                        # The limiter now holds the endpoint back; no backoff needed
+                        continue
+                if cache is not None:
+                    if method != 'GET':
+                        cache.invalidate(endpoint)
+                    elif response.status_code == 304 and conditional:
+                        return cache.revalidated(endpoint) or response
+                    else:
+                        cache.store(endpoint, response)
+                return response
+            except DeadlineExceeded:
+                # Rate limit or queue wait outlasted the caller's budget: the
+                # client is fine, so skip backoff, rediscovery and the breaker
+                raise
+            except requests.exceptions.RequestException as e:
+                last_error = e
+
+            if attempt + 1 < attempts:
+                backoff = self.retry_policy.delay(attempt)
+                if deadline is not None and monotonic() + backoff >= deadline:
+                    # No time left for another attempt; this is the caller's
+                    # budget running out, not evidence that the client is down.
+                    raise DeadlineExceeded(f'Deadline exceeded for {method} {endpoint}') from last_error
+                sleep(backoff)
+                # The client may have restarted on a new port/token
+                self.update_credentials(refresh=True)
+
+        if deadline is not None and monotonic() >= deadline and isinstance(last_error, requests.exceptions.Timeout):
+            raise DeadlineExceeded(f'Deadline exceeded for {method} {endpoint}') from last_error
+
+        breaker.record_failure()
+        raise LCUUnavailableError(f'{target} client unreachable after {attempts} attempt(s): {last_error}') from last_error
+
+    def _coalesced_request(self, target, method, endpoint, body, timeout, deadline, priority):
+        # Only body-less GETs are idempotent enough to share one HTTP call;
+        # every caller gets the same Response object.
+        if self._inflight is None or method.upper() != 'GET' or body not in ("", None):
+            return self._request(target, method, endpoint, body, timeout, deadline, priority)
+        wait_timeout = None if deadline is None else max(deadline - monotonic(), 0)
+        return self._inflight.do(
+            (target, endpoint),
+            lambda: self._request(target, method, endpoint, body, timeout, deadline, priority),
+            wait_timeout
+        )
+
+    def lcu_batch(self, requests_list, max_parallel=None, timeout=None, deadline=None,
+                  priority=PRIORITY_BULK):
+        """
+        Run independent LCU requests concurrently over the pooled session.
+
+        requests_list holds (method, endpoint) or (method, endpoint, body)
+        tuples. At most max_parallel (default and cap: the pool size) run at
+        once. Returns one BatchResult per item, in input order; an item that
+        fails does not affect the others. Batches default to bulk priority so
+        they never delay interactive or champ select requests; bulk requests
+        only get the scheduler's bulk_slots (half the pool by default), so
+        that is also the cap on max_parallel for a bulk batch.
+        """
+        items = [tuple(item) + ("",) * (3 - len(item)) for item in requests_list]
+        if not items:
+            return []
+
+        def run(item):
+            method, endpoint, body = item
+            try:
+                return BatchResult(self.lcu_request(method, endpoint, body, timeout, deadline, priority))
+            except Exception as e:
+                return BatchResult(error=e)
+
+        workers = min(max_parallel or self.pool_size, self.pool_size, len(items))
+        if priority == PRIORITY_BULK and self.scheduler is not None:
+            # More threads would only queue for a bulk slot
+            workers = min(workers, self.scheduler.bulk_slots)
+        if workers <= 1:
+            return [run(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="RengarBatch") as executor:
+            return list(executor.map(run, items))
+
+    def lcu_request(self, method, endpoint, body: dict, timeout=None, deadline=None, priority=None):
+        return self._coalesced_request('league', method, endpoint, body, timeout, deadline, priority)
+
+    def riot_request(self, method, endpoint, body: dict, timeout=None, deadline=None, priority=None):
+        return self._coalesced_request('riot', method, endpoint, body, timeout, deadline, priority)
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_client():
+    """Process-wide Rengar shared by every feature, created on first use."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = Rengar()
+        return _shared_client
+
+
+def set_client(client):
+    """Replace the shared client, e.g. with one pointed at another server."""
+    global _shared_client
+    with _shared_client_lock:
+        _shared_client = client
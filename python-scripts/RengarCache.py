@@ -0,0 +1,150 @@
+"""
+Opt-in response cache for idempotent LCU GETs.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+
+class CacheRule:
+    """
+    Caching policy for endpoints whose path fully matches pattern.
+
+    invalidate_on lists URI prefixes; a WebSocket event or a write request
+    on any of them drops the cached entries for this rule.
+    """
+
+    def __init__(self, pattern, ttl, invalidate_on=()):
+        self.pattern = re.compile(pattern)
+        self.ttl = ttl
+        self.invalidate_on = tuple(invalidate_on)
+
+    def matches(self, endpoint):
+        return self.pattern.fullmatch(endpoint) is not None
+
+    def invalidated_by(self, uri):
+        return any(uri.startswith(prefix) for prefix in self.invalidate_on)
+
+
+DEFAULT_CACHE_RULES = [
+    CacheRule(r'/riotclient/region-locale', 3600, ['/riotclient/region-locale']),
+    CacheRule(r'/lol-summoner/v1/current-summoner', 60,
+              ['/lol-summoner/v1/current-summoner', '/lol-summoner/v1/save-alias']),
+    CacheRule(r'/lol-summoner/v1/summoners/\d+', 300),
+    CacheRule(r'/lol-champ-select/v1/all-grid-champions', 300,
+              ['/lol-champ-select/v1/all-grid-champions', '/lol-champions/v1/inventories']),
+]
+
+
+class CacheEntry:
+    def __init__(self, response, rule):
+        self.response = response
+        self.rule = rule
+        self.expires_at = monotonic() + rule.ttl
+        self.etag = response.headers.get('ETag')
+
+    def fresh(self):
+        return monotonic() < self.expires_at
+
+    def refresh(self):
+        self.expires_at = monotonic() + self.rule.ttl
+
+
+class ResponseCache:
+    """LRU cache of successful GET responses with per-endpoint TTLs."""
+
+    def __init__(self, rules=None, max_entries=256):
+        self.rules = list(DEFAULT_CACHE_RULES if rules is None else rules)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def rule_for(self, endpoint):
+        for rule in self.rules:
+            if rule.matches(endpoint):
+                return rule
+        return None
+
+    def lookup(self, endpoint):
+        """
+        Return (response, etag) for a cached endpoint.
+
+        response is set on a fresh hit; etag is set when the entry is stale
+        but can be revalidated with If-None-Match.
+        """
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is None:
+                if self.rule_for(endpoint) is not None:
+                    self.misses += 1
+                return None, None
+            if entry.fresh():
+                self._entries.move_to_end(endpoint)
+                self.hits += 1
+                return entry.response, None
+            self.misses += 1
+            if entry.etag:
+                return None, entry.etag
+            del self._entries[endpoint]
+            return None, None
+
+    def revalidated(self, endpoint):
+        """A 304 came back: extend the stale entry and return its response."""
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is None:
+                return None
+            entry.refresh()
+            self._entries.move_to_end(endpoint)
+            self.revalidations += 1
+            return entry.response
+
+    def store(self, endpoint, response):
+        rule = self.rule_for(endpoint)
+        if rule is None or response.status_code != 200:
+            return
+        with self._lock:
+            self._entries[endpoint] = CacheEntry(response, rule)
+            self._entries.move_to_end(endpoint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, uri):
+        """Drop entries for the URI itself and for rules that list it."""
+        with self._lock:
+            stale = [
+                endpoint for endpoint, entry in self._entries.items()
+                if endpoint == uri or entry.rule.invalidated_by(uri)
+            ]
+            for endpoint in stale:
+                del self._entries[endpoint]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def on_event(self, event):
+        self.invalidate(event.get('uri', ''))
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'revalidations': self.revalidations,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
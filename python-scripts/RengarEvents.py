@@ -0,0 +1,221 @@
+"""
+LCU WebSocket (WAMP) event stream used by Rengar subscriptions.
+"""
+
+import json
+import logging
+import queue
+import random
+import ssl
+import threading
+
+logger = logging.getLogger(__name__)
+
+WAMP_SUBSCRIBE = 5
+WAMP_UNSUBSCRIBE = 6
+WAMP_EVENT = 8
+JSON_API_EVENT = 'OnJsonApiEvent'
+
+
+class Subscription:
+    """Callback registered for every event whose URI starts with a prefix."""
+
+    def __init__(self, stream, prefix, callback):
+        self.stream = stream
+        self.prefix = prefix
+        self.callback = callback
+
+    def matches(self, uri):
+        return uri.startswith(self.prefix)
+
+    def unsubscribe(self):
+        self.stream.unsubscribe(self)
+
+
+class EventIterator(Subscription):
+    """Blocking iterator over matching events."""
+
+    def __init__(self, stream, prefix, maxsize=0):
+        self._queue = queue.Queue(maxsize)
+        self._closed = False
+        super().__init__(stream, prefix, self._put)
+
+    def _put(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            logger.warning(f"Dropping event for {event.get('uri')}: consumer too slow")
+
+    def get(self, timeout=None):
+        """Next event, or None when the timeout expires or the iterator is closed."""
+        if self._closed:
+            return None
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self._closed = True
+        self.unsubscribe()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            # Nothing is blocked on a full queue; get() checks _closed first
+            pass
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        event = self.get()
+        if event is None:
+            raise StopIteration
+        return event
+
+
+class EventStream:
+    """
+    One WebSocket connection to the LCU, fanned out to prefix subscriptions.
+
+    The connection is opened lazily on the first subscription and is
+    re-established with exponential backoff whenever it drops, refreshing
+    the owning Rengar's credentials before each reconnect.
+    """
+
+    def __init__(self, rengar, reconnect_delay=0.5, max_reconnect_delay=5.0):
+        self.rengar = rengar
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._subscriptions = []
+        self._lock = threading.Lock()
+        self._ws = None
+        self._thread = None
+        self._running = False
+        self._stop_event = threading.Event()
+        self._connected = threading.Event()
+
+    @property
+    def connected(self):
+        return self._connected.is_set()
+
+    def wait_connected(self, timeout=None):
+        return self._connected.wait(timeout)
+
+    def subscribe(self, prefix, callback):
+        subscription = Subscription(self, prefix, callback)
+        self._add(subscription)
+        return subscription
+
+    def events(self, prefix, maxsize=0):
+        iterator = EventIterator(self, prefix, maxsize)
+        self._add(iterator)
+        return iterator
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def _add(self, subscription):
+        with self._lock:
+            self._subscriptions.append(subscription)
+        self.start()
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True, name="LCUEventStream")
+            self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._stop_event.set()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def _connect(self):
+        import websocket
+
+        port, token = self.rengar.leaguePort, self.rengar.leagueToken
+        if not port or not token:
+            raise ConnectionError("League client credentials not available")
+
+        ws = websocket.WebSocket(sslopt={"cert_reqs": ssl.CERT_NONE, "check_hostname": False})
+        ws.connect(
+            f"wss://127.0.0.1:{port}/",
+            header=[f"Authorization: {self.rengar.leagueHeaders['Authorization']}"],
+            subprotocols=["wamp"],
+            suppress_origin=True,
+        )
+        ws.send(json.dumps([WAMP_SUBSCRIBE, JSON_API_EVENT]))
+        return ws
+
+    def _run(self):
+        delay = self.reconnect_delay
+        while self._running:
+            try:
+                self._ws = self._connect()
+                self._connected.set()
+                delay = self.reconnect_delay
+                logger.info("🔌 LCU event stream connected")
+                self._receive(self._ws)
+            except Exception as e:
+                if self._running:
+                    logger.debug(f"LCU event stream error: {e}")
+            finally:
+                self._connected.clear()
+                if self._ws is not None:
+                    try:
+                        self._ws.close()
+                    except Exception:
+                        pass
+                    self._ws = None
+
+            if not self._running:
+                break
+
+            # Jittered backoff, then pick up new credentials in case the
+            # client restarted on a different port.
+            if self._stop_event.wait(delay * (0.5 + random.random() / 2)):
+                break
+            delay = min(delay * 2, self.max_reconnect_delay)
+            try:
+                self.rengar.update_league_credentials()
+            except Exception as e:
+                logger.debug(f"Credential refresh failed: {e}")
+
+    def _receive(self, ws):
+        while self._running:
+            message = ws.recv()
+            if not message:
+                if not ws.connected:
+                    return
+                continue
+            try:
+                payload = json.loads(message)
+            except ValueError:
+                continue
+            if (isinstance(payload, list) and len(payload) >= 3 and
+                    payload[0] == WAMP_EVENT and isinstance(payload[2], dict)):
+                recorder = self.rengar.recorder
+                if recorder is not None:
+                    recorder.record_event(payload[2])
+                self._dispatch(payload[2])
+
+    def _dispatch(self, event):
+        uri = event.get("uri", "")
+        with self._lock:
+            targets = [s for s in self._subscriptions if s.matches(uri)]
+        for subscription in targets:
+            try:
+                subscription.callback(event)
+            except Exception as e:
+                logger.error(f"❌ Event callback for {subscription.prefix} failed: {e}")
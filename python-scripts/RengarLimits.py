@@ -0,0 +1,182 @@
+"""
+Client-side, per-endpoint rate limits for LCU requests.
+"""
+
+import re
+import threading
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep, time
+
+# Floor for an adapted rate, as a fraction of the configured one
+MIN_RATE_FRACTION = 1 / 16
+# Share of the configured rate won back per second of successful responses
+RECOVERY_PER_SECOND = 0.05
+# Longest Retry-After the limiter will honour
+MAX_RETRY_AFTER = 30.0
+
+
+class RateLimitRule:
+    """
+    Token bucket for endpoints whose path fully matches pattern.
+
+    rate is requests per second, burst the bucket size. methods restricts
+    the rule to some HTTP methods; None matches every method.
+    """
+
+    def __init__(self, pattern, rate, burst=1, methods=None):
+        self.pattern = re.compile(pattern)
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self.methods = None if methods is None else {m.upper() for m in methods}
+
+    def matches(self, method, endpoint):
+        if self.methods is not None and method not in self.methods:
+            return False
+        return self.pattern.fullmatch(endpoint) is not None
+
+
+DEFAULT_RATE_LIMITS = [
+    RateLimitRule(r'/lol-chat/v1/friends/[^/]+', 20, 5, ['DELETE']),
+    RateLimitRule(r'/lol-chat/v1/friend-requests/[^/]+', 10, 5, ['POST', 'DELETE']),
+    RateLimitRule(r'/lol-summoner/v1/summoners/\d+', 20, 10, ['GET']),
+    RateLimitRule(r'/lol-chat/v1/me', 5, 2, ['PUT']),
+    RateLimitRule(r'/lol-summoner/v1/current-summoner/icon', 5, 2, ['PUT']),
+]
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """
+    Adaptive token bucket.
+
+    A 429 halves the current rate (down to MIN_RATE_FRACTION of the
+    configured one) and pauses the bucket for Retry-After; successes then
+    win back RECOVERY_PER_SECOND of the configured rate per second, so the
+    rate settles just under what the client sustains.
+    """
+
+    def __init__(self, rate, burst):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self._updated = self._recovered = monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout=None):
+        """Take one token, waiting for it; False if it would take longer than timeout."""
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            with self._lock:
+                now = monotonic()
+                self._refill(now)
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return True
+                    wait = (1 - self.tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            now = monotonic()
+            if self.rate < self.max_rate:
+                recovered = self.max_rate * RECOVERY_PER_SECOND * (now - self._recovered)
+                self.rate = min(self.max_rate, self.rate + recovered)
+            self._recovered = now
+
+    def on_throttled(self, retry_after=None):
+        with self._lock:
+            now = monotonic()
+            self._refill(now)
+            self.throttled += 1
+            self._recovered = now
+            self.rate = max(self.rate / 2, self.max_rate * MIN_RATE_FRACTION)
+            self.tokens = 0.0
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def status(self):
+        with self._lock:
+            return {
+                'rate': round(self.rate, 2),
+                'max_rate': self.max_rate,
+                'throttled': self.throttled,
+                'blocked_for': round(max(self.blocked_until - monotonic(), 0.0), 2),
+            }
+
+
+class RateLimiter:
+    """
+    Paces requests per RateLimitRule and learns from 429 responses.
+
+    Every rule owns one bucket shared by all endpoints it matches. A 429 on
+    an endpoint without a rule pauses just that endpoint for Retry-After.
+    """
+
+    def __init__(self, rules=None):
+        self.rules = list(DEFAULT_RATE_LIMITS if rules is None else rules)
+        self._buckets = {rule: TokenBucket(rule.rate, rule.burst) for rule in self.rules}
+        self._paused = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, method, endpoint):
+        for rule in self.rules:
+            if rule.matches(method, endpoint):
+                return self._buckets[rule]
+        return None
+
+    def acquire(self, method, endpoint, timeout=None):
+        bucket = self.bucket_for(method, endpoint)
+        if bucket is not None:
+            return bucket.acquire(timeout)
+        with self._lock:
+            wait = self._paused.get(endpoint, 0.0) - monotonic()
+            if wait <= 0:
+                self._paused.pop(endpoint, None)
+                return True
+        if timeout is not None and wait > timeout:
+            return False
+        sleep(wait)
+        return True
+
+    def observe(self, method, endpoint, response):
+        """Feed a response back into the limits."""
+        bucket = self.bucket_for(method, endpoint)
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if bucket is not None:
+                bucket.on_throttled(retry_after)
+            else:
+                with self._lock:
+                    self._paused[endpoint] = monotonic() + (retry_after or 1.0)
+        elif bucket is not None and response.status_code < 400:
+            bucket.on_success()
+
+    def stats(self):
+        return {
+            'rules': {rule.pattern.pattern: self._buckets[rule].status() for rule in self.rules},
+            'paused_endpoints': len(self._paused),
+        }
@@ -0,0 +1,184 @@
+"""
+Per-endpoint request metrics for Rengar: counts, statuses, retries and
+latency histograms, with a Prometheus text exposition dump.
+"""
+
+import os
+import re
+import threading
+from bisect import bisect_left
+
+# Histogram upper bounds in seconds (Prometheus "le" labels)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Path segments that identify one resource (summoner ids, puuids, friend
+# pids) are folded so the number of series stays bounded.
+_ID_SEGMENT = re.compile(r'/(?:\d+|[0-9a-fA-F-]{32,36}|[^/]*@[^/]*)(?=/|$)')
+
+
+def endpoint_template(endpoint):
+    """'/lol-summoner/v1/summoners/123?x=1' -> '/lol-summoner/v1/summoners/{id}'"""
+    return _ID_SEGMENT.sub('/{id}', endpoint.split('?', 1)[0])
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+
+    def quantile(self, q):
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        if not self.total:
+            return None
+        rank = q * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+                if index == len(LATENCY_BUCKETS):
+                    return lower
+                return lower + (LATENCY_BUCKETS[index] - lower) * (rank - seen) / count
+            seen += count
+        return LATENCY_BUCKETS[-1]
+
+
+class EndpointMetrics:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.cached = 0
+        self.statuses = {}
+        self.latency = LatencyHistogram()
+
+    def snapshot(self):
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'retries': self.retries,
+            'cached': self.cached,
+            'statuses': dict(self.statuses),
+            'p50_ms': _ms(self.latency.quantile(0.50)),
+            'p95_ms': _ms(self.latency.quantile(0.95)),
+            'p99_ms': _ms(self.latency.quantile(0.99)),
+            'mean_ms': _ms(self.latency.sum / self.latency.total if self.latency.total else None),
+        }
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def _labels(target, method, endpoint, **extra):
+    pairs = [('target', target), ('method', method), ('endpoint', endpoint)] + list(extra.items())
+    return ','.join(f'{key}="{value}"' for key, value in pairs)
+
+
+class RequestMetrics:
+    """
+    Thread-safe registry keyed by (target, method, endpoint template).
+
+    Recording is a dict lookup, a bisect and a few increments under one
+    lock, so it can stay on for every request.
+    """
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, target, method, endpoint):
+        key = (target, method.upper(), endpoint_template(endpoint))
+        entry = self._endpoints.get(key)
+        if entry is None:
+            entry = self._endpoints[key] = EndpointMetrics()
+        return entry
+
+    def record(self, target, method, endpoint, seconds, status=None, error=None):
+        """One finished call: its HTTP status, or the exception it raised."""
+        with self._lock:
+            entry = self._entry(target, method, endpoint)
+            entry.calls += 1
+            outcome = str(status) if error is None else type(error).__name__
+            entry.statuses[outcome] = entry.statuses.get(outcome, 0) + 1
+            if error is not None:
+                entry.errors += 1
+            entry.latency.observe(seconds)
+
+    def record_cached(self, target, method, endpoint):
+        """A call answered from the response cache; kept out of calls and latency."""
+        with self._lock:
+            self._entry(target, method, endpoint).cached += 1
+
+    def record_retry(self, target, method, endpoint):
+        with self._lock:
+            self._entry(target, method, endpoint).retries += 1
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self):
+        """Per-endpoint summary, slowest p95 first."""
+        with self._lock:
+            rows = [
+                dict(target=target, method=method, endpoint=endpoint, **entry.snapshot())
+                for (target, method, endpoint), entry in self._endpoints.items()
+            ]
+        rows.sort(key=lambda row: row['p95_ms'] or 0, reverse=True)
+        return rows
+
+    def prometheus(self):
+        """Render all series in the Prometheus text exposition format."""
+        lines = [
+            '# HELP rengar_requests_total Finished Rengar requests by outcome.',
+            '# TYPE rengar_requests_total counter',
+        ]
+        with self._lock:
+            items = sorted(self._endpoints.items())
+            for (target, method, endpoint), entry in items:
+                for outcome, count in sorted(entry.statuses.items()):
+                    lines.append(f'rengar_requests_total{{{_labels(target, method, endpoint, status=outcome)}}} {count}')
+
+            lines += [
+                '# HELP rengar_request_retries_total Retried Rengar request attempts.',
+                '# TYPE rengar_request_retries_total counter',
+            ]
+            for (target, method, endpoint), entry in items:
+                lines.append(f'rengar_request_retries_total{{{_labels(target, method, endpoint)}}} {entry.retries}')
+
+            lines += [
+                '# HELP rengar_request_cache_hits_total Rengar requests answered from the response cache.',
+                '# TYPE rengar_request_cache_hits_total counter',
+            ]
+            for (target, method, endpoint), entry in items:
+                lines.append(f'rengar_request_cache_hits_total{{{_labels(target, method, endpoint)}}} {entry.cached}')
+
+            lines += [
+                '# HELP rengar_request_duration_seconds Rengar request latency, retries included.',
+                '# TYPE rengar_request_duration_seconds histogram',
+            ]
+            for (target, method, endpoint), entry in items:
+                histogram = entry.latency
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), histogram.counts):
+                    cumulative += count
+                    labels = _labels(target, method, endpoint, le=bound)
+                    lines.append(f'rengar_request_duration_seconds_bucket{{{labels}}} {cumulative}')
+                labels = _labels(target, method, endpoint)
+                lines.append(f'rengar_request_duration_seconds_sum{{{labels}}} {histogram.sum:.6f}')
+                lines.append(f'rengar_request_duration_seconds_count{{{labels}}} {histogram.total}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Atomically write the text dump, e.g. for node_exporter's textfile collector."""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus())
+        os.replace(tmp_path, path)
+        return path
@@ -0,0 +1,234 @@
+"""
+Record LCU traffic to an append-only file and replay it without a client.
+
+A recording is NDJSON (gzip-compressed when the path ends in .gz), one
+compact object per line:
+
+    {"k": "meta", "v": 1, "wall": 1700000000.0}
+    {"k": "http", "t": 0.412, "tg": "league", "m": "GET", "e": "/lol-...",
+     "b": null, "s": 200, "h": {"Content-Type": "..."}, "r": "{...}", "d": 0.003}
+    {"k": "http", "t": 0.9, "tg": "league", "m": "PATCH", "e": "/lol-...",
+     "b": {...}, "x": "ReadTimeout", "d": 1.5}
+    {"k": "event", "t": 1.204, "ev": {"uri": "...", "eventType": "...", "data": {...}}}
+
+t is seconds since the recording started. Tokens and auth headers are
+never written.
+"""
+
+import gzip
+import json
+import logging
+import threading
+from collections import defaultdict
+from time import monotonic, sleep, time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from Rengar import ClientCredentials
+from RengarEvents import EventStream
+
+logger = logging.getLogger(__name__)
+
+RECORDING_VERSION = 1
+# Response headers worth keeping for cache, rate-limit and content handling
+RECORDED_HEADERS = ('Content-Type', 'ETag', 'Retry-After')
+# Placeholder credentials handed to a Rengar in replay mode
+REPLAY_PORT = 0
+REPLAY_TOKEN = 'replay'
+
+
+def _open(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def read_recording(path):
+    """Yield the records of a recording file in order."""
+    with _open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class Recorder:
+    """Appends HTTP exchanges and WebSocket events to a recording file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.records = 0
+        self._started = monotonic()
+        self._lock = threading.Lock()
+        self._file = _open(path, 'a')
+        self._write({'k': 'meta', 'v': RECORDING_VERSION, 'wall': time()})
+
+    def _write(self, record):
+        line = json.dumps(record, separators=(',', ':'))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.records += 1
+
+    def record_exchange(self, target, method, endpoint, body, started, response=None, error=None):
+        record = {
+            'k': 'http',
+            't': round(started - self._started, 4),
+            'tg': target,
+            'm': method,
+            'e': endpoint,
+            'b': json.loads(body) if body else None,
+            'd': round(monotonic() - started, 4),
+        }
+        if error is not None:
+            record['x'] = type(error).__name__
+        else:
+            record['s'] = response.status_code
+            record['h'] = {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers}
+            record['r'] = response.text
+        self._write(record)
+
+    def record_event(self, event):
+        self._write({'k': 'event', 't': round(monotonic() - self._started, 4), 'ev': event})
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ReplayClock:
+    """
+    Recording time for a replay, running at speed x wall time from its
+    first use. speed=None replays as fast as possible: waits return at once.
+    """
+
+    def __init__(self, speed=1.0):
+        self.speed = speed
+        self._started = None
+        self._lock = threading.Lock()
+
+    def now(self):
+        with self._lock:
+            if self._started is None:
+                self._started = monotonic()
+            return (monotonic() - self._started) * (self.speed or 1.0)
+
+    def wait_until(self, t, stop):
+        """Sleep until recording time t; False if stop was set first."""
+        if self.speed is not None:
+            remaining = (t - self.now()) / self.speed
+            if remaining > 0:
+                return not stop.wait(remaining)
+        return not stop.is_set()
+
+
+def _build_response(record, url):
+    response = requests.Response()
+    response.status_code = record['s']
+    response.headers = CaseInsensitiveDict(record.get('h') or {})
+    response._content = (record.get('r') or '').encode('utf-8')
+    response.encoding = 'utf-8'
+    response.url = url
+    return response
+
+
+def _build_error(record):
+    name = record['x']
+    if 'Timeout' in name:
+        return requests.exceptions.ReadTimeout(f'Replayed {name}')
+    return requests.exceptions.ConnectionError(f'Replayed {name}')
+
+
+class ReplayTransport:
+    """
+    Serves a recording to a Rengar built with Rengar(transport=...).
+
+    At a given speed each request gets the latest recorded response for the
+    same (target, method, endpoint) at or before the current recording
+    time, delayed by its recorded duration. With speed=None the n-th
+    identical request gets the n-th recorded response (the last one repeats)
+    with no delays. Requests that were never recorded get a 404.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.clock = ReplayClock(speed)
+        self.exchanges = defaultdict(list)
+        self.events = []
+        self.unmatched = 0
+        self._cursor = defaultdict(int)
+        self._lock = threading.Lock()
+        for record in read_recording(path):
+            if record['k'] == 'http':
+                self.exchanges[(record['tg'], record['m'], record['e'])].append(record)
+            elif record['k'] == 'event':
+                self.events.append(record)
+
+    def credentials(self, refresh=False):
+        return ClientCredentials(None, REPLAY_PORT, REPLAY_TOKEN, REPLAY_PORT, REPLAY_TOKEN, None)
+
+    def event_stream(self, rengar):
+        return ReplayEventStream(rengar, self)
+
+    def _match(self, key):
+        recorded = self.exchanges.get(key)
+        if not recorded:
+            return None
+        if self.clock.speed is None:
+            with self._lock:
+                index = min(self._cursor[key], len(recorded) - 1)
+                self._cursor[key] += 1
+            return recorded[index]
+        now = self.clock.now()
+        match = recorded[0]
+        for record in recorded:
+            if record['t'] > now:
+                break
+            match = record
+        return match
+
+    def send(self, target, method, endpoint, body, timeout=None):
+        record = self._match((target, method, endpoint))
+        url = f'replay://{target}{endpoint}'
+        if record is None:
+            with self._lock:
+                self.unmatched += 1
+            return _build_response({'s': 404, 'r': ''}, url)
+        if self.clock.speed is not None and record.get('d'):
+            sleep(record['d'] / self.clock.speed)
+        if 'x' in record:
+            raise _build_error(record)
+        return _build_response(record, url)
+
+
+class ReplayEventStream(EventStream):
+    """EventStream that dispatches recorded events on the replay clock instead of a WebSocket."""
+
+    def __init__(self, rengar, transport):
+        super().__init__(rengar)
+        self.transport = transport
+        self.replayed = 0
+        self._finished = False
+
+    def start(self):
+        # A recording is replayed once; later subscriptions do not rewind it
+        if not self._finished:
+            super().start()
+
+    def _run(self):
+        self._connected.set()
+        logger.info(f"🔌 Replaying {len(self.transport.events)} LCU events from {self.transport.path}")
+        try:
+            for record in self.transport.events:
+                if not self._running or not self.transport.clock.wait_until(record['t'], self._stop_event):
+                    return
+                self._dispatch(record['ev'])
+                self.replayed += 1
+            self._finished = True
+        finally:
+            self._connected.clear()
@@ -1,11 +1,10 @@
-from Rengar import Rengar
+from Rengar import get_client
 from termcolor import colored
 
-rengar = Rengar()
 
-
-def restart():
+def restart(rengar=None):
     """Restart League Client UX"""
+    rengar = rengar or get_client()
     try:
         response = rengar.lcu_request("POST", '/riotclient/kill-and-restart-ux', '')
         
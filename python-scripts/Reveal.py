@@ -1,5 +1,5 @@
 import webbrowser
-from Rengar import Rengar
+from Rengar import get_client
 from termcolor import colored
 
 
@@ -7,9 +7,9 @@ class ChampionSelectNotFoundError(Exception):
     pass
 
 
-def reveal():
+def reveal(rengar=None):
     """Open Porofessor.gg for current lobby"""
-    rengar = Rengar()
+    rengar = rengar or get_client()
     
     try:
         champ_select = rengar.lcu_request("GET", "/lol-champ-select/v1/session", "")
@@ -20,37 +20,43 @@ def reveal():
 
         champ_select_data = champ_select.json()
         summ_names = []
-        is_ranked = False
 
         # Check players in team
         if "myTeam" in champ_select_data:
-            for player in champ_select_data["myTeam"]:
-                # Check if ranked (hidden names)
-                if player.get("nameVisibilityType") == "HIDDEN":
-                    is_ranked = True
-                    break
+            team = champ_select_data["myTeam"]
+            # Ranked lobbies hide names, so they come from chat participants instead
+            is_ranked = any(player.get("nameVisibilityType") == "HIDDEN" for player in team)
 
-                summoner_id = player.get("summonerId")
-                if summoner_id and summoner_id != "0":
-                    summoner = rengar.lcu_request(
-                        "GET", f"/lol-summoner/v1/summoners/{summoner_id}", ""
-                    )
-                    if summoner.status_code == 200:
-                        summoner_data = summoner.json()
+            if is_ranked:
+                lookups = [("GET", "/chat/v5/participants")]
+            else:
+                lookups = [
+                    ("GET", f"/lol-summoner/v1/summoners/{player.get('summonerId')}")
+                    for player in team
+                    if player.get("summonerId") and player.get("summonerId") != "0"
+                ]
+
+            # Region is needed either way; fetch it alongside the player lookups
+            *player_results, region_result = rengar.lcu_batch(
+                lookups + [("GET", "/riotclient/region-locale")]
+            )
+
+            if not is_ranked:
+                for summoner in player_results:
+                    if summoner.ok and summoner.status_code == 200:
+                        summoner_data = summoner.response.json()
                         game_name = summoner_data.get('gameName', '')
                         tag_line = summoner_data.get('tagLine', '')
                         if game_name and tag_line:
                             summ_name = f"{game_name}%23{tag_line}"
                             summ_names.append(summ_name)
-
-            # If ranked, get from chat participants
-            if is_ranked:
-                summ_names = []
+            else:
                 try:
-                    # For ranked games, try alternative method
-                    participants = rengar.lcu_request("GET", "/chat/v5/participants", "")
+                    participants = player_results[0]
+                    if not participants.ok:
+                        raise participants.error
                     if participants.status_code == 200:
-                        participants_data = participants.json()
+                        participants_data = participants.response.json()
 
                         if "participants" in participants_data:
                             for participant in participants_data["participants"]:
@@ -67,10 +73,11 @@ def reveal():
                     print(colored(f"Could not fetch ranked participants: {e}", "yellow"))
 
             # Get region
+            if not region_result.ok:
+                raise region_result.error
             region = ""
-            get_region = rengar.lcu_request("GET", "/riotclient/region-locale", "")
-            if get_region.status_code == 200:
-                region_data = get_region.json()
+            if region_result.status_code == 200:
+                region_data = region_result.response.json()
                 region = region_data.get("webRegion", "")
 
             if region and summ_names:
@@ -1,11 +1,10 @@
-from Rengar import Rengar
+from Rengar import get_client
 from termcolor import colored
 
-rengar = Rengar()
 
-
-def change_riotid(name=None, tag=None):
+def change_riotid(name=None, tag=None, rengar=None):
     """Change Riot ID (game name and tag line)"""
+    rengar = rengar or get_client()
     
     if name is None:
         name = input(colored("Type the new name: ", "magenta"))
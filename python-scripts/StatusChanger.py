@@ -1,10 +1,10 @@
 from termcolor import colored
-from Rengar import Rengar
+from Rengar import get_client
 
 
-def change_status(status_message=None):
+def change_status(status_message=None, rengar=None):
     """Change status message"""
-    api = Rengar()
+    api = rengar or get_client()
 
     if status_message is None:
         print(
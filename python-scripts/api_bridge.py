@@ -1,39 +1,115 @@
+import os
 import sys
 import json
-from Rengar import Rengar, check_league_client
-from AutoAccept import autoaccept
-from InstalockAutoban import InstalockAutoban
-from disconnect_reconnect_chat import Chat
-from RemoveFriends import remove_all_friends
-from Badges import change_profile_badges
-from Icons import change_profile_icon
-from Backgrounds import change_profile_background
-from Riotidchanger import change_riotid
-from StatusChanger import change_status
-from Reveal import reveal
-from Dodge import dodge
-from RestartUX import restart
-
-# Initialize components
-rengar = Rengar()
-auto_accept = autoaccept()
-instalock_autoban = InstalockAutoban()
-chat = Chat()
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Components are created on first use so that importing the bridge, or
+# running a method that does not need them, costs no process scans or
+# LCU requests. Feature modules are imported inside the methods for the
+# same reason.
+_auto_accept = None
+_instalock_autoban = None
+_chat = None
+_components_lock = threading.RLock()
+
+# serve() rewrites this Prometheus text file with the request metrics
+METRICS_FILE_ENV = "LTK_METRICS_FILE"
+METRICS_DUMP_INTERVAL = 15.0
+# serve() appends all LCU traffic to this file (see RengarRecord)
+RECORD_FILE_ENV = "LTK_RECORD_FILE"
+# serve() runs this many requests at once, so a slow one does not hold up the rest
+BRIDGE_WORKERS = 4
+
+
+def get_rengar():
+    from Rengar import get_client
+    return get_client()
+
+
+def get_auto_accept():
+    global _auto_accept
+    with _components_lock:
+        if _auto_accept is None:
+            from AutoAccept import autoaccept
+            _auto_accept = autoaccept(get_rengar())
+        return _auto_accept
+
+
+def get_instalock_autoban():
+    global _instalock_autoban
+    with _components_lock:
+        if _instalock_autoban is None:
+            from InstalockAutoban import InstalockAutoban
+            _instalock_autoban = InstalockAutoban(rengar=get_rengar())
+        return _instalock_autoban
+
+
+def get_chat():
+    global _chat
+    with _components_lock:
+        if _chat is None:
+            from disconnect_reconnect_chat import Chat
+            _chat = Chat(get_rengar())
+        return _chat
+
+
+def start_monitors():
+    """Create the client and start the auto-accept and champ select monitors."""
+    get_auto_accept().start_monitor()
+    get_instalock_autoban().start_monitor()
 
 
 def check_client():
     """Check if League client is running"""
     try:
-        port, token = check_league_client()
-        return {"success": True, "connected": True, "port": port}
+        from Rengar import find_league_client_credentials
+        port, token = find_league_client_credentials()
+        if port and token:
+            return {"success": True, "connected": True, "port": port}
+        return {"success": True, "connected": False}
     except:
         return {"success": True, "connected": False}
 
 
+def get_client_status():
+    """Report client reachability and retry/circuit-breaker state without blocking"""
+    try:
+        return {"success": True, **get_rengar().status()}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def get_metrics(prometheus_path=None):
+    """Per-endpoint request metrics; optionally also dump them as Prometheus text"""
+    try:
+        metrics = get_rengar().metrics
+        if metrics is None:
+            return {"success": False, "error": "Metrics are disabled"}
+        result = {"success": True, "endpoints": metrics.snapshot()}
+        if prometheus_path:
+            result["prometheus_path"] = metrics.write_prometheus(prometheus_path)
+        return result
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
 def get_summoner_info():
     """Get current summoner information"""
     try:
-        summoner_resp = rengar.lcu_request("GET", "/lol-summoner/v1/current-summoner", "")
+        from Rengar import PRIORITY_NORMAL
+        rengar = get_rengar()
+        # Independent lookups: fetch them concurrently
+        results = rengar.lcu_batch([
+            ("GET", "/lol-summoner/v1/current-summoner"),
+            ("GET", "/riotclient/region-locale"),
+            ("GET", "/lol-ranked/v1/current-ranked-stats"),
+        ], priority=PRIORITY_NORMAL)
+        for result in results:
+            if not result.ok:
+                raise result.error
+        summoner_resp, region_resp, ranked_resp = (result.response for result in results)
+
         if summoner_resp.status_code == 200:
             summoner = summoner_resp.json()
             ign = f"{summoner.get('gameName', 'Unknown')}#{summoner.get('tagLine', 'Unknown')}"
@@ -41,14 +117,12 @@ def get_summoner_info():
         else:
             return {"success": False, "error": "Failed to get summoner data"}
 
-        region_resp = rengar.lcu_request("GET", "/riotclient/region-locale", "")
         if region_resp.status_code == 200:
             region_data = region_resp.json()
             region = region_data.get("webRegion", "Unknown")
         else:
             region = "Unknown"
 
-        ranked_resp = rengar.lcu_request("GET", "/lol-ranked/v1/current-ranked-stats", "")
         if ranked_resp.status_code == 200:
             ranked_data = ranked_resp.json()
             solo_queue = next(
@@ -79,7 +153,7 @@ def get_summoner_info():
 def toggle_auto_accept_func(enabled):
     """Toggle auto accept"""
     try:
-        auto_accept.auto_accept_enabled = enabled
+        get_auto_accept().auto_accept_enabled = enabled
         return {"success": True, "enabled": enabled}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -88,6 +162,7 @@ def toggle_auto_accept_func(enabled):
 def set_instalock_func(champion_name, enabled):
     """Set instalock champion"""
     try:
+        instalock_autoban = get_instalock_autoban()
         if enabled:
             success = instalock_autoban.set_instalock_champion(champion_name)
             if success:
@@ -102,9 +177,20 @@ def set_instalock_func(champion_name, enabled):
         return {"success": False, "error": str(e)}
 
 
+def set_monitor_mode_func(mode):
+    """Switch champ select monitoring between events and polling"""
+    try:
+        if get_instalock_autoban().set_mode(mode):
+            return {"success": True, "mode": mode}
+        return {"success": False, "error": f"Unknown mode: {mode}"}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
 def set_autoban_func(champion_name, enabled, protect_ban=True):
     """Set auto ban champion"""
     try:
+        instalock_autoban = get_instalock_autoban()
         if enabled:
             success = instalock_autoban.set_auto_ban_champion(champion_name)
             if success:
@@ -123,6 +209,7 @@ def set_autoban_func(champion_name, enabled, protect_ban=True):
 def toggle_chat_func(disconnect):
     """Toggle chat connection"""
     try:
+        chat = get_chat()
         if disconnect:
             success = chat.disconnect()
         else:
@@ -136,6 +223,7 @@ def toggle_chat_func(disconnect):
 def change_icon_func(icon_id):
     """Change profile icon"""
     try:
+        from Icons import change_profile_icon
         success = change_profile_icon(icon_id)
         return {"success": success}
     except Exception as e:
@@ -159,7 +247,7 @@ def change_background_func(skin_id):
             print(f"[Background] Request body: {body}")
             print(f"[Background] Calling POST /lol-summoner/v1/current-summoner/summoner-profile")
             
-            response = rengar.lcu_request('POST', "/lol-summoner/v1/current-summoner/summoner-profile", body)
+            response = get_rengar().lcu_request('POST', "/lol-summoner/v1/current-summoner/summoner-profile", body)
             
             print(f"[Background] Response status: {response.status_code}")
             print(f"[Background] Response headers: {dict(response.headers)}")
@@ -214,6 +302,7 @@ def change_riot_id_func(name, tag):
         if len(tag) > 5:
             return {"success": False, "error": "Tag too long (max 5)"}
         
+        from Riotidchanger import change_riotid
         success = change_riotid(name, tag)
         return {"success": success}
     except Exception as e:
@@ -223,6 +312,7 @@ def change_riot_id_func(name, tag):
 def change_status_func(status_message):
     """Change status message"""
     try:
+        from StatusChanger import change_status
         success = change_status(status_message)
         return {"success": success}
     except Exception as e:
@@ -232,6 +322,7 @@ def change_status_func(status_message):
 def reveal_lobby_func():
     """Open Porofessor.gg for current lobby"""
     try:
+        from Reveal import reveal
         url = reveal()
         if url:
             return {"success": True, "url": url}
@@ -244,6 +335,7 @@ def reveal_lobby_func():
 def dodge_func():
     """Dodge current game"""
     try:
+        from Dodge import dodge
         success = dodge()
         return {"success": success}
     except Exception as e:
@@ -253,20 +345,15 @@ def dodge_func():
 def remove_friends_func():
     """Remove all friends"""
     try:
+        rengar = get_rengar()
         response = rengar.lcu_request("GET", "/lol-chat/v1/friends", "")
         
         if response.status_code == 200:
             friends = response.json()
-            removed_count = 0
-            
-            for friend in friends:
-                friend_id = friend.get("pid")
-                try:
-                    delete_response = rengar.lcu_request("DELETE", f"/lol-chat/v1/friends/{friend_id}", "")
-                    if delete_response.status_code in [200, 204]:
-                        removed_count += 1
-                except:
-                    pass
+            results = rengar.lcu_batch(
+                [("DELETE", f"/lol-chat/v1/friends/{friend.get('pid')}") for friend in friends]
+            )
+            removed_count = sum(1 for result in results if result.ok and result.status_code in [200, 204])
             
             return {"success": True, "removed": removed_count}
         
@@ -278,6 +365,7 @@ def remove_friends_func():
 def restart_client_func():
     """Restart League client UX"""
     try:
+        from RestartUX import restart
         success = restart()
         return {"success": success}
     except Exception as e:
@@ -287,12 +375,179 @@ def restart_client_func():
 def change_badges_func():
     """Change profile badges"""
     try:
+        from Badges import change_profile_badges
         change_profile_badges()
         return {"success": True}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+def _arg(args, index, default=None):
+    return args[index] if len(args) > index else default
+
+
+def _flag(args, index, default=False):
+    """Read a boolean argument given either as a JSON bool or as "true"/"false"."""
+    value = _arg(args, index)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() == "true"
+
+
+# Method name -> handler taking the positional argument list
+METHODS = {
+    "check_client": lambda args: check_client(),
+    "get_client_status": lambda args: get_client_status(),
+    "get_metrics": lambda args: get_metrics(_arg(args, 0)),
+    "get_summoner_info": lambda args: get_summoner_info(),
+    "toggle_auto_accept": lambda args: toggle_auto_accept_func(_flag(args, 0)),
+    "set_instalock": lambda args: set_instalock_func(_arg(args, 0, ""), _flag(args, 1)),
+    "set_autoban": lambda args: set_autoban_func(_arg(args, 0, ""), _flag(args, 1), _flag(args, 2, True)),
+    "set_monitor_mode": lambda args: set_monitor_mode_func(_arg(args, 0, "")),
+    "toggle_chat": lambda args: toggle_chat_func(_flag(args, 0)),
+    "change_icon": lambda args: change_icon_func(_arg(args, 0)),
+    "change_background": lambda args: change_background_func(_arg(args, 0)),
+    "change_riot_id": lambda args: change_riot_id_func(_arg(args, 0, ""), _arg(args, 1, "")),
+    "change_status": lambda args: change_status_func(_arg(args, 0, "")),
+    "reveal_lobby": lambda args: reveal_lobby_func(),
+    "dodge": lambda args: dodge_func(),
+    "change_badges": lambda args: change_badges_func(),
+    "remove_friends": lambda args: remove_friends_func(),
+    "restart_client": lambda args: restart_client_func(),
+}
+
+
+def dispatch(method, args):
+    """Run a bridge method by name."""
+    handler = METHODS.get(method)
+    if handler is None:
+        return {"success": False, "error": f"Unknown method: {method}"}
+    return handler(args)
+
+
+def _dump_metrics(path, stop, interval=METRICS_DUMP_INTERVAL):
+    while True:
+        metrics = get_rengar().metrics
+        if metrics is not None:
+            try:
+                metrics.write_prometheus(path)
+            except OSError as e:
+                print(f"Metrics dump to {path} failed: {e}", file=sys.stderr)
+        if stop.wait(interval):
+            return
+
+
+def serve(stdin=None, stdout=None):
+    """
+    Long-lived daemon mode: read one JSON-RPC request per line from stdin and
+    write one response per line to stdout.
+
+    Request:  {"id": 1, "method": "set_instalock", "params": ["Ahri", true]}
+    Response: {"jsonrpc": "2.0", "id": 1, "result": {...}}
+
+    The client and the auto-accept / champ select monitors stay warm between
+    requests. Requests run concurrently, so responses can arrive out of
+    order; match them by id. Send {"method": "shutdown"} or close stdin to
+    exit. Set LTK_METRICS_FILE to keep a Prometheus text dump of request
+    metrics there, and LTK_RECORD_FILE to record all LCU traffic for offline
+    replay.
+    """
+    stdin = stdin or sys.stdin
+    original_stdout = sys.stdout
+    out = stdout or original_stdout
+    # Feature code prints progress to stdout; keep it off the protocol stream
+    sys.stdout = sys.stderr
+    write_lock = threading.Lock()
+    executor = ThreadPoolExecutor(max_workers=BRIDGE_WORKERS, thread_name_prefix="BridgeWorker")
+
+    def respond(req_id, result=None, error=None):
+        response = {"jsonrpc": "2.0", "id": req_id}
+        if error is not None:
+            response["error"] = error
+        else:
+            response["result"] = result
+        line = json.dumps(response) + "\n"
+        with write_lock:
+            out.write(line)
+            out.flush()
+
+    def handle(req_id, method, params):
+        try:
+            respond(req_id, dispatch(method, params))
+        except Exception as e:
+            respond(req_id, error={"code": -32603, "message": str(e)})
+
+    # Long-lived process: repeated summoner/region lookups can be cached.
+    # A BlockingRengar client has no cache or recorder (see AsyncRengar).
+    rengar = get_rengar()
+    if hasattr(rengar, "enable_cache"):
+        rengar.enable_cache()
+
+    record_path = os.environ.get(RECORD_FILE_ENV)
+    if record_path:
+        if hasattr(rengar, "start_recording"):
+            rengar.start_recording(record_path)
+        else:
+            print(f"{RECORD_FILE_ENV} ignored: {type(rengar).__name__} cannot record traffic", file=sys.stderr)
+
+    # Optional Prometheus textfile dump, refreshed while the daemon runs
+    metrics_path = os.environ.get(METRICS_FILE_ENV)
+    stop_metrics = threading.Event()
+    if metrics_path:
+        threading.Thread(target=_dump_metrics, args=(metrics_path, stop_metrics),
+                         daemon=True, name="BridgeMetrics").start()
+
+    # Warm up off the request path so the first command is not delayed
+    threading.Thread(target=start_monitors, daemon=True, name="BridgeWarmup").start()
+
+    try:
+        for line in stdin:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(line)
+            except ValueError:
+                respond(None, error={"code": -32700, "message": "Parse error"})
+                continue
+
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                respond(None, error={"code": -32600, "message": "Invalid request"})
+                continue
+
+            req_id = request.get("id")
+            method = request["method"]
+            params = request.get("params") or []
+
+            if method == "shutdown":
+                respond(req_id, {"success": True})
+                break
+
+            if method not in METHODS:
+                respond(req_id, error={"code": -32601, "message": f"Unknown method: {method}"})
+                continue
+
+            if not isinstance(params, list):
+                respond(req_id, error={"code": -32602, "message": "params must be a list"})
+                continue
+
+            executor.submit(handle, req_id, method, params)
+    finally:
+        # Let requests already running write their responses
+        executor.shutdown(wait=True)
+        stop_metrics.set()
+        if hasattr(rengar, "stop_recording"):
+            rengar.stop_recording()
+        if _auto_accept is not None:
+            _auto_accept.stop()
+        if _instalock_autoban is not None:
+            _instalock_autoban.stop()
+        sys.stdout = original_stdout
+
+
 # Main execution
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -301,72 +556,15 @@ if __name__ == "__main__":
     
     method = sys.argv[1]
     args = sys.argv[2:] if len(sys.argv) > 2 else []
-    
-    result = None
+
+    if method in ("--daemon", "serve"):
+        serve()
+        sys.exit(0)
     
     try:
-        if method == "check_client":
-            result = check_client()
-            
-        elif method == "get_summoner_info":
-            result = get_summoner_info()
-            
-        elif method == "toggle_auto_accept":
-            enabled = args[0].lower() == "true" if args else False
-            result = toggle_auto_accept_func(enabled)
-            
-        elif method == "set_instalock":
-            champion = args[0] if args else ""
-            enabled = args[1].lower() == "true" if len(args) > 1 else False
-            result = set_instalock_func(champion, enabled)
-            
-        elif method == "set_autoban":
-            champion = args[0] if args else ""
-            enabled = args[1].lower() == "true" if len(args) > 1 else False
-            protect = args[2].lower() == "true" if len(args) > 2 else True
-            result = set_autoban_func(champion, enabled, protect)
-            
-        elif method == "toggle_chat":
-            disconnect = args[0].lower() == "true" if args else False
-            result = toggle_chat_func(disconnect)
-            
-        elif method == "change_icon":
-            icon_id = args[0] if args else None
-            result = change_icon_func(icon_id)
-            
-        elif method == "change_background":
-            skin_id = args[0] if args else None
-            result = change_background_func(skin_id)
-            
-        elif method == "change_riot_id":
-            name = args[0] if args else ""
-            tag = args[1] if len(args) > 1 else ""
-            result = change_riot_id_func(name, tag)
-            
-        elif method == "change_status":
-            status = args[0] if args else ""
-            result = change_status_func(status)
-            
-        elif method == "reveal_lobby":
-            result = reveal_lobby_func()
-            
-        elif method == "dodge":
-            result = dodge_func()
-            
-        elif method == "change_badges":
-            result = change_badges_func()
-            
-        elif method == "remove_friends":
-            result = remove_friends_func()
-            
-        elif method == "restart_client":
-            result = restart_client_func()
-            
-        else:
-            result = {"success": False, "error": f"Unknown method: {method}"}
-        
+        result = dispatch(method, args)
         print(json.dumps(result))
         
     except Exception as e:
         print(json.dumps({"success": False, "error": str(e)}))
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -0,0 +1,182 @@
+"""
+Time-to-lock benchmark for InstalockAutoban against a scripted FakeLCU draft.
+
+The automation runs in a worker process (AutoAccept + InstalockAutoban set
+to pick Ahri and ban Zed) so its CPU can be measured on its own. For each
+mode it reports, over several seeded drafts:
+
+  lock   isInProgress -> completing pick PATCH received, ms
+  ban    isInProgress -> completing ban PATCH received, ms
+  hover  champ select start -> first pick hover PATCH, ms
+  cpu    worker CPU seconds per second of champ select, %
+  req/s  requests the fake received per second of champ select
+
+With --baseline the run fails (exit 1) when a mode's p95 time-to-lock
+exceeds the baseline by more than --tolerance (relative) plus --slack ms.
+--save-baseline writes this run's numbers; baselines are per machine.
+
+Usage: python benchmarks/bench_champ_select.py [--runs 10] [--modes polling,events]
+                                               [--baseline F] [--save-baseline F]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import psutil
+
+import stub_server  # noqa: F401  (puts the scripts directory on sys.path)
+from FakeLCU import DraftScenario, FakeLCU
+from InstalockAutoban import CHAMPION_CACHE_ENV
+from Rengar import LOCKFILE_ENV, RIOT_LOCKFILE_ENV
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCH_DIR)
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baselines', 'champ_select.json')
+SPEED = 10.0
+START_DELAY = 1.5
+
+
+def worker(mode):
+    """Automation side: runs until killed."""
+    import logging
+    logging.disable(logging.CRITICAL)
+    from AutoAccept import autoaccept
+    from InstalockAutoban import InstalockAutoban
+
+    accept = autoaccept()
+    accept.auto_accept_enabled = True
+    accept.start_monitor()
+    engine = InstalockAutoban(mode=mode)
+    engine.set_instalock_champion('Ahri')
+    engine.set_auto_ban_champion('Zed')
+    engine.start_monitor()
+    while True:
+        time.sleep(3600)
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(int(round(q * (len(values) - 1))), len(values) - 1)]
+
+
+def run_draft(mode, seed):
+    scenario = DraftScenario(local_cell=seed % 5, seed=seed, speed=SPEED, start_delay=START_DELAY)
+    with FakeLCU(scenario) as fake:
+        league, riot = fake.write_lockfiles()
+        env = dict(os.environ, **{
+            LOCKFILE_ENV: league,
+            RIOT_LOCKFILE_ENV: riot,
+            CHAMPION_CACHE_ENV: os.path.join(os.path.dirname(league), 'champions.json'),
+        })
+        proc = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--worker', mode],
+            cwd=SCRIPTS_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            process = psutil.Process(proc.pid)
+            while scenario.results['champ_select_started'] is None and not scenario.done.is_set():
+                time.sleep(0.005)
+            cpu_start = sum(process.cpu_times()[:2])
+            requests_start = sum(fake.request_counts.values())
+            scenario.done.wait(120)
+            cpu_used = sum(process.cpu_times()[:2]) - cpu_start
+            requests_made = sum(fake.request_counts.values()) - requests_start
+        finally:
+            proc.kill()
+            proc.wait()
+
+    results = scenario.results
+    duration = (results['ended'] or 0) - (results['champ_select_started'] or 0)
+    by_type = {'pick': None, 'ban': None}
+    for action in results['actions'].values():
+        if action.get('latency') is not None:
+            by_type[action['type']] = action['latency'] * 1000
+    return {
+        'lock': by_type['pick'],
+        'ban': by_type['ban'],
+        'hover': results['first_hover'] * 1000 if results['first_hover'] is not None else None,
+        'cpu': 100 * cpu_used / duration if duration > 0 else None,
+        'rps': requests_made / duration if duration > 0 else None,
+        'dodged': results['dodged'],
+    }
+
+
+def summarize(runs):
+    def column(key):
+        return [run[key] for run in runs if run[key] is not None]
+    return {
+        'runs': len(runs),
+        'missed_locks': sum(1 for run in runs if run['lock'] is None),
+        'lock_p50': percentile(column('lock'), 0.50),
+        'lock_p95': percentile(column('lock'), 0.95),
+        'ban_p50': percentile(column('ban'), 0.50),
+        'ban_p95': percentile(column('ban'), 0.95),
+        'hover_p50': percentile(column('hover'), 0.50),
+        'cpu_pct': statistics.mean(column('cpu')) if column('cpu') else None,
+        'rps': statistics.mean(column('rps')) if column('rps') else None,
+    }
+
+
+def fmt(value, spec='.1f'):
+    return '-' if value is None else format(value, spec)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--modes', default='polling,events')
+    parser.add_argument('--baseline', nargs='?', const=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', nargs='?', const=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--slack', type=float, default=20.0, help='absolute ms allowance on top of tolerance')
+    parser.add_argument('--worker')
+    args = parser.parse_args()
+
+    if args.worker:
+        return worker(args.worker)
+
+    summary = {}
+    for mode in args.modes.split(','):
+        runs = [run_draft(mode, seed) for seed in range(args.runs)]
+        summary[mode] = summarize(runs)
+
+    print(f'{"mode":<9}{"runs":>5}{"missed":>7}{"lock p50":>10}{"lock p95":>10}'
+          f'{"ban p50":>9}{"ban p95":>9}{"hover p50":>11}{"cpu %":>7}{"req/s":>7}')
+    for mode, row in summary.items():
+        print(f'{mode:<9}{row["runs"]:>5}{row["missed_locks"]:>7}{fmt(row["lock_p50"]):>10}{fmt(row["lock_p95"]):>10}'
+              f'{fmt(row["ban_p50"]):>9}{fmt(row["ban_p95"]):>9}{fmt(row["hover_p50"]):>11}'
+              f'{fmt(row["cpu_pct"]):>7}{fmt(row["rps"]):>7}')
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.save_baseline), exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        print(f'Baseline written to {args.save_baseline}')
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        failed = False
+        for mode, row in summary.items():
+            reference = baseline.get(mode, {}).get('lock_p95')
+            if reference is None:
+                continue
+            limit = reference * (1 + args.tolerance) + args.slack
+            if row['lock_p95'] is None or row['lock_p95'] > limit or row['missed_locks']:
+                print(f'REGRESSION {mode}: lock p95 {fmt(row["lock_p95"])} ms > {limit:.1f} ms '
+                      f'(baseline {reference:.1f} ms), missed {row["missed_locks"]}')
+                failed = True
+        if failed:
+            sys.exit(1)
+        print('Time-to-lock within baseline')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Import-time budget for the bridge modules.
+
+Each module is imported in a fresh interpreter with process scanning and
+outgoing HTTP disabled, so any import-time Rengar() / LCU call fails the
+check. Exits non-zero when a module has side effects or exceeds its budget.
+
+Usage: python benchmarks/bench_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# module -> import budget in milliseconds
+BUDGETS = {
+    "api_bridge": 25,
+    "Backgrounds": 50,
+    "Badges": 50,
+    "Dodge": 50,
+    "Icons": 50,
+    "RemoveFriends": 50,
+    "RestartUX": 50,
+    "Reveal": 50,
+    "Riotidchanger": 50,
+    "StatusChanger": 50,
+    "disconnect_reconnect_chat": 50,
+    "AutoAccept": 50,
+    "InstalockAutoban": 50,
+}
+
+PROBE = """
+import sys, time
+import psutil, requests
+
+def _forbidden(*args, **kwargs):
+    raise SystemExit("side effect: " + repr(args[:2]))
+
+psutil.process_iter = _forbidden
+requests.Session.request = _forbidden
+sys.modules.pop("{module}", None)
+start = time.perf_counter()
+import {module}
+print((time.perf_counter() - start) * 1000)
+"""
+
+# api_bridge must not pull the HTTP stack in at all
+COLD_PROBE = """
+import sys, time
+start = time.perf_counter()
+import api_bridge
+elapsed = (time.perf_counter() - start) * 1000
+heavy = [m for m in ("requests", "psutil", "Rengar") if m in sys.modules]
+if heavy:
+    raise SystemExit("api_bridge imported " + ", ".join(heavy))
+print(elapsed)
+"""
+
+
+def run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=SCRIPTS_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None, (result.stderr or result.stdout).strip().splitlines()[-1]
+    return float(result.stdout.strip()), None
+
+
+def main():
+    failures = 0
+    checks = [("api_bridge (cold)", COLD_PROBE, BUDGETS["api_bridge"])]
+    checks += [(m, PROBE.format(module=m), budget) for m, budget in BUDGETS.items()]
+
+    for name, code, budget in checks:
+        elapsed, error = run(code)
+        if error:
+            status = f"FAIL  {error}"
+            failures += 1
+        elif elapsed > budget:
+            status = f"FAIL  {elapsed:.1f} ms > {budget} ms budget"
+            failures += 1
+        else:
+            status = f"ok    {elapsed:.1f} ms"
+        print(f"{name:<28}{status}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Pick/ban PATCH latency while bulk batches saturate the LCU, with and
+without Rengar's priority scheduler.
+
+The stub serves at most four requests at a time (like the LCU's small
+worker pool), so unscheduled bulk traffic queues ahead of the PATCH.
+
+Usage: python benchmarks/bench_priority.py [picks]
+"""
+
+import statistics
+import sys
+import threading
+import time
+
+from stub_server import StubHandler, StubServer
+from Rengar import Rengar
+
+SERVER_WORKERS = 4
+SERVICE_TIME = 0.02
+
+
+class BusyHandler(StubHandler):
+    workers = threading.Semaphore(SERVER_WORKERS)
+
+    def _reply(self):
+        with self.workers:
+            threading.Event().wait(SERVICE_TIME)
+            super()._reply()
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _reply
+
+
+def run(port, picks, prioritize):
+    # Rate limits off so only the scheduler shapes the bulk traffic
+    rengar = Rengar(prioritize=prioritize, rate_limit=False)
+    rengar.set_league_credentials(port, 'token')
+    stop = threading.Event()
+
+    def bulk():
+        batch = [('DELETE', f'/lol-chat/v1/friends/{i}') for i in range(16)]
+        while not stop.is_set():
+            rengar.lcu_batch(batch)
+
+    workers = [threading.Thread(target=bulk, daemon=True) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    time.sleep(0.2)
+
+    samples = []
+    for _ in range(picks):
+        start = time.perf_counter()
+        rengar.lcu_request('PATCH', '/lol-champ-select/v1/session/actions/1',
+                           {'championId': 103, 'completed': True})
+        samples.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.03)
+
+    stop.set()
+    for worker in workers:
+        worker.join()
+    rengar.close()
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main():
+    picks = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    with StubServer(BusyHandler) as server:
+        fifo = run(server.port, picks, prioritize=False)
+        scheduled = run(server.port, picks, prioritize=True)
+
+    print(f'{"scheduler":<12}{"p50 ms":>10}{"p95 ms":>10}')
+    print(f'{"off":<12}{fifo[0]:>10.3f}{fifo[1]:>10.3f}')
+    print(f'{"on":<12}{scheduled[0]:>10.3f}{scheduled[1]:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Credential process scan: the original two full cmdline scans vs the
+single name-filtered pass, over a synthetic process table.
+
+Usage: python benchmarks/bench_process_scan.py [process_count]
+"""
+
+import os
+import sys
+import time
+
+import psutil
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Rengar import scan_client_processes
+
+
+def measure_cmdline_cost(samples=200):
+    """Average cost of reading a real process's command line on this machine."""
+    procs = list(psutil.process_iter())[:samples]
+    start = time.perf_counter()
+    for proc in procs:
+        try:
+            proc.cmdline()
+        except psutil.Error:
+            pass
+    return (time.perf_counter() - start) / max(len(procs), 1)
+
+
+class FakeProcess:
+    cmdline_cost = 0.0
+    cmdline_reads = 0
+
+    def __init__(self, pid, name, cmdline):
+        self.pid = pid
+        self.info = {'pid': pid, 'name': name}
+        self._cmdline = cmdline
+
+    def cmdline(self):
+        FakeProcess.cmdline_reads += 1
+        deadline = time.perf_counter() + self.cmdline_cost
+        while time.perf_counter() < deadline:
+            pass
+        return self._cmdline
+
+
+def build_table(count):
+    ux_args = [
+        'LeagueClientUx.exe', '--riotclient-auth-token=rtoken', '--riotclient-app-port=50001',
+        '--app-port=50002', '--remoting-auth-token=ltoken',
+        '--install-directory=C:/Riot Games/League of Legends/',
+    ]
+    table = [FakeProcess(i, f'svc{i}.exe', [f'svc{i}.exe', '--flag']) for i in range(count)]
+    for i in range(4):
+        table.append(FakeProcess(count + i, 'LeagueClientUxRender.exe', ['LeagueClientUxRender.exe', '--type=renderer']))
+    table.append(FakeProcess(count + 10, 'LeagueClientUx.exe', ux_args))
+    return table
+
+
+def original_scans(table):
+    """Baseline behaviour: League and Riot lookups each walk every cmdline."""
+    league = riot = None
+    for proc in table:
+        cmdline = proc.cmdline()
+        if proc.info['name'] == 'LeagueClientUx.exe':
+            league = [a for a in cmdline if a.startswith(('--app-port=', '--remoting-auth-token='))]
+            break
+    for proc in table:
+        cmdline = proc.cmdline()
+        if 'LeagueClientUx' in proc.info['name']:
+            riot = [a for a in cmdline if 'riotclient' in a]
+            if len(riot) == 2:
+                break
+    return league, riot
+
+
+def run(label, fn, table, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        FakeProcess.cmdline_reads = 0
+        start = time.perf_counter()
+        fn(table)
+        best = min(best, time.perf_counter() - start)
+    print(f'{label:<24}{best * 1000:>10.2f} ms{FakeProcess.cmdline_reads:>10} cmdline reads')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    FakeProcess.cmdline_cost = measure_cmdline_cost()
+    table = build_table(count)
+    print(f'{len(table)} processes, simulated cmdline read {FakeProcess.cmdline_cost * 1e6:.1f} us')
+
+    creds = scan_client_processes(table)
+    assert creds.league_port == '50002' and creds.riot_token == 'rtoken'
+
+    run('original (2 scans)', original_scans, table)
+    run('single filtered pass', scan_client_processes, table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Bulk friend removal against a stub that enforces its own rate limit,
+with Rengar's adaptive client-side limits off and on.
+
+Usage: python benchmarks/bench_rate_limit.py [friends]
+"""
+
+import sys
+import threading
+import time
+
+from stub_server import StubHandler, StubServer
+from Rengar import Rengar
+
+
+class ThrottledHandler(StubHandler):
+    """Answers 429 + Retry-After once the server-side bucket is empty."""
+    rate = 10.0
+    burst = 5
+    lock = threading.Lock()
+    tokens = 0.0
+    updated = 0.0
+    throttled = 0
+
+    def _reply(self):
+        cls = type(self)
+        with cls.lock:
+            now = time.monotonic()
+            cls.tokens = min(cls.burst, cls.tokens + (now - cls.updated) * cls.rate)
+            cls.updated = now
+            allowed = cls.tokens >= 1
+            if allowed:
+                cls.tokens -= 1
+            else:
+                cls.throttled += 1
+        if allowed:
+            return super()._reply()
+        self.send_response(429)
+        self.send_header('Retry-After', '1')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_DELETE = _reply
+
+    @classmethod
+    def reset(cls, rate):
+        cls.rate = rate
+        cls.tokens = cls.burst
+        cls.updated = time.monotonic()
+        cls.throttled = 0
+
+
+def run(port, friends, rate_limit):
+    rengar = Rengar(rate_limit=rate_limit)
+    rengar.set_league_credentials(port, 'token')
+    start = time.perf_counter()
+    results = rengar.lcu_batch([('DELETE', f'/lol-chat/v1/friends/{i}') for i in range(friends)])
+    elapsed = time.perf_counter() - start
+    rengar.close()
+    removed = sum(1 for result in results if result.ok and result.status_code in (200, 204))
+    return removed, elapsed
+
+
+def main():
+    friends = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print(f'{"server rate":<13}{"limiter":<9}{"removed":>9}{"429s":>7}{"seconds":>9}')
+    with StubServer(ThrottledHandler) as server:
+        for server_rate in (10.0, 40.0):
+            for rate_limit in (False, True):
+                ThrottledHandler.reset(server_rate)
+                removed, elapsed = run(server.port, friends, rate_limit)
+                print(f'{server_rate:<13.0f}{"on" if rate_limit else "off":<9}'
+                      f'{removed:>9}{ThrottledHandler.throttled:>7}{elapsed:>9.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Per-tick selector cost: the original walk of the raw session for every
+query vs indexing it once into a ChampSelectSnapshot.
+
+One tick is what InstalockAutoban does with a session update during the
+ban phase: pre-hover candidate for a Random pick, ban selection with ally
+hover protection, and a pick selection with three choices.
+
+Usage: python benchmarks/bench_session_snapshot.py [ticks]
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FakeLCU import CHAMPIONS
+from InstalockAutoban import (ChampionRegistry, ChampionSelection, ChampionSelector,
+                              ChampSelectSession, ChampSelectSnapshot)
+
+
+# The pre-snapshot implementation, kept here as the reference point
+def legacy_is_banned(champion_id, session):
+    for actions in session.get('actions', []):
+        if not isinstance(actions, list):
+            continue
+        for action in actions:
+            if (action.get('type') == 'ban' and action.get('completed') and
+                    action.get('championId') == champion_id):
+                return True
+    bans = session.get('bans', {})
+    if isinstance(bans, dict):
+        for team_bans in bans.values():
+            if isinstance(team_bans, list) and champion_id in team_bans:
+                return True
+    return False
+
+
+def legacy_ally_hovers(session, cell_id):
+    ally_hovers = []
+    for actions in session.get('actions', []):
+        if not isinstance(actions, list):
+            continue
+        for action in actions:
+            if action.get('actorCellId') == cell_id:
+                continue
+            if action.get('type') == 'pick':
+                champ_id = action.get('championId', 0)
+                if champ_id > 0 and not action.get('completed', False):
+                    if champ_id not in ally_hovers:
+                        ally_hovers.append(champ_id)
+    return ally_hovers
+
+
+def legacy_pending_pick(session, cell_id):
+    for actions in session.get('actions', []):
+        if not isinstance(actions, list):
+            continue
+        for action in actions:
+            if (action.get('actorCellId') == cell_id and action.get('type') == 'pick' and
+                    not action.get('completed', False)):
+                return action
+    return None
+
+
+def legacy_tick(session, registry, picks, bans):
+    cell_id = session.get('localPlayerCellId')
+    legacy_pending_pick(session, cell_id)
+    [cid for cid in registry.get_all_ids() if not legacy_is_banned(cid, session)]
+    ally_hovers = legacy_ally_hovers(session, cell_id)
+    for name in bans.get_champions():
+        champ_id = registry.get_id(name)
+        if not legacy_is_banned(champ_id, session) and champ_id not in ally_hovers:
+            break
+    for name in picks.get_champions():
+        if not legacy_is_banned(registry.get_id(name), session):
+            break
+
+
+def snapshot_tick(session, selector, random_pick, picks, bans):
+    snapshot = ChampSelectSnapshot.from_session(session)
+    snapshot.my_pending_action('pick')
+    selector.select_pick(random_pick, snapshot)
+    selector.select_ban(bans, snapshot, True)
+    selector.select_pick(picks, snapshot)
+
+
+def build_session(local_cell=2, seed=0):
+    """Ranked draft midway through bans: six bans locked, every pick hovered."""
+    rng = random.Random(seed)
+    ids = [cid for cid, _ in CHAMPIONS]
+    rng.shuffle(ids)
+    bans = [{'id': cell + 1, 'actorCellId': cell, 'type': 'ban', 'championId': ids[cell] if cell < 6 else 0,
+             'completed': cell < 6, 'isInProgress': cell >= 6, 'isAllyAction': cell < 5} for cell in range(10)]
+    picks = [{'id': 11 + cell, 'actorCellId': cell, 'type': 'pick', 'championId': ids[20 + cell],
+              'completed': False, 'isInProgress': False, 'isAllyAction': cell < 5} for cell in range(10)]
+    order = [[0], [5, 6], [1, 2], [7, 8], [3, 4], [9]]
+    return {
+        'gameId': 4000000001,
+        'counter': 42,
+        'localPlayerCellId': local_cell,
+        'actions': [bans] + [[picks[cell] for cell in group] for group in order],
+        'bans': {'myTeamBans': ids[:3], 'theirTeamBans': ids[3:6], 'numBans': 10},
+        'timer': {'phase': 'BAN_PICK', 'adjustedTimeLeftInPhase': 20000},
+    }
+
+
+def measure(fn, ticks):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        fn()
+    return (time.perf_counter() - start) / ticks
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    logging.disable(logging.CRITICAL)
+
+    registry = ChampionRegistry(None)
+    registry._parse_data([{'id': cid, 'name': name} for cid, name in CHAMPIONS])
+    selector = ChampionSelector(registry, ChampSelectSession(None))
+    session = build_session()
+    # Last choices are the ones that get through: the first ones are banned or hovered
+    banned_name = dict(CHAMPIONS)[session['actions'][0][0]['championId']]
+    hovered_name = dict(CHAMPIONS)[session['actions'][1][0]['championId']]
+    picks = ChampionSelection(banned_name, 'ahri', 'zed', enabled=True)
+    bans = ChampionSelection(hovered_name, banned_name, 'yasuo', enabled=True)
+    random_pick = ChampionSelection('Random', enabled=True)
+
+    legacy = measure(lambda: legacy_tick(session, registry, picks, bans), ticks)
+    indexed = measure(lambda: snapshot_tick(session, selector, random_pick, picks, bans), ticks)
+    parse = measure(lambda: ChampSelectSnapshot.from_session(session), ticks)
+
+    print(f'{len(CHAMPIONS)} champions, {sum(len(g) for g in session["actions"])} actions, {ticks} ticks')
+    print(f'legacy walks:   {legacy * 1e6:8.1f} us/tick')
+    print(f'snapshot:       {indexed * 1e6:8.1f} us/tick  (index build {parse * 1e6:.1f} us)')
+    print(f'speedup:        {legacy / indexed:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Champion autocomplete: the original difflib + substring scan vs the
+registry's prefix and trigram indexes, replaying per-keystroke queries
+(every prefix of a set of names, plus common typos).
+
+Usage: python benchmarks/bench_suggestions.py [rounds]
+"""
+
+import os
+import sys
+import time
+from difflib import get_close_matches
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FakeLCU import CHAMPIONS, champion_alias
+from InstalockAutoban import ChampionRegistry
+
+TYPED = ['ahri', 'yasuo', 'miss fortune', "kai'sa", 'blitzcrank', 'heimerdinger', 'twisted fate', 'lee sin']
+TYPOS = ['yasou', 'zedd', 'leblank', 'blitscrank', 'heimerdonger', 'ezrael', 'aatrx', 'kassadinn', 'missfortun']
+
+
+# The pre-index implementation, kept here as the reference point
+def legacy_suggestions(names, partial, limit=5):
+    partial = partial.lower().strip()
+    matches = get_close_matches(partial, names, n=limit, cutoff=0.6)
+    partial_matches = [n for n in names if partial in n and n not in matches]
+    return [name.title() for name in (matches + partial_matches)[:limit]]
+
+
+def measure(fn, queries, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - start) / (rounds * len(queries))
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    data = [{'id': cid, 'name': name, 'alias': champion_alias(cid, name)} for cid, name in CHAMPIONS]
+
+    start = time.perf_counter()
+    registry = ChampionRegistry(None)
+    registry._parse_data(data)
+    build = time.perf_counter() - start
+    names = [name.lower() for _, name in CHAMPIONS]
+
+    keystrokes = [name[:i] for name in TYPED for i in range(1, len(name) + 1)]
+    queries = keystrokes + TYPOS
+
+    legacy = measure(lambda q: legacy_suggestions(names, q), queries, rounds)
+    indexed = measure(registry.get_suggestions, queries, rounds)
+
+    print(f'{len(CHAMPIONS)} champions, {len(queries)} queries x {rounds} rounds, index build {build * 1e3:.2f} ms')
+    print(f'difflib scan:   {legacy * 1e6:8.1f} us/query')
+    print(f'indexed:        {indexed * 1e6:8.1f} us/query')
+    print(f'speedup:        {legacy / indexed:8.1f}x')
+    print()
+    for typo in TYPOS:
+        print(f'{typo:<14} difflib {legacy_suggestions(names, typo, 3)!s:<40} indexed {registry.get_suggestions(typo, 3)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Per-request latency of one-shot requests calls vs Rengar's pooled session.
+
+Usage: python benchmarks/bench_transport.py [iterations]
+"""
+
+import statistics
+import sys
+import time
+
+import requests
+
+from stub_server import StubServer
+from Rengar import Rengar, return_lcu_headers
+
+
+def measure(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    with StubServer() as server:
+        url = f'https://127.0.0.1:{server.port}/lol-gameflow/v1/gameflow-phase'
+        headers = return_lcu_headers('token')
+
+        rengar = Rengar()
+        rengar.set_league_credentials(server.port, 'token')
+
+        one_shot = measure(lambda: requests.get(url, headers=headers, verify=False), iterations)
+        pooled = measure(lambda: rengar.lcu_request('GET', '/lol-gameflow/v1/gameflow-phase', ''), iterations)
+        rengar.close()
+
+    print(f'{"transport":<12}{"p50 ms":>10}{"p95 ms":>10}')
+    print(f'{"one-shot":<12}{one_shot[0]:>10.3f}{one_shot[1]:>10.3f}')
+    print(f'{"pooled":<12}{pooled[0]:>10.3f}{pooled[1]:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
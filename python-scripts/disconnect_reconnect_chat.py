@@ -1,16 +1,30 @@
-from Rengar import Rengar
-
-rengar = Rengar()
+from Rengar import get_client
 
 
 class Chat:
-    def __init__(self):
-        self.chat_state = self.return_disconnect()
+    def __init__(self, rengar=None):
+        self._rengar = rengar
+        self._chat_state = None
+
+    @property
+    def rengar(self):
+        return self._rengar or get_client()
+
+    @property
+    def chat_state(self):
+        """Whether chat is disconnected; queried from the client on first use."""
+        if self._chat_state is None:
+            self._chat_state = self.return_disconnect()
+        return self._chat_state
+
+    @chat_state.setter
+    def chat_state(self, value):
+        self._chat_state = value
 
     def return_disconnect(self):
         """Check if chat is currently disconnected"""
         try:
-            req = rengar.lcu_request("GET", "/chat/v1/session", "")
+            req = self.rengar.lcu_request("GET", "/chat/v1/session", "")
             if req.status_code == 200:
                 req_data = req.json()
                 return req_data.get("state") == "disconnected"
@@ -22,7 +36,7 @@ class Chat:
         """Disconnect from chat"""
         try:
             body = {"config": "disable"}
-            response = rengar.lcu_request("POST", "/chat/v1/suspend", body)
+            response = self.rengar.lcu_request("POST", "/chat/v1/suspend", body)
             return response.status_code in [200, 204]
         except Exception as e:
             print(f"Error disconnecting chat: {e}")
@@ -31,7 +45,7 @@ class Chat:
     def reconnect(self):
         """Reconnect to chat"""
         try:
-            response = rengar.lcu_request("POST", "/chat/v1/resume", "")
+            response = self.rengar.lcu_request("POST", "/chat/v1/resume", "")
             return response.status_code in [200, 204]
         except Exception as e:
             print(f"Error reconnecting chat: {e}")